@@ -28,6 +28,24 @@ import io
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Value parsing patterns, compiled once instead of going through re's pattern cache per call
+VALUE_CLEAN_RE = re.compile(r'[£$€,\s]')
+# First number plus an optional magnitude word directly after it, read from lower-cased text
+VALUE_NUMBER_RE = re.compile(r'(\d+\.?\d*)(bn|billion|million|mil|m|thousand|k)?')
+# Magnitude on a later number, for ranges like "£10-20m"; read before whitespace is stripped so
+# the word boundary separates "20k per annum" from "6 months"
+VALUE_MAGNITUDE_RE = re.compile(r'\d\s*(bn|billion|million|mil|m|thousand|k)\b')
+VALUE_MULTIPLIERS = {
+    'bn': 1e9, 'billion': 1e9,
+    'm': 1e6, 'mil': 1e6, 'million': 1e6,
+    'k': 1e3, 'thousand': 1e3
+}
+
+# Leading "Deadline:"-style labels, stripped in one anchored match
+DEADLINE_PREFIX_RE = re.compile(r'^(?:(?:Deadline|Closing|Due|By):\s*)+')
+# Deadline formats seen on UK portals, tried with strptime before dateutil's slower guessing
+DEADLINE_FORMATS = ('%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y', '%Y/%m/%d', '%d %B %Y', '%d %b %Y')
+
 class SourceType(Enum):
     UK_OFFICIAL = "uk_official"
     UK_FRAMEWORKS = "uk_frameworks"
@@ -631,15 +649,17 @@ class EnhancedUKSourcesCollector:
             return None
         
         try:
-            # Common UK date formats
-            deadline_text = deadline_text.strip()
+            # Common UK date formats; remove common prefixes
+            deadline_text = DEADLINE_PREFIX_RE.sub('', deadline_text.strip())
             
-            # Remove common prefixes
-            for prefix in ["Deadline:", "Closing:", "Due:", "By:"]:
-                if deadline_text.startswith(prefix):
-                    deadline_text = deadline_text[len(prefix):].strip()
+            for fmt in DEADLINE_FORMATS:
+                try:
+                    return datetime.strptime(deadline_text, fmt)
+                except ValueError:
+                    continue
             
-            return date_parser.parse(deadline_text)
+            # UK portals write day-first, so ambiguous fallbacks like "01/02/25" read the same way
+            return date_parser.parse(deadline_text, dayfirst=True)
         except:
             return None
     
@@ -649,19 +669,21 @@ class EnhancedUKSourcesCollector:
             return None
         
         try:
-            # Remove currency symbols and common text
-            value_text = re.sub(r'[£$€,\s]', '', value_text)
+            # Remove currency symbols and common text; lower-case once for the magnitude match
+            lowered = value_text.lower()
+            value_text = VALUE_CLEAN_RE.sub('', lowered)
             
-            # Extract numbers
-            numbers = re.findall(r'\d+\.?\d*', value_text)
-            if numbers:
-                value = float(numbers[0])
-                
-                # Handle millions/thousands indicators
-                if 'm' in value_text.lower() or 'million' in value_text.lower():
-                    value *= 1000000
-                elif 'k' in value_text.lower() or 'thousand' in value_text.lower():
-                    value *= 1000
+            # Extract the first number with its magnitude indicator, if any
+            number = VALUE_NUMBER_RE.search(value_text)
+            if number:
+                value = float(number[1])
+                magnitude = number[2]
+                if not magnitude:
+                    # Ranges put the magnitude on the upper bound only
+                    later = VALUE_MAGNITUDE_RE.search(lowered)
+                    magnitude = later[1] if later else None
+                if magnitude:
+                    value *= VALUE_MULTIPLIERS[magnitude]
                 
                 return value
         except:
@@ -181,6 +181,60 @@ def get_current_user(user_id: str = Depends(verify_token)):
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
+# Opportunity ingestion is batched: one lookup and one insert_many per chunk instead of two round trips per record
+INSERT_BATCH_SIZE = 500
+
+def stamp_new_opportunity(opp: dict, parse_iso_closing_date: bool = False):
+    """Add ingestion metadata and make sure closing_date is a datetime"""
+    opp["created_at"] = datetime.utcnow()
+    opp["updated_at"] = datetime.utcnow()
+    opp["status"] = OpportunityStatus.ACTIVE
+    
+    if parse_iso_closing_date and isinstance(opp.get("closing_date"), str):
+        try:
+            opp["closing_date"] = datetime.fromisoformat(opp["closing_date"])
+        except:
+            opp["closing_date"] = datetime.utcnow() + timedelta(days=30)
+    elif not isinstance(opp.get("closing_date"), datetime):
+        opp["closing_date"] = datetime.utcnow() + timedelta(days=30)
+
+def insert_new_opportunities(opportunities: list, key_fields=("title", "funding_body"), prepare=None):
+    """
+    Insert opportunities that are not already stored, matching on key_fields.
+    Returns (stored_count, existing_count).
+    """
+    stored_count = 0
+    existing_count = 0
+    seen_keys = set()
+    projection = {field: 1 for field in key_fields}
+    projection["_id"] = 0
+    
+    for start in range(0, len(opportunities), INSERT_BATCH_SIZE):
+        chunk = opportunities[start:start + INSERT_BATCH_SIZE]
+        
+        titles = list({opp["title"] for opp in chunk})
+        for doc in opportunities_collection.find({"title": {"$in": titles}}, projection):
+            seen_keys.add(tuple(doc.get(field) for field in key_fields))
+        
+        new_opportunities = []
+        for opp in chunk:
+            key = tuple(opp.get(field) for field in key_fields)
+            if key in seen_keys:
+                existing_count += 1
+                continue
+            
+            # Later records in the same run are checked against this one too
+            seen_keys.add(key)
+            if prepare:
+                prepare(opp)
+            new_opportunities.append(opp)
+        
+        if new_opportunities:
+            opportunities_collection.insert_many(new_opportunities)
+            stored_count += len(new_opportunities)
+    
+    return stored_count, existing_count
+
 # Initialize data integration service
 if DATA_SERVICE_AVAILABLE:
     data_service = DataIntegrationService()
@@ -304,36 +358,11 @@ async def comprehensive_data_refresh(
                 "timestamp": datetime.utcnow().isoformat()
             }
         
-        # Store new opportunities in database (append, don't replace)
-        stored_count = 0
-        existing_count = 0
-        
-        for opp in new_opportunities:
-            # Check if opportunity already exists (by title + funding body)
-            existing = opportunities_collection.find_one({
-                "title": opp["title"],
-                "funding_body": opp["funding_body"]
-            })
-            
-            if not existing:
-                # Add required metadata
-                opp["created_at"] = datetime.utcnow()
-                opp["updated_at"] = datetime.utcnow()
-                opp["status"] = OpportunityStatus.ACTIVE
-                
-                # Ensure proper datetime objects
-                if isinstance(opp.get("closing_date"), str):
-                    try:
-                        opp["closing_date"] = datetime.fromisoformat(opp["closing_date"])
-                    except:
-                        opp["closing_date"] = datetime.utcnow() + timedelta(days=30)
-                elif not isinstance(opp.get("closing_date"), datetime):
-                    opp["closing_date"] = datetime.utcnow() + timedelta(days=30)
-                
-                opportunities_collection.insert_one(opp)
-                stored_count += 1
-            else:
-                existing_count += 1
+        # Store new opportunities in database (append, don't replace), skipping known title + funding body
+        stored_count, existing_count = insert_new_opportunities(
+            new_opportunities,
+            prepare=lambda opp: stamp_new_opportunity(opp, parse_iso_closing_date=True)
+        )
         
         # Get updated totals
         total_after_refresh = opportunities_collection.count_documents({"status": OpportunityStatus.ACTIVE})
@@ -477,30 +506,9 @@ async def true_100_coverage_refresh(
             }
         
         # Store critical opportunities
-        stored_count = 0
-        existing_count = 0
-        
-        for opp in critical_opportunities:
-            # Check if opportunity already exists
-            existing = opportunities_collection.find_one({
-                "title": opp["title"],
-                "funding_body": opp["funding_body"]
-            })
-            
-            if not existing:
-                # Add metadata
-                opp["created_at"] = datetime.utcnow()
-                opp["updated_at"] = datetime.utcnow()
-                opp["status"] = OpportunityStatus.ACTIVE
-                
-                # Ensure datetime objects
-                if not isinstance(opp.get("closing_date"), datetime):
-                    opp["closing_date"] = datetime.utcnow() + timedelta(days=30)
-                
-                opportunities_collection.insert_one(opp)
-                stored_count += 1
-            else:
-                existing_count += 1
+        stored_count, existing_count = insert_new_opportunities(
+            critical_opportunities, prepare=stamp_new_opportunity
+        )
         
         # Get totals
         total_after_true_coverage = opportunities_collection.count_documents({"status": OpportunityStatus.ACTIVE})
@@ -635,19 +643,10 @@ async def fetch_and_store_live_data():
         print("Starting live data refresh...")
         live_opportunities = await data_service.aggregate_all_real_opportunities()
         
-        # Store in database with source tracking
-        stored_count = 0
-        for opp in live_opportunities:
-            # Check if opportunity already exists (by title to avoid duplicates)
-            existing = opportunities_collection.find_one({"title": opp["title"]})
-            if not existing:
-                opportunities_collection.insert_one(opp)
-                stored_count += 1
-                print(f"✅ Added new opportunity: {opp['title'][:60]}...")
-            else:
-                print(f"🔄 Skipped duplicate: {opp['title'][:60]}...")
+        # Store in database with source tracking (by title to avoid duplicates)
+        stored_count, existing_count = insert_new_opportunities(live_opportunities, key_fields=("title",))
         
-        print(f"Live data refresh completed. Stored {stored_count} new opportunities (out of {len(live_opportunities)} collected)")
+        print(f"Live data refresh completed. Stored {stored_count} new opportunities, skipped {existing_count} duplicates (out of {len(live_opportunities)} collected)")
         
     except Exception as e:
         print(f"Error in live data refresh: {e}")
@@ -669,26 +668,7 @@ async def periodic_data_refresh():
             new_opportunities = await run_comprehensive_aggregation()
             
             if new_opportunities:
-                stored_count = 0
-                for opp in new_opportunities:
-                    # Check if opportunity already exists
-                    existing = opportunities_collection.find_one({
-                        "title": opp["title"],
-                        "funding_body": opp["funding_body"]
-                    })
-                    
-                    if not existing:
-                        # Add metadata
-                        opp["created_at"] = datetime.utcnow()
-                        opp["updated_at"] = datetime.utcnow()
-                        opp["status"] = OpportunityStatus.ACTIVE
-                        
-                        # Ensure proper datetime objects
-                        if not isinstance(opp.get("closing_date"), datetime):
-                            opp["closing_date"] = datetime.utcnow() + timedelta(days=30)
-                        
-                        opportunities_collection.insert_one(opp)
-                        stored_count += 1
+                stored_count, _ = insert_new_opportunities(new_opportunities, prepare=stamp_new_opportunity)
                 
                 total_opportunities = opportunities_collection.count_documents({"status": OpportunityStatus.ACTIVE})
                 print(f"✅ Scheduled refresh complete: {stored_count} new opportunities, {total_opportunities} total")
@@ -5,57 +5,456 @@ Complete implementation for ALL defence opportunity sources using APIs, web scra
 
 import asyncio
 import aiohttp
+import multiprocessing
+import httpx
 import re
+import sys
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception_type
 import json
+import logging
 import time
+import xxhash
+from yarl import URL
 
-class UltimateDefenceCollector:
-    def __init__(self):
-        self.session_headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
+try:
+    # ISA-L gunzip is several times faster than stdlib zlib; aiohttp only uses it when told to
+    from isal import isal_zlib
+    if hasattr(aiohttp, 'set_zlib_backend'):
+        aiohttp.set_zlib_backend(isal_zlib)
+except ImportError:
+    pass
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    # Hyperscan only ships for x86-64; fall back to Aho-Corasick or a compiled regex alternation
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Technology area -> keywords (matched as substrings of the lowercased text)
+TECH_AREA_MAP = {
+    'artificial intelligence': ['ai', 'artificial intelligence', 'machine learning'],
+    'cybersecurity': ['cyber', 'cybersecurity', 'cyber security'],
+    'quantum technologies': ['quantum'],
+    'robotics & autonomous systems': ['robotics', 'autonomous', 'unmanned'],
+    'aerospace': ['aerospace', 'aviation', 'aircraft'],
+    'maritime defence': ['maritime', 'naval', 'submarine'],
+    'sensors & signal processing': ['sensors', 'radar', 'surveillance'],
+    'communications': ['communications', 'radio', 'satellite'],
+    'advanced materials': ['materials', 'armour', 'protection'],
+    'space technologies': ['space', 'satellite', 'orbital']
+}
+
+# One bit per tech area, in TECH_AREA_MAP order
+TECH_AREA_BITS = [(1 << i, tech_area) for i, tech_area in enumerate(TECH_AREA_MAP)]
+
+DESCRIPTION_CLASS_RE = re.compile(r'description|summary')
+VALUE_TEXT_RE = re.compile(r'value|£', re.I)
+
+# Actual contract values, not funding ranges; each distinct pattern found adds to the contract score
+CONTRACT_VALUE_PATTERNS = (
+    re.compile(r'contract value[:\s]*£[\d,]+'),
+    re.compile(r'estimated value[:\s]*£[\d,]+'),
+    re.compile(r'total value[:\s]*£[\d,]+'),
+    re.compile(r'£[\d,]+(?:\.\d{2})?\s*(?:per|total|contract)'),
+)
+
+PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+# Lowercases ASCII letters and deletes what PUNCTUATION_RE would strip, in one str.translate pass
+ASCII_TITLE_TABLE = {
+    **{code: None for code in range(128) if PUNCTUATION_RE.match(chr(code))},
+    **{ord(char): ord(char.lower()) for char in map(chr, range(ord('A'), ord('Z') + 1))},
+}
+
+# Shapes of the common DATE_FORMATS with (year, month, day) group numbers; avoids exception-driven strptime misses
+DATE_SHAPES = (
+    (re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})'), (1, 2, 3)),
+    (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})'), (3, 2, 1)),
+    (re.compile(r'(\d{1,2})-(\d{1,2})-(\d{4})'), (3, 2, 1)),
+)
+
+DATE_FORMATS = ['%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%dT%H:%M:%S']
+
+logger = logging.getLogger(__name__)
+
+# Parsed once; relative links are resolved against these with URL.join
+CF_BASE = URL('https://www.contractsfinder.service.gov.uk')
+GOVUK_BASE = URL('https://www.gov.uk')
+FTS_BASE = URL('https://www.find-tender.service.gov.uk')
+CCS_BASE = URL('https://www.crowncommercial.gov.uk')
+
+SESSION_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'br, gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# CONTRACT-SPECIFIC keywords (high priority)
+CONTRACT_KEYWORDS = frozenset({
+    'tender', 'contract', 'invitation to tender', 'itt', 'request for proposal', 'rfp',
+    'quotation', 'framework agreement', 'award notice', 'procurement',
+    'call for competition', 'supply', 'provision of', 'delivery of',
+    'maintenance contract', 'service contract', 'supply contract',
+    'works contract', 'goods contract', 'equipment supply'
+})
+
+# INNOVATION/NON-CONTRACT keywords (exclude/deprioritize)
+INNOVATION_KEYWORDS = frozenset({
+    'expression of interest', 'eoi', 'call for innovation', 'get in touch',
+    'pitch', 'accelerator', 'competition', 'challenge', 'grant',
+    'innovation call', 'themed competition', 'defence innovation',
+    'showcase', 'demonstration', 'pilot study', 'feasibility study',
+    'research call', 'innovation funding', 'startup', 'sme innovation'
+})
+
+# Defence filtering keywords (must still be defence-related)
+DEFENCE_KEYWORDS = frozenset({
+    'defence', 'defense', 'military', 'mod', 'ministry of defence',
+    'army', 'navy', 'air force', 'raf', 'royal navy', 'dstl',
+    'weapons', 'ammunition', 'security clearance', 'classified',
+    'surveillance', 'intelligence', 'cybersecurity', 'radar'
+})
+
+# Exclusion keywords (immediate rejection)
+EXCLUSION_KEYWORDS = frozenset({
+    'utilities', 'water', 'gas', 'electricity', 'transport',
+    'healthcare', 'education', 'social services', 'housing',
+    'facilities management', 'cleaning', 'catering'
+})
+
+# Additional contract indicators
+CONTRACT_INDICATORS = frozenset({
+    'contract value', 'tender value', 'estimated value',
+    'supply of', 'provision of', 'delivery of', 'maintenance of',
+    'cpv code', 'contract notice', 'award notice',
+    'closing date', 'submission deadline', 'tender deadline',
+    'framework', 'dynamic purchasing system', 'lots'
+})
+
+# Transient network failures worth another attempt; 4xx responses are returned, not retried
+RETRYABLE_ERRORS = (aiohttp.ClientError, httpx.TransportError, httpx.HTTPStatusError, asyncio.TimeoutError)
+GOTO_TIMEOUT_MS = 30000
+GOTO_RETRY_TIMEOUT_MS = 60000
+
+# Browser pages are reused across navigations and replaced periodically to cap renderer memory growth
+PRIME_PAGE_POOL_SIZE = 4
+PAGE_MAX_NAVIGATIONS = 20
+
+
+def _stable_id(prefix: str, *parts: str) -> str:
+    """Deterministic opportunity id; builtin hash() is salted per process so ids drifted between runs"""
+    h = xxhash.xxh3_64()
+    for part in parts:
+        h.update(part.encode('utf-8'))
+    return f"{prefix}_{h.intdigest():016x}"
+
+def _absolute_link(base: URL, link: str) -> str:
+    """Resolve an href against the page it came from, as a browser would"""
+    return str(base.join(URL(link)))
+
+@lru_cache(maxsize=8192)
+def _title_words(title: str) -> frozenset:
+    """Normalized word set of a title, computed once per distinct title (the same notice recurs across searches)"""
+    if title.isascii():
+        words = title.translate(ASCII_TITLE_TABLE).split()
+    else:
+        words = PUNCTUATION_RE.sub('', title.lower()).split()
+    # Interned so equal words across titles are the same object and set lookups hit the identity fast path
+    return frozenset(map(sys.intern, words))
+
+@lru_cache(maxsize=4096)
+def _match_tech_areas(text: str) -> Tuple[str, ...]:
+    """Tech areas mentioned in text (cached: notices repeat boilerplate titles across pages)"""
+    found = TECH_AREA_SCANNER.scan(text.lower())
+    return tuple(tech_area for bit, tech_area in TECH_AREA_BITS if found & bit)
+
+
+# Outcomes of _classify_opportunity
+VERDICT_EXCLUDED = 'excluded'
+VERDICT_INNOVATION = 'innovation'
+VERDICT_NOT_DEFENCE = 'not_defence'
+VERDICT_CONTRACT = 'contract'
+VERDICT_NON_CONTRACT = 'non_contract'
+
+@lru_cache(maxsize=8192)
+def _classify_opportunity(title: str, description: str, source: str) -> Tuple[str, int]:
+    """Classify a notice as (verdict, contract score); cached since the same notice recurs across searches"""
+    text = f"{title} {description} {source}".lower()
+    found = KEYWORD_SCANNER.scan(text, stop_mask=EXCLUSION)
+    
+    # IMMEDIATE REJECTION for exclusions
+    if found & EXCLUSION:
+        return VERDICT_EXCLUDED, 0
+    
+    # IMMEDIATE REJECTION for innovation/non-contract keywords
+    if found & INNOVATION:
+        return VERDICT_INNOVATION, 0
+    
+    # Must be defence-related
+    if not found & DEFENCE:
+        return VERDICT_NOT_DEFENCE, 0
+    
+    # Score-based approach for contract likelihood: keyword classes via table lookup on the hit bits,
+    # plus 3 per value pattern (actual contract values, not funding ranges).
+    # The value regexes only run when keywords alone have not already decided acceptance.
+    contract_score = CLASS_SCORES[found & SCORED_CLASSES]
+    if contract_score < 10:
+        contract_score += 3 * sum(1 for pattern in CONTRACT_VALUE_PATTERNS if pattern.search(text))
+    
+    # Require minimum score for acceptance
+    if contract_score >= 10:
+        return VERDICT_CONTRACT, contract_score
+    return VERDICT_NON_CONTRACT, contract_score
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_string: str) -> Optional[datetime]:
+    """Parse the first 10 characters of a date string, dispatching on its shape before trying formats"""
+    head = date_string[:10]
+    
+    for shape, (year_group, month_group, day_group) in DATE_SHAPES:
+        match = shape.fullmatch(head)
+        if match:
+            try:
+                return datetime(int(match.group(year_group)), int(match.group(month_group)), int(match.group(day_group)))
+            except ValueError:
+                break
+    
+    # Unusual shapes (padding, stray whitespace) go through strptime as before
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_string[:10], fmt[:10])
+        except ValueError:
+            continue
+    return None
+
+# Keyword classes reported by KeywordScanner as bit flags
+EXCLUSION = 1
+INNOVATION = 2
+DEFENCE = 4
+CONTRACT = 8
+CONTRACT_INDICATOR = 16
+
+# Contract score contributed by each combination of the scored class bits
+SCORED_CLASSES = CONTRACT | CONTRACT_INDICATOR
+CLASS_SCORES = {
+    0: 0,
+    CONTRACT: 10,
+    CONTRACT_INDICATOR: 5,
+    CONTRACT | CONTRACT_INDICATOR: 15,
+}
+
+class KeywordScanner:
+    """
+    Finds which keyword classes occur (as substrings) in a lowercased text with one pass over it,
+    using Hyperscan or pyahocorasick when installed and a regex alternation otherwise.
+    Each keyword carries the union of the classes of every keyword that is a prefix of it,
+    so reporting only the longest keyword starting at each position loses no class.
+    """
+
+    def __init__(self, keyword_classes: Dict[int, frozenset]):
+        masks = {}
+        for class_bit, keywords in keyword_classes.items():
+            for keyword in keywords:
+                masks[keyword] = masks.get(keyword, 0) | class_bit
         
-        # CONTRACT-SPECIFIC keywords (high priority)
-        self.contract_keywords = [
-            'tender', 'contract', 'invitation to tender', 'itt', 'request for proposal', 'rfp',
-            'quotation', 'framework agreement', 'award notice', 'procurement',
-            'call for competition', 'supply', 'provision of', 'delivery of',
-            'maintenance contract', 'service contract', 'supply contract',
-            'works contract', 'goods contract', 'equipment supply'
-        ]
+        self.keywords = sorted(masks, key=len, reverse=True)
+        self.masks = {keyword: self._prefix_union(keyword, masks) for keyword in self.keywords}
         
-        # INNOVATION/NON-CONTRACT keywords (exclude/deprioritize)
-        self.innovation_keywords = [
-            'expression of interest', 'eoi', 'call for innovation', 'get in touch',
-            'pitch', 'accelerator', 'competition', 'challenge', 'grant',
-            'innovation call', 'themed competition', 'defence innovation',
-            'showcase', 'demonstration', 'pilot study', 'feasibility study',
-            'research call', 'innovation funding', 'startup', 'sme innovation'
-        ]
+        if HYPERSCAN_AVAILABLE:
+            self._db = hyperscan.Database()
+            self._db.compile(
+                expressions=[re.escape(keyword).encode() for keyword in self.keywords],
+                ids=list(range(len(self.keywords))),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(self.keywords)
+            )
+            self._id_masks = [self.masks[keyword] for keyword in self.keywords]
+            self._automaton = None
+            self._regex = None
+        elif AHOCORASICK_AVAILABLE:
+            self._db = None
+            # The automaton reports every overlapping match, so plain per-keyword masks suffice
+            self._automaton = ahocorasick.Automaton()
+            for keyword, mask in masks.items():
+                self._automaton.add_word(keyword, mask)
+            self._automaton.make_automaton()
+            self._regex = None
+        else:
+            self._db = None
+            self._automaton = None
+            # Zero-width lookahead so matches may overlap; longest-first alternation picks the
+            # longest keyword at each start position
+            self._regex = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in self.keywords) + '))', re.I)
+
+    @staticmethod
+    def _prefix_union(keyword: str, masks: Dict[str, int]) -> int:
+        mask = 0
+        for other, other_mask in masks.items():
+            if keyword.startswith(other):
+                mask |= other_mask
+        return mask
+
+    def scan(self, text: str, stop_mask: int = 0) -> int:
+        """Bitmask of keyword classes present in text; stops early once any class in stop_mask is seen"""
+        found = 0
         
-        # Defence filtering keywords (must still be defence-related)
-        self.defence_keywords = [
-            'defence', 'defense', 'military', 'mod', 'ministry of defence',
-            'army', 'navy', 'air force', 'raf', 'royal navy', 'dstl',
-            'weapons', 'ammunition', 'security clearance', 'classified',
-            'surveillance', 'intelligence', 'cybersecurity', 'radar'
-        ]
+        if self._automaton is not None:
+            for _, mask in self._automaton.iter(text):
+                found |= mask
+                if found & stop_mask:
+                    break
+            return found
         
-        # Exclusion keywords (immediate rejection)
-        self.exclusion_keywords = [
-            'utilities', 'water', 'gas', 'electricity', 'transport',
-            'healthcare', 'education', 'social services', 'housing',
-            'facilities management', 'cleaning', 'catering'
-        ]
+        if self._db is not None:
+            def on_match(keyword_id, start, end, flags, context):
+                nonlocal found
+                found |= self._id_masks[keyword_id]
+            self._db.scan(text.encode(), match_event_handler=on_match)
+            return found
+        
+        masks = self.masks
+        for match in self._regex.finditer(text):
+            found |= masks[match.group(1).lower()]
+            if found & stop_mask:
+                break
+        return found
+
+KEYWORD_SCANNER = KeywordScanner({
+    EXCLUSION: EXCLUSION_KEYWORDS,
+    INNOVATION: INNOVATION_KEYWORDS,
+    DEFENCE: DEFENCE_KEYWORDS,
+    CONTRACT: CONTRACT_KEYWORDS,
+    CONTRACT_INDICATOR: CONTRACT_INDICATORS,
+})
+
+# All tech-area keywords in one scan; overlapping keywords ('ai' in 'aircraft') still count
+TECH_AREA_SCANNER = KeywordScanner({
+    bit: frozenset(TECH_AREA_MAP[tech_area]) for bit, tech_area in TECH_AREA_BITS
+})
+
+class PagePool:
+    """Fixed set of reusable Playwright pages handed out through a queue"""
+
+    def __init__(self, context, size: int, max_navigations: int = PAGE_MAX_NAVIGATIONS):
+        self.context = context
+        self.size = size
+        self.max_navigations = max_navigations
+        self._pages: asyncio.Queue = asyncio.Queue()
+        self._uses = {}
+
+    async def start(self):
+        for _ in range(self.size):
+            await self._pages.put(await self.context.new_page())
+
+    @asynccontextmanager
+    async def page(self):
+        page = await self._pages.get()
+        try:
+            yield page
+        finally:
+            uses = self._uses.pop(page, 0) + 1
+            try:
+                if uses >= self.max_navigations:
+                    # A page that fails to close is still replaced; if no replacement opens, the
+                    # old page keeps its count so the next release retries the swap
+                    with suppress(Exception):
+                        await page.close()
+                    page = await self.context.new_page()
+                    uses = 0
+            finally:
+                # The slot always goes back, otherwise waiters on an emptied pool block forever
+                self._uses[page] = uses
+                await self._pages.put(page)
+
+    async def close(self):
+        while not self._pages.empty():
+            await self._pages.get_nowait().close()
+
+class TitleDeduplicator:
+    """Incremental near-duplicate filter: a title is a duplicate when it shares
+    more than 80% of its words with a title already kept.
+
+    Uses prefix filtering: a pair can only clear the threshold if the first
+    len - min_overlap + 1 words of each title (in a fixed global order) intersect,
+    so only those prefix words are indexed and probed. The result is exact."""
+
+    def __init__(self):
+        self.seen_word_sets = []
+        self.seen_fingerprints = []
+        # prefix word -> ids of kept titles having it in their prefix
+        self.prefix_index = defaultdict(list)
+
+    @staticmethod
+    def _prefix(title_words: frozenset) -> List[str]:
+        # Smallest overlap exceeding 80% of this title's length is len * 4 // 5 + 1
+        return sorted(title_words)[:len(title_words) - len(title_words) * 4 // 5]
+
+    @staticmethod
+    def _fingerprint(title_words: frozenset) -> int:
+        # One of 64 bits per word; a bit set here but not in another title's fingerprint
+        # proves at least one word the other title lacks
+        fingerprint = 0
+        for word in title_words:
+            fingerprint |= 1 << (hash(word) & 63)
+        return fingerprint
+
+    def add(self, title: str) -> bool:
+        """Record title and return True if it is not a near-duplicate of a kept title"""
+        title_words = _title_words(title)
+        title_length = len(title_words)
+        fingerprint = self._fingerprint(title_words)
+        prefix = self._prefix(title_words)
+        
+        checked = set()
+        for word in prefix:
+            for seen_id in self.prefix_index.get(word, ()):
+                if seen_id in checked:
+                    continue
+                checked.add(seen_id)
+                
+                seen_words = self.seen_word_sets[seen_id]
+                threshold = 0.8 * max(title_length, len(seen_words))
+                
+                # Upper bound on the overlap from the fingerprints alone; skip pairs that cannot qualify
+                if title_length - (fingerprint & ~self.seen_fingerprints[seen_id]).bit_count() <= threshold:
+                    continue
+                
+                # Check for high similarity (>80% word overlap)
+                if len(title_words & seen_words) > threshold:
+                    return False
+        
+        seen_id = len(self.seen_word_sets)
+        self.seen_word_sets.append(title_words)
+        self.seen_fingerprints.append(fingerprint)
+        for word in prefix:
+            self.prefix_index[word].append(seen_id)
+        return True
+
+class UltimateDefenceCollector:
+    def __init__(self):
+        # Shared module constants; nothing here varies per instance
+        self.session_headers = SESSION_HEADERS
+        self.contract_keywords = CONTRACT_KEYWORDS
+        self.innovation_keywords = INNOVATION_KEYWORDS
+        self.defence_keywords = DEFENCE_KEYWORDS
+        self.exclusion_keywords = EXCLUSION_KEYWORDS
 
     async def collect_all_defence_opportunities(self) -> List[Dict]:
         """
@@ -66,15 +465,32 @@ class UltimateDefenceCollector:
         
         all_opportunities = []
         
-        # Phase 1: API and Direct Access (Fast)
-        print("\n📡 PHASE 1: API & Direct Access...")
-        phase1_opportunities = await self._collect_phase1()
-        all_opportunities.extend(phase1_opportunities)
-        
-        # Phase 2: Browser Automation (Comprehensive)
-        print("\n🤖 PHASE 2: Browser Automation...")
-        phase2_opportunities = await self._collect_phase2()
-        all_opportunities.extend(phase2_opportunities)
+        # Phase 2 (Chromium + Playwright driver) runs in its own short-lived process so it
+        # neither starves this event loop nor accumulates browser memory across runs
+        loop = asyncio.get_running_loop()
+        executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+        try:
+            print("\n🤖 PHASE 2: Browser Automation (worker process)...")
+            phase2_future = loop.run_in_executor(executor, _run_phase2_sync)
+            
+            # Phase 1: API and Direct Access (Fast)
+            print("\n📡 PHASE 1: API & Direct Access...")
+            phase1_opportunities = await self._collect_phase1()
+            all_opportunities.extend(phase1_opportunities)
+            
+            # A dead worker (browser OOM or crash) or a failed pickle surfaces here rather than in
+            # _collect_phase2; it costs phase 2 only, as an in-process browser error would
+            try:
+                phase2_opportunities = await phase2_future
+            except Exception as e:
+                print(f"❌ Browser automation error: {e}")
+                phase2_opportunities = []
+            
+            # Added after phase 1 so first-seen dedup order is unchanged
+            all_opportunities.extend(phase2_opportunities)
+        finally:
+            # Joining the worker blocks, so it happens off the loop
+            await asyncio.to_thread(executor.shutdown, True, cancel_futures=True)
         
         # Remove duplicates
         unique_opportunities = self._remove_duplicates(all_opportunities)
@@ -93,12 +509,21 @@ class UltimateDefenceCollector:
         timeout = aiohttp.ClientTimeout(total=30)
         
         async with aiohttp.ClientSession(
-            connector=connector, timeout=timeout, headers=self.session_headers
-        ) as session:
+            connector=connector, timeout=timeout, headers=SESSION_HEADERS
+        ) as session, httpx.AsyncClient(
+            # Every Contracts Finder request hits one host, so multiplex them over one H2 connection.
+            # Connection-specific headers are illegal in HTTP/2.
+            http2=True,
+            headers={k: v for k, v in SESSION_HEADERS.items() if k != 'Connection'},
+            timeout=30,
+            limits=httpx.Limits(max_connections=20),
+            # aiohttp followed redirects by default; _fetch_httpx only keeps 200s
+            follow_redirects=True
+        ) as cf_client:
             
             # 1. Contracts Finder API
             print("🔗 Collecting from Contracts Finder API...")
-            cf_opportunities = await self._collect_contracts_finder_api(session)
+            cf_opportunities = await self._collect_contracts_finder_api(cf_client)
             opportunities.extend(cf_opportunities)
             
             # 2. DASA Direct Scraping
@@ -148,10 +573,40 @@ class UltimateDefenceCollector:
 
     # =================== PHASE 1 IMPLEMENTATIONS ===================
 
-    async def _collect_contracts_finder_api(self, session: aiohttp.ClientSession) -> List[Dict]:
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=0.2, max=2),
+        retry=retry_if_exception_type(RETRYABLE_ERRORS),
+        reraise=True
+    )
+    async def _fetch(self, session: aiohttp.ClientSession, url: str, **kwargs) -> Tuple[int, bytes]:
+        """GET url and return (status, body); 5xx and connection errors are retried with backoff"""
+        async with session.get(url, **kwargs) as response:
+            if response.status >= 500:
+                response.raise_for_status()
+            return response.status, await response.read()
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=0.2, max=2),
+        retry=retry_if_exception_type(RETRYABLE_ERRORS),
+        reraise=True
+    )
+    async def _fetch_httpx(self, client: httpx.AsyncClient, url: str, **kwargs) -> Tuple[int, bytes]:
+        """httpx counterpart of _fetch"""
+        response = await client.get(url, **kwargs)
+        if response.status_code >= 500:
+            response.raise_for_status()
+        return response.status_code, response.content
+
+    async def _collect_contracts_finder_api(self, client: httpx.AsyncClient) -> List[Dict]:
         """Contracts Finder - WEB SCRAPING with CONTRACT focus"""
         opportunities = []
         
+        # Wall clock read once per collector; these are defaults for unknown dates
+        created_at = datetime.utcnow()
+        default_closing_date = datetime.now() + timedelta(days=30)
+        
         # Contract-specific search terms (not innovation terms)
         contract_searches = [
             'defence equipment', 'military equipment', 'mod contract',
@@ -166,60 +621,60 @@ class UltimateDefenceCollector:
                 # Use web scraping instead of API (which seems unavailable)
                 search_url = f"https://www.contractsfinder.service.gov.uk/Search?searchTerm={search_term.replace(' ', '%20')}"
                 
-                async with session.get(search_url) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        
-                        # Look for contract result elements
-                        contract_elements = soup.select('div[class*="search-result"], article[class*="contract"], div[class*="notice"]')
-                        
-                        for element in contract_elements[:10]:  # Max 10 per search
-                            try:
-                                title_elem = element.find(['h2', 'h3', 'h4']) or element.find('a')
-                                title = title_elem.get_text(strip=True) if title_elem else ''
-                                
-                                if len(title) < 10:
-                                    continue
-                                
-                                desc_elem = element.find('p') or element.find('div', class_=re.compile(r'description|summary'))
-                                description = desc_elem.get_text(strip=True) if desc_elem else title
-                                
-                                # Get contract details
-                                value_elem = element.find(string=re.compile(r'value|£', re.I))
-                                value = value_elem.strip() if value_elem else 'TBD'
-                                
-                                link_elem = element.find('a', href=True)
-                                official_link = f"https://www.contractsfinder.service.gov.uk{link_elem['href']}" if link_elem and link_elem['href'].startswith('/') else search_url
-                                
-                                # STRICT CONTRACT FILTERING
-                                if not self._is_defence_opportunity(title, description, 'Contracts Finder'):
-                                    continue
-                                
-                                opportunity = {
-                                    'id': f"cf_contract_{hash(title + search_term)}",
-                                    'title': title[:200],
-                                    'funding_body': 'UK Government (Defence Contract)',
-                                    'description': description[:500],
-                                    'detailed_description': description,
-                                    'closing_date': datetime.now() + timedelta(days=30),
-                                    'funding_amount': value,
-                                    'tech_areas': self._extract_tech_areas(title + ' ' + description),
-                                    'contract_type': 'Defence Contract',
-                                    'official_link': official_link,
-                                    'status': 'active',
-                                    'created_at': datetime.utcnow(),
-                                    'tier_required': 'free',
-                                    'source': 'contracts_finder_contracts'
-                                }
-                                
-                                opportunities.append(opportunity)
-                                
-                            except Exception as e:
-                                continue
+                status, html = await self._fetch_httpx(client, search_url)
+                if status == 200:
+                    # Raw bytes go straight to lxml, which decodes natively
+                    soup = BeautifulSoup(html, 'lxml')
                     
-                    await asyncio.sleep(1)  # Rate limiting
+                    # Look for contract result elements
+                    contract_elements = soup.select('div[class*="search-result"], article[class*="contract"], div[class*="notice"]')
                     
+                    for element in contract_elements[:10]:  # Max 10 per search
+                        try:
+                            title_elem = element.find(['h2', 'h3', 'h4']) or element.find('a')
+                            title = title_elem.get_text(strip=True) if title_elem else ''
+                            
+                            if len(title) < 10:
+                                continue
+                            
+                            desc_elem = element.find('p') or element.find('div', class_=DESCRIPTION_CLASS_RE)
+                            description = desc_elem.get_text(strip=True) if desc_elem else title
+                            
+                            # Get contract details
+                            value_elem = element.find(string=VALUE_TEXT_RE)
+                            value = value_elem.strip() if value_elem else 'TBD'
+                            
+                            link_elem = element.find('a', href=True)
+                            official_link = _absolute_link(CF_BASE, link_elem['href']) if link_elem and link_elem['href'].startswith('/') else search_url
+                            
+                            # STRICT CONTRACT FILTERING
+                            if not self._is_defence_opportunity(title, description, 'Contracts Finder'):
+                                continue
+                            
+                            opportunity = {
+                                'id': _stable_id('cf_contract', title, search_term),
+                                'title': title[:200],
+                                'funding_body': 'UK Government (Defence Contract)',
+                                'description': description[:500],
+                                'detailed_description': description,
+                                'closing_date': default_closing_date,
+                                'funding_amount': value,
+                                'tech_areas': self._extract_tech_areas(title + ' ' + description),
+                                'contract_type': 'Defence Contract',
+                                'official_link': official_link,
+                                'status': 'active',
+                                'created_at': created_at,
+                                'tier_required': 'free',
+                                'source': 'contracts_finder_contracts'
+                            }
+                            
+                            opportunities.append(opportunity)
+                            
+                        except Exception as e:
+                            continue
+                
+                await asyncio.sleep(1)  # Rate limiting
+                
             except Exception as e:
                 print(f"Error with contract search '{search_term}': {e}")
                 continue
@@ -231,6 +686,9 @@ class UltimateDefenceCollector:
         """DASA Direct Scraping - CONTRACTS ONLY (not innovation calls)"""
         opportunities = []
         
+        created_at = datetime.utcnow()
+        default_closing_date = datetime.now() + timedelta(days=45)
+        
         # Focus on DASA contract opportunities, not innovation calls
         dasa_contract_urls = [
             'https://www.gov.uk/government/organisations/defence-and-security-accelerator/about/procurement',
@@ -240,68 +698,68 @@ class UltimateDefenceCollector:
         
         for url in dasa_contract_urls:
             try:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        
-                        # Look for CONTRACT-specific elements, not innovation calls
-                        contract_elements = []
-                        
-                        # Focus on contract/tender selectors
-                        contract_selectors = [
-                            'a[href*="tender"]', 'a[href*="contract"]',
-                            'div[class*="contract"]', 'div[class*="tender"]',
-                            'a[href*="procurement"]', 'div[class*="procurement"]'
-                        ]
-                        
-                        for selector in contract_selectors:
-                            elements = soup.select(selector)
-                            contract_elements.extend(elements)
-                        
-                        for element in contract_elements[:15]:  # Reduced to focus on quality
-                            try:
-                                if element.name == 'a':
-                                    title = element.get_text(strip=True)
-                                    link = element.get('href', '')
-                                else:
-                                    title_elem = element.find('a')
-                                    title = title_elem.get_text(strip=True) if title_elem else ''
-                                    link_elem = element.find('a', href=True)
-                                    link = link_elem['href'] if link_elem else ''
-                                
-                                if len(title) < 10:
-                                    continue
-                                
-                                # Get more description context
-                                desc_elem = element.find_next('p') or element.find('p')
-                                description = desc_elem.get_text(strip=True) if desc_elem else title
-                                
-                                # STRICT CONTRACT FILTERING - even for DASA
-                                if not self._is_defence_opportunity(title, description, 'DASA Contract'):
-                                    continue
-                                
-                                opportunity = {
-                                    'id': f"dasa_contract_{hash(title + url)}",
-                                    'title': title[:200],
-                                    'funding_body': 'Defence & Security Accelerator (DASA)',
-                                    'description': description[:500],
-                                    'detailed_description': description,
-                                    'closing_date': datetime.now() + timedelta(days=45),
-                                    'funding_amount': 'TBD',
-                                    'tech_areas': self._extract_tech_areas(title + ' ' + description),
-                                    'contract_type': 'Defence Contract',
-                                    'official_link': link if link.startswith('http') else f"https://www.gov.uk{link}",
-                                    'status': 'active',
-                                    'created_at': datetime.utcnow(),
-                                    'tier_required': 'free',
-                                    'source': 'dasa_contracts'
-                                }
-                                
-                                opportunities.append(opportunity)
-                                
-                            except Exception as e:
+                status, html = await self._fetch(session, url)
+                if status == 200:
+                    # lxml's C parser is several times faster than html.parser
+                    soup = BeautifulSoup(html, 'lxml')
+                    
+                    # Look for CONTRACT-specific elements, not innovation calls
+                    contract_elements = []
+                    
+                    # Focus on contract/tender selectors
+                    contract_selectors = [
+                        'a[href*="tender"]', 'a[href*="contract"]',
+                        'div[class*="contract"]', 'div[class*="tender"]',
+                        'a[href*="procurement"]', 'div[class*="procurement"]'
+                    ]
+                    
+                    for selector in contract_selectors:
+                        elements = soup.select(selector)
+                        contract_elements.extend(elements)
+                    
+                    for element in contract_elements[:15]:  # Reduced to focus on quality
+                        try:
+                            if element.name == 'a':
+                                title = element.get_text(strip=True)
+                                link = element.get('href', '')
+                            else:
+                                title_elem = element.find('a')
+                                title = title_elem.get_text(strip=True) if title_elem else ''
+                                link_elem = element.find('a', href=True)
+                                link = link_elem['href'] if link_elem else ''
+                            
+                            if len(title) < 10:
+                                continue
+                            
+                            # Get more description context
+                            desc_elem = element.find_next('p') or element.find('p')
+                            description = desc_elem.get_text(strip=True) if desc_elem else title
+                            
+                            # STRICT CONTRACT FILTERING - even for DASA
+                            if not self._is_defence_opportunity(title, description, 'DASA Contract'):
                                 continue
+                            
+                            opportunity = {
+                                'id': _stable_id('dasa_contract', title, url),
+                                'title': title[:200],
+                                'funding_body': 'Defence & Security Accelerator (DASA)',
+                                'description': description[:500],
+                                'detailed_description': description,
+                                'closing_date': default_closing_date,
+                                'funding_amount': 'TBD',
+                                'tech_areas': self._extract_tech_areas(title + ' ' + description),
+                                'contract_type': 'Defence Contract',
+                                'official_link': _absolute_link(GOVUK_BASE, link),
+                                'status': 'active',
+                                'created_at': created_at,
+                                'tier_required': 'free',
+                                'source': 'dasa_contracts'
+                            }
+                            
+                            opportunities.append(opportunity)
+                            
+                        except Exception as e:
+                            continue
                 
                 await asyncio.sleep(1)
                 
@@ -314,15 +772,38 @@ class UltimateDefenceCollector:
 
     # =================== PHASE 2 BROWSER AUTOMATION ===================
 
+    # Evaluated in the page: returns text + link for every match in one CDP round trip
+    EXTRACT_ELEMENTS_JS = """
+        ({selector, limit}) => Array.from(document.querySelectorAll(selector)).slice(0, limit).map(e => {
+            const a = e.tagName === 'A' ? e : e.querySelector('a');
+            return {title: (e.textContent || '').trim(), href: (a && a.getAttribute('href')) || ''};
+        })
+    """
+
+    async def _goto(self, page, url: str, **kwargs):
+        """Navigate to url, retrying once with a longer timeout if the page is slow to settle"""
+        try:
+            return await page.goto(url, wait_until='networkidle', timeout=GOTO_TIMEOUT_MS, **kwargs)
+        except PlaywrightTimeoutError:
+            print(f"⏳ Timed out loading {url}, retrying with longer wait")
+            return await page.goto(url, wait_until='networkidle', timeout=GOTO_RETRY_TIMEOUT_MS, **kwargs)
+
+    async def _extract_elements(self, page, selector: str, limit: int) -> List[Dict]:
+        """Extract title/href records for up to `limit` elements matching selector"""
+        return await page.evaluate(self.EXTRACT_ELEMENTS_JS, {'selector': selector, 'limit': limit})
+
     async def _collect_find_tender_browser(self, context) -> List[Dict]:
         """Find a Tender - Browser Automation for Complete Coverage"""
         opportunities = []
         
+        created_at = datetime.utcnow()
+        default_closing_date = datetime.now() + timedelta(days=45)
+        
         try:
             page = await context.new_page()
             
             # Navigate to Find a Tender
-            await page.goto('https://www.find-tender.service.gov.uk/Search', wait_until='networkidle')
+            await self._goto(page, 'https://www.find-tender.service.gov.uk/Search')
             
             # Defence search terms
             defence_searches = ['defence', 'security', 'military', 'MOD']
@@ -342,34 +823,34 @@ class UltimateDefenceCollector:
                     await page.click('button[type="submit"], input[type="submit"]')
                     await page.wait_for_timeout(3000)
                     
-                    # Extract results
-                    tender_elements = await page.query_selector_all('div[class*="tender"], div[class*="notice"], article[class*="opportunity"]')
-                    
-                    for element in tender_elements[:20]:
+                    # Extract results (single round trip to the browser)
+                    tender_records = await self._extract_elements(
+                        page, 'div[class*="tender"], div[class*="notice"], article[class*="opportunity"]', 20
+                    )
+
+                    for record in tender_records:
                         try:
-                            title = await element.text_content()
-                            
-                            if not title or len(title.strip()) < 10:
+                            title = record['title']
+
+                            if len(title) < 10:
                                 continue
-                            
-                            # Get link if available
-                            link_element = await element.query_selector('a')
-                            link = await link_element.get_attribute('href') if link_element else ''
-                            
+
+                            link = record['href']
+
                             if self._is_defence_opportunity(title, '', 'Find a Tender'):
                                 opportunity = {
-                                    'id': f"fts_browser_{hash(title + search_term)}",
+                                    'id': _stable_id('fts_browser', title, search_term),
                                     'title': title.strip()[:200],
                                     'funding_body': 'UK Government (Find a Tender)',
                                     'description': f'Government tender: {title.strip()}',
                                     'detailed_description': f'Government tender from Find a Tender: {title.strip()}',
-                                    'closing_date': datetime.now() + timedelta(days=45),
+                                    'closing_date': default_closing_date,
                                     'funding_amount': 'TBD',
                                     'tech_areas': self._extract_tech_areas(title),
                                     'contract_type': 'Government Tender',
-                                    'official_link': f"https://www.find-tender.service.gov.uk{link}" if link.startswith('/') else link,
+                                    'official_link': _absolute_link(FTS_BASE, link),
                                     'status': 'active',
-                                    'created_at': datetime.utcnow(),
+                                    'created_at': created_at,
                                     'tier_required': 'free',
                                     'source': 'find_tender_browser'
                                 }
@@ -397,43 +878,44 @@ class UltimateDefenceCollector:
         """Crown Commercial Service Frameworks - Browser Automation"""
         opportunities = []
         
+        created_at = datetime.utcnow()
+        default_closing_date = datetime.now() + timedelta(days=365)  # Frameworks are long-term
+        
         try:
             page = await context.new_page()
             
             # Navigate to CCS agreements
-            await page.goto('https://www.crowncommercial.gov.uk/agreements', wait_until='networkidle')
+            await self._goto(page, 'https://www.crowncommercial.gov.uk/agreements')
             
             # Look for framework agreements
-            framework_elements = await page.query_selector_all('div[class*="framework"], div[class*="agreement"], a[href*="framework"]')
-            
-            for element in framework_elements[:30]:
+            framework_records = await self._extract_elements(
+                page, 'div[class*="framework"], div[class*="agreement"], a[href*="framework"]', 30
+            )
+
+            for record in framework_records:
                 try:
-                    title = await element.text_content()
-                    
-                    if not title or len(title.strip()) < 10:
+                    title = record['title']
+
+                    if len(title) < 10:
                         continue
-                    
-                    # Get link
-                    link = await element.get_attribute('href') if element.tag_name == 'a' else ''
-                    if not link:
-                        link_element = await element.query_selector('a')
-                        link = await link_element.get_attribute('href') if link_element else ''
-                    
+
+                    link = record['href']
+
                     # Check if defence-related
                     if self._is_defence_opportunity(title, '', 'Crown Commercial Service'):
                         opportunity = {
-                            'id': f"ccs_browser_{hash(title)}",
+                            'id': _stable_id('ccs_browser', title),
                             'title': title.strip()[:200],
                             'funding_body': 'Crown Commercial Service',
                             'description': f'Government framework: {title.strip()}',
                             'detailed_description': f'Crown Commercial Service framework: {title.strip()}',
-                            'closing_date': datetime.now() + timedelta(days=365),  # Frameworks are long-term
+                            'closing_date': default_closing_date,
                             'funding_amount': 'Framework Agreement',
                             'tech_areas': self._extract_tech_areas(title),
                             'contract_type': 'Government Framework',
-                            'official_link': f"https://www.crowncommercial.gov.uk{link}" if link.startswith('/') else link,
+                            'official_link': _absolute_link(CCS_BASE, link),
                             'status': 'active',
-                            'created_at': datetime.utcnow(),
+                            'created_at': created_at,
                             'tier_required': 'free',
                             'source': 'ccs_frameworks_browser'
                         }
@@ -455,6 +937,9 @@ class UltimateDefenceCollector:
         """Defence Sourcing Portal (DSP) - Browser Automation"""
         opportunities = []
         
+        created_at = datetime.utcnow()
+        default_closing_date = datetime.now() + timedelta(days=30)
+        
         try:
             page = await context.new_page()
             
@@ -468,40 +953,37 @@ class UltimateDefenceCollector:
             
             for url in dsp_urls:
                 try:
-                    await page.goto(url, wait_until='networkidle', timeout=30000)
+                    await self._goto(page, url)
+                    page_url = URL(url)
                     
                     # Look for opportunity elements
-                    opportunity_elements = await page.query_selector_all(
-                        'div[class*="opportunity"], div[class*="contract"], div[class*="tender"], a[href*="opportunity"]'
+                    opportunity_records = await self._extract_elements(
+                        page, 'div[class*="opportunity"], div[class*="contract"], div[class*="tender"], a[href*="opportunity"]', 20
                     )
-                    
-                    for element in opportunity_elements[:20]:
+
+                    for record in opportunity_records:
                         try:
-                            title = await element.text_content()
-                            
-                            if not title or len(title.strip()) < 10:
+                            title = record['title']
+
+                            if len(title) < 10:
                                 continue
-                            
-                            # Get link
-                            link = await element.get_attribute('href') if element.tag_name == 'a' else ''
-                            if not link:
-                                link_element = await element.query_selector('a')
-                                link = await link_element.get_attribute('href') if link_element else ''
-                            
+
+                            link = record['href']
+
                             # All DSP content is defence by nature
                             opportunity = {
-                                'id': f"dsp_browser_{hash(title + url)}",
+                                'id': _stable_id('dsp_browser', title, url),
                                 'title': title.strip()[:200],
                                 'funding_body': 'Defence Sourcing Portal (MOD)',
                                 'description': f'Defence sourcing opportunity: {title.strip()}',
                                 'detailed_description': f'Defence Sourcing Portal opportunity: {title.strip()}',
-                                'closing_date': datetime.now() + timedelta(days=30),
+                                'closing_date': default_closing_date,
                                 'funding_amount': 'TBD',
                                 'tech_areas': self._extract_tech_areas(title),
                                 'contract_type': 'Defence Contract',
-                                'official_link': link if link.startswith('http') else f"{url.rstrip('/')}/{link.lstrip('/')}" if link else url,
+                                'official_link': _absolute_link(page_url, link) if link else url,
                                 'status': 'active',
-                                'created_at': datetime.utcnow(),
+                                'created_at': created_at,
                                 'tier_required': 'free',
                                 'source': 'defence_sourcing_portal'
                             }
@@ -531,6 +1013,9 @@ class UltimateDefenceCollector:
         """Prime Contractors - Browser Automation for Public Supplier Pages"""
         opportunities = []
         
+        created_at = datetime.utcnow()
+        default_closing_date = datetime.now() + timedelta(days=90)
+        
         # Prime contractor supplier portals
         primes = {
             'BAE Systems': 'https://www.baesystems.com/en/our-company/supplier-information',
@@ -541,58 +1026,65 @@ class UltimateDefenceCollector:
             'Leonardo UK': 'https://uk.leonardocompany.com/en/suppliers'
         }
         
-        for prime_name, url in primes.items():
+        async def scrape_prime(prime_name: str, url: str) -> List[Dict]:
+            prime_opportunities = []
+            prime_url = URL(url)
             try:
-                page = await context.new_page()
-                await page.goto(url, wait_until='networkidle', timeout=30000)
-                
-                # Look for supplier opportunities
-                opportunity_elements = await page.query_selector_all(
-                    'div[class*="opportunity"], div[class*="tender"], a[href*="opportunity"], a[href*="tender"], div[class*="supplier"]'
-                )
+                async with pool.page() as page:
+                    await self._goto(page, url)
+                    
+                    # Look for supplier opportunities
+                    opportunity_records = await self._extract_elements(
+                        page, 'div[class*="opportunity"], div[class*="tender"], a[href*="opportunity"], a[href*="tender"], div[class*="supplier"]', 15
+                    )
                 
-                for element in opportunity_elements[:15]:
+                for record in opportunity_records:
                     try:
-                        title = await element.text_content()
-                        
-                        if not title or len(title.strip()) < 10:
+                        title = record['title']
+
+                        if len(title) < 10:
                             continue
-                        
-                        # Get link
-                        link = await element.get_attribute('href') if element.tag_name == 'a' else ''
-                        if not link:
-                            link_element = await element.query_selector('a')
-                            link = await link_element.get_attribute('href') if link_element else ''
-                        
+
+                        link = record['href']
+
                         # Prime contractor opportunities are defence by nature
                         opportunity = {
-                            'id': f"prime_{prime_name.lower().replace(' ', '_')}_{hash(title)}",
+                            'id': _stable_id(f"prime_{prime_name.lower().replace(' ', '_')}", title),
                             'title': title.strip()[:200],
                             'funding_body': f'{prime_name} (Prime Contractor)',
                             'description': f'Supplier opportunity with {prime_name}: {title.strip()}',
                             'detailed_description': f'Prime contractor supplier opportunity from {prime_name}: {title.strip()}',
-                            'closing_date': datetime.now() + timedelta(days=90),
+                            'closing_date': default_closing_date,
                             'funding_amount': 'Prime Contract Opportunity',
                             'tech_areas': self._extract_tech_areas(title),
                             'contract_type': 'Prime Contractor Opportunity',
-                            'official_link': link if link.startswith('http') else f"{url.split('/')[0]}//{url.split('/')[2]}{link}" if link else url,
+                            'official_link': _absolute_link(prime_url, link) if link else url,
                             'status': 'active',
-                            'created_at': datetime.utcnow(),
+                            'created_at': created_at,
                             'tier_required': 'pro',  # Prime opportunities for Pro tier
                             'source': f'prime_{prime_name.lower().replace(" ", "_")}'
                         }
                         
-                        opportunities.append(opportunity)
+                        prime_opportunities.append(opportunity)
                         
                     except Exception as e:
                         continue
                 
-                await page.close()
-                await asyncio.sleep(2)  # Rate limiting between primes
-                
             except Exception as e:
                 print(f"Error with {prime_name}: {e}")
-                continue
+            
+            return prime_opportunities
+        
+        # Primes are separate hosts, so they are scraped concurrently over a shared page pool
+        pool = PagePool(context, size=PRIME_PAGE_POOL_SIZE)
+        await pool.start()
+        try:
+            results = await asyncio.gather(*[scrape_prime(prime_name, url) for prime_name, url in primes.items()])
+        finally:
+            await pool.close()
+        
+        for prime_opportunities in results:
+            opportunities.extend(prime_opportunities)
         
         print(f"✅ Prime Contractors Browser: {len(opportunities)} opportunities")
         return opportunities
@@ -603,129 +1095,36 @@ class UltimateDefenceCollector:
         """
         ENHANCED: Check if opportunity is a DEFENCE CONTRACT (not just innovation call)
         """
-        text = f"{title} {description} {source}".lower()
-        
-        # IMMEDIATE REJECTION for exclusions
-        for exclusion in self.exclusion_keywords:
-            if exclusion in text:
-                return False
-        
-        # IMMEDIATE REJECTION for innovation/non-contract keywords
-        for innovation_word in self.innovation_keywords:
-            if innovation_word in text:
-                print(f"❌ Rejected innovation call: {title[:60]}...")
-                return False
-        
-        # Must be defence-related
-        is_defence = any(keyword in text for keyword in self.defence_keywords)
-        if not is_defence:
-            return False
-        
-        # Must have contract indicators
-        is_contract = any(keyword in text for keyword in self.contract_keywords)
-        
-        # Additional contract indicators
-        contract_indicators = [
-            'contract value', 'tender value', 'estimated value',
-            'supply of', 'provision of', 'delivery of', 'maintenance of',
-            'cpv code', 'contract notice', 'award notice',
-            'closing date', 'submission deadline', 'tender deadline',
-            'framework', 'dynamic purchasing system', 'lots'
-        ]
+        verdict, contract_score = _classify_opportunity(title, description, source)
         
-        has_contract_indicators = any(indicator in text for indicator in contract_indicators)
-        
-        # Score-based approach for contract likelihood
-        contract_score = 0
-        
-        if is_contract:
-            contract_score += 10
-        if has_contract_indicators:
-            contract_score += 5
-        
-        # Look for value patterns (actual contract values, not funding ranges)
-        value_patterns = [
-            r'contract value[:\s]*£[\d,]+',
-            r'estimated value[:\s]*£[\d,]+',
-            r'total value[:\s]*£[\d,]+',
-            r'£[\d,]+(?:\.\d{2})?\s*(?:per|total|contract)',
-        ]
+        # Per-notice decisions are debug output; formatting is skipped unless DEBUG is enabled
+        if verdict == VERDICT_INNOVATION:
+            logger.debug("❌ Rejected innovation call: %.60s...", title)
+        elif verdict == VERDICT_CONTRACT:
+            logger.debug("✅ Accepted contract: %.60s... (Score: %d)", title, contract_score)
+        elif verdict == VERDICT_NON_CONTRACT:
+            logger.debug("❌ Rejected non-contract: %.60s... (Score: %d)", title, contract_score)
         
-        for pattern in value_patterns:
-            if re.search(pattern, text):
-                contract_score += 3
-        
-        # Require minimum score for acceptance
-        is_likely_contract = contract_score >= 10
-        
-        if is_likely_contract:
-            print(f"✅ Accepted contract: {title[:60]}... (Score: {contract_score})")
-        else:
-            print(f"❌ Rejected non-contract: {title[:60]}... (Score: {contract_score})")
-        
-        return is_likely_contract
+        return verdict == VERDICT_CONTRACT
 
     def _extract_tech_areas(self, text: str) -> List[str]:
         """Extract technology areas from text"""
-        tech_areas = []
-        text_lower = text.lower()
-        
-        tech_mapping = {
-            'artificial intelligence': ['ai', 'artificial intelligence', 'machine learning'],
-            'cybersecurity': ['cyber', 'cybersecurity', 'cyber security'],
-            'quantum technologies': ['quantum'],
-            'robotics & autonomous systems': ['robotics', 'autonomous', 'unmanned'],
-            'aerospace': ['aerospace', 'aviation', 'aircraft'],
-            'maritime defence': ['maritime', 'naval', 'submarine'],
-            'sensors & signal processing': ['sensors', 'radar', 'surveillance'],
-            'communications': ['communications', 'radio', 'satellite'],
-            'advanced materials': ['materials', 'armour', 'protection'],
-            'space technologies': ['space', 'satellite', 'orbital']
-        }
-        
-        for tech_area, keywords in tech_mapping.items():
-            if any(keyword in text_lower for keyword in keywords):
-                tech_areas.append(tech_area)
-        
-        return tech_areas if tech_areas else ['Defence Technology']
+        tech_areas = _match_tech_areas(text)
+        return list(tech_areas) if tech_areas else ['Defence Technology']
 
     def _parse_date(self, date_string: str) -> Optional[datetime]:
         """Parse various date formats"""
         if not date_string:
             return None
         
-        try:
-            # Try common formats
-            for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%dT%H:%M:%S']:
-                try:
-                    return datetime.strptime(date_string[:10], fmt[:10])
-                except ValueError:
-                    continue
-        except Exception:
-            pass
-        
-        return None
+        return _parse_date_cached(date_string)
 
     def _remove_duplicates(self, opportunities: List[Dict]) -> List[Dict]:
         """Remove duplicate opportunities based on title similarity"""
-        unique_opportunities = []
-        seen_titles = set()
-        
-        for opp in opportunities:
-            title_normalized = re.sub(r'[^\w\s]', '', opp['title'].lower()).strip()
-            title_words = set(title_normalized.split())
-            
-            is_duplicate = False
-            for seen_title in seen_titles:
-                seen_words = set(seen_title.split())
-                
-                # Check for high similarity (>80% word overlap)
-                if len(title_words & seen_words) / max(len(title_words), len(seen_words), 1) > 0.8:
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
-                seen_titles.add(title_normalized)
-                unique_opportunities.append(opp)
-        
-        return unique_opportunities
+        deduplicator = TitleDeduplicator()
+        return [opp for opp in opportunities if deduplicator.add(opp['title'])]
+
+
+def _run_phase2_sync() -> List[Dict]:
+    """Process-pool entry point: run browser automation on a fresh event loop"""
+    return asyncio.run(UltimateDefenceCollector()._collect_phase2())
@@ -9,25 +9,235 @@ Moving from 30-40% to 100% coverage by:
 """
 
 import asyncio
-import aiohttp
+import httpx
 import re
-import json
+import orjson
 import hashlib
+import math
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import threading
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Set, Tuple
-from dataclasses import dataclass, asdict
+from typing import AsyncIterator, List, Dict, Mapping, Optional, Sequence, Set, Tuple
+from dataclasses import dataclass, field
 from bs4 import BeautifulSoup
+from dateutil import parser as date_parser
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse, quote
 import logging
 from enum import Enum
 import random
+import sys
 import time
+from types import MappingProxyType
+import xxhash
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class SourceType(Enum):
+# Sent with every request from the shared Find a Tender client
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br'
+}
+
+# Concurrent Find a Tender requests and minimum spacing between requests to one host
+FTS_MAX_CONCURRENCY = 5
+MIN_REQUEST_INTERVAL = 0.2
+
+# Find a Tender result parsing: container selectors tried in order, then per-field
+# selectors tried in order within each result
+FTS_RESULT_SELECTORS = (
+    'div.search-result',
+    'article.opportunity',
+    'div.notice',
+    'div.tender-result',
+    '.search-results .result'
+)
+FTS_SUMMARY_SELECTORS = (
+    'p.description', 'div.summary', 'p.content',
+    '.description', '.summary', '.excerpt'
+)
+FTS_AUTHORITY_SELECTORS = (
+    'span.authority', 'div.organisation', 'span.buyer',
+    '.authority', '.organisation', '.contracting-authority'
+)
+FTS_DEADLINE_SELECTORS = (
+    'time', 'span.deadline', 'div.closing-date',
+    '.deadline', '.closing-date', '.date'
+)
+FTS_VALUE_SELECTORS = (
+    'span.value', 'div.amount', 'span.budget',
+    '.value', '.amount', '.budget', '.contract-value'
+)
+# Fallback: any div whose class mentions a result-like word, matched in one pass
+FTS_FALLBACK_SELECTOR = (
+    'div[class*="result"], div[class*="opportunity"], '
+    'div[class*="notice"], div[class*="tender"]'
+)
+# Every result selector above needs one of these words in the page
+FTS_RESULT_MARKERS = (b'result', b'opportunity', b'notice', b'tender')
+CPV_TEXT_RE = re.compile(r'CPV:?\s*(\d{8})')
+CPV_CODE_RE = re.compile(r'(\d{8})')
+
+# Deadline and value parsing: one precompiled pass each, dateutil only as a last resort
+DEADLINE_PREFIX_RE = re.compile(r'^(?:(?:Deadline|Closing|Due|By|Expires|Until):\s*)+')
+ISO_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+DMY_DATE_RE = re.compile(r'(?<!\d)(\d{1,2})(?:st|nd|rd|th)?[/\-. ]+(\d{1,2}|[A-Za-z]{3,9})[/\-. ]+(\d{2,4})(?!\d)')
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+VALUE_RE = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*(?:(bn|billion|million|mil|m|thousand|k)(?![a-z]))?', re.I)
+# Magnitude on a later number, for ranges like "£10-20m" whose lower bound has no suffix
+VALUE_MAGNITUDE_RE = re.compile(r'\d\s*(bn|billion|million|mil|m|thousand|k)(?![a-z])', re.I)
+VALUE_MULTIPLIERS = {
+    'bn': 1e9, 'billion': 1e9,
+    'm': 1e6, 'mil': 1e6, 'million': 1e6,
+    'k': 1e3, 'thousand': 1e3
+}
+
+@lru_cache(maxsize=None)
+def _category_label(category: str) -> str:
+    """'digital_health' -> 'digital health', interned so every record of a category shares one string"""
+    return sys.intern(category.replace("_", " "))
+
+@lru_cache(maxsize=None)
+def _category_title(category: str) -> str:
+    """'digital_health' -> 'Digital Health', interned like _category_label"""
+    return sys.intern(category.replace("_", " ").title())
+
+class DomainRateLimiter:
+    """Spaces out requests to the same host by at least min_interval seconds"""
+    
+    def __init__(self, min_interval: float = MIN_REQUEST_INTERVAL):
+        self.min_interval = min_interval
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._last_request: Dict[str, float] = {}
+    
+    async def wait(self, domain: str):
+        lock = self._locks.setdefault(domain, asyncio.Lock())
+        async with lock:
+            delay = self._last_request.get(domain, 0.0) + self.min_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last_request[domain] = time.monotonic()
+
+# On-disk cache of successful Find a Tender pages, so repeated runs skip the network
+RESPONSE_CACHE_PATH = os.environ.get('FTS_CACHE_PATH', os.path.join(tempfile.gettempdir(), 'fts_cache.sqlite'))
+RESPONSE_CACHE_TTL = 6 * 3600
+
+class ResponseCache:
+    """SQLite-backed cache of response bodies keyed by full URL (query string included).
+    
+    Calls block on disk, so async callers run them through asyncio.to_thread; the lock
+    serialises those worker threads on the shared connection.
+    """
+    
+    def __init__(self, path: str = RESPONSE_CACHE_PATH, expire_after: float = RESPONSE_CACHE_TTL):
+        self.expire_after = expire_after
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, fetched_at REAL, body BLOB)"
+        )
+        self._conn.execute("DELETE FROM responses WHERE fetched_at < ?", (time.time() - expire_after,))
+        self._conn.commit()
+    
+    def get(self, url: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM responses WHERE url = ? AND fetched_at >= ?",
+                (url, time.time() - self.expire_after)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def set(self, url: str, body: bytes):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, fetched_at, body) VALUES (?, ?, ?)",
+                (url, time.time(), body)
+            )
+            self._conn.commit()
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+# Sizing for the content-hash dedup filter
+SEEN_HASHES_CAPACITY = 10_000
+SEEN_HASHES_ERROR_RATE = 1e-6
+
+class ScalableBloomFilter:
+    """Set-like membership filter that stores a few bits per key instead of the key itself.
+    
+    Each layer is a fixed-size Bloom filter; when one fills up a new layer with twice
+    the capacity and a tighter error rate is added, so the overall false positive rate
+    stays below error_rate however many keys are added.
+    """
+    
+    def __init__(self, initial_capacity: int = SEEN_HASHES_CAPACITY, error_rate: float = SEEN_HASHES_ERROR_RATE):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self._layers = []
+        self._count = 0
+        self._add_layer()
+    
+    def _add_layer(self):
+        n = len(self._layers)
+        capacity = self.initial_capacity * 2 ** n
+        # Halving each layer's error rate keeps the sum bounded by error_rate
+        error_rate = self.error_rate / 2 ** (n + 1)
+        num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self._layers.append([bytearray((num_bits + 7) // 8), num_bits, num_hashes, capacity, 0])
+    
+    def _hashes(self, key: str) -> List[int]:
+        # One independent 64-bit hash per probe; the newest layer uses the most probes.
+        # Double hashing (h1 + i*h2) correlates too strongly at this error rate.
+        num_hashes = self._layers[-1][2]
+        digest = hashlib.shake_128(key.encode()).digest(8 * num_hashes)
+        return [int.from_bytes(digest[i:i + 8], 'little') for i in range(0, 8 * num_hashes, 8)]
+    
+    def _probe(self, hashes: List[int]) -> bool:
+        for bits, num_bits, num_hashes, _, _ in self._layers:
+            for h in hashes[:num_hashes]:
+                index = h % num_bits
+                if not bits[index >> 3] & (1 << (index & 7)):
+                    break
+            else:
+                return True
+        return False
+    
+    def __contains__(self, key: str) -> bool:
+        return self._probe(self._hashes(key))
+    
+    def add(self, key: str) -> bool:
+        """Add key, returning False if it was already present (one digest for test and insert)"""
+        hashes = self._hashes(key)
+        if self._probe(hashes):
+            return False
+        layer = self._layers[-1]
+        if layer[4] >= layer[3]:
+            self._add_layer()
+            layer = self._layers[-1]
+            # The new layer probes more positions than the old digest covers
+            hashes = self._hashes(key)
+        bits, num_bits = layer[0], layer[1]
+        for h in hashes:
+            index = h % num_bits
+            bits[index >> 3] |= 1 << (index & 7)
+        layer[4] += 1
+        self._count += 1
+        return True
+    
+    def __len__(self) -> int:
+        return self._count
+
+class SourceType(str, Enum):
     UK_OFFICIAL = "uk_official"
     UK_FRAMEWORKS = "uk_frameworks"
     UK_DUAL_USE = "uk_dual_use"
@@ -36,7 +246,7 @@ class SourceType(Enum):
     INTERNATIONAL_ALLIES = "international_allies"
     UK_ACADEMIC = "uk_academic"
 
-@dataclass
+@dataclass(slots=True)
 class OpportunityData:
     """Ultra enhanced opportunity data structure"""
     title: str
@@ -48,16 +258,19 @@ class OpportunityData:
     url: str
     value_estimate: Optional[float] = None
     sme_score: float = 0.0
-    tech_tags: List[str] = None
+    # Generated sources share one immutable tuple per category; replace rather than mutate
+    tech_tags: Sequence[str] = None
     country: str = "UK"
     location: str = "UK"
     procurement_type: str = "Open Tender"
-    keywords_matched: List[str] = None
+    keywords_matched: Sequence[str] = None
     priority_score: float = 0.0
     confidence_score: float = 0.0
     content_hash: str = ""
     date_scraped: datetime = None
     cpv_codes: List[str] = None
+    # Set by the enhanced aggregator after scoring; declared because slots forbid new attributes
+    sme_fit: bool = False
     
     def __post_init__(self):
         if self.tech_tags is None:
@@ -69,15 +282,745 @@ class OpportunityData:
         if self.date_scraped is None:
             self.date_scraped = datetime.utcnow()
         
-        # Generate content hash for deduplication
-        content_string = f"{self.title}{self.deadline.strftime('%Y-%m-%d')}{self.contracting_body}"
-        self.content_hash = hashlib.md5(content_string.encode()).hexdigest()
+        # Generate content hash for deduplication; kept as a hex string because it is also
+        # used as the stored opportunity id downstream
+        deadline_str = self.deadline.strftime('%Y-%m-%d')
+        content_string = f"{self.title}{deadline_str}{self.contracting_body}"
+        self.content_hash = xxhash.xxh3_64_hexdigest(content_string.encode())
+    
+    def to_bytes(self) -> bytes:
+        """JSON-encode directly from the slots; datetimes become ISO strings, SourceType its value"""
+        return orjson.dumps(self)
+
+def opportunities_to_json(opportunities: Sequence[OpportunityData]) -> bytes:
+    """Encode a whole batch as one JSON array in a single orjson call, with no per-record dict or str step"""
+    return orjson.dumps(opportunities)
+
+# Enhanced realistic contract patterns based on actual CF structure
+CONTRACTS_FINDER_CATEGORIES = MappingProxyType({
+    "ai_technology": (
+        "AI-Enhanced Battlefield Intelligence Analysis Platform",
+        "Machine Learning for Predictive Equipment Maintenance",
+        "Computer Vision System for Automated Threat Recognition",
+        "Natural Language Processing for Intelligence Document Analysis",
+        "Deep Learning Platform for Cyber Threat Prediction",
+        "AI-Powered Logistics Optimization for Military Supply Chains",
+        "Autonomous Decision Support System for Command Operations"
+    ),
+    "cyber_security": (
+        "Next-Generation Firewall for Defence Networks",
+        "Zero Trust Architecture Implementation for MOD Systems",
+        "Quantum-Resistant Cryptography Migration Programme",
+        "Advanced Persistent Threat Detection Platform",
+        "Secure Multi-Domain Operations Communications Hub",
+        "Cyber Range Training Environment Development",
+        "Industrial Control Systems Security Enhancement"
+    ),
+    "space_defence": (
+        "Space Situational Awareness Sensor Network",
+        "Satellite Communication Resilience Enhancement",
+        "Space-Based Earth Observation Intelligence Platform",
+        "Anti-Jamming GPS Technology Development",
+        "In-Orbit Servicing Robotic System Development",
+        "Space Debris Tracking and Mitigation System"
+    ),
+    "maritime_systems": (
+        "Next-Generation Sonar Processing System",
+        "Maritime Autonomous Surface Vehicle Development",
+        "Underwater Communications Network Infrastructure",
+        "Port Security Integrated Surveillance Platform",
+        "Naval Combat Management System Upgrade",
+        "Maritime Domain Awareness AI Platform"
+    ),
+    "medical_trauma": (
+        "Combat Casualty Care Mobile Application Suite",
+        "Advanced Trauma Simulation Training System",
+        "Remote Patient Monitoring for Deployed Forces",
+        "Blood Products Preservation Technology Enhancement",
+        "Telemedicine Platform for Forward Operating Bases",
+        "Medical Equipment Predictive Maintenance System"
+    )
+})
+
+CONTRACTS_FINDER_AUTHORITIES = (
+    "Defence Equipment & Support (DE&S)",
+    "Ministry of Defence",
+    "Royal Navy",
+    "British Army",
+    "Royal Air Force",
+    "Defence Science and Technology Laboratory",
+    "Defence Digital",
+    "Joint Forces Command",
+    "Strategic Command",
+    "UK Hydrographic Office"
+)
+
+# Category-specific value ranges with SME focus
+CONTRACTS_FINDER_VALUE_RANGES = MappingProxyType({
+    "ai_technology": (50000, 2500000),      # SME-friendly AI contracts
+    "cyber_security": (75000, 3500000),    # SME cyber security
+    "space_defence": (100000, 15000000),   # Some large, some SME
+    "maritime_systems": (200000, 25000000), # Mix of sizes
+    "medical_trauma": (25000, 1500000)     # Mostly SME-sized medical
+})
+
+# Enhanced summaries
+CONTRACTS_FINDER_SUMMARY_TEMPLATES = MappingProxyType({
+    "ai_technology": "Development and implementation of {} with advanced machine learning algorithms, real-time processing capabilities, and integration with existing defence systems.",
+    "cyber_security": "Procurement and deployment of {} featuring advanced threat detection, automated response capabilities, and compliance with defence security standards.",
+    "space_defence": "Design and delivery of {} incorporating cutting-edge space technology, ground segment integration, and operational resilience.",
+    "maritime_systems": "Development of {} with enhanced naval capabilities, interoperability with allied systems, and advanced sensor integration.",
+    "medical_trauma": "Implementation of {} designed for military medical applications, field deployment, and integration with combat medical protocols."
+})
+
+# Flattened (category, title) pairs, built once at import
+CONTRACTS_FINDER_ENTRIES = tuple(
+    (category, contract_title)
+    for category, contracts in CONTRACTS_FINDER_CATEGORIES.items()
+    for contract_title in contracts
+)
+
+# (tech_tags, keywords) shared by every record in a category
+CONTRACTS_FINDER_TAGS = MappingProxyType({
+    category: ((_category_title(category),), (_category_label(category),))
+    for category in CONTRACTS_FINDER_CATEGORIES
+})
+
+# Comprehensive G-Cloud and DOS opportunities
+DIGITAL_MARKETPLACE_CATEGORIES = MappingProxyType({
+    "g_cloud_software": (
+        "AI-Powered Threat Intelligence Platform (G-Cloud 13)",
+        "Quantum-Safe Encryption Software Suite (G-Cloud 13)",
+        "Military Asset Management Cloud Platform (G-Cloud 13)",
+        "Secure Video Conferencing for Defence Operations (G-Cloud 13)",
+        "Automated Vulnerability Assessment Tool (G-Cloud 13)",
+        "Battlefield Data Analytics Platform (G-Cloud 13)",
+        "Cyber Security Incident Response Platform (G-Cloud 13)",
+        "Supply Chain Risk Management Software (G-Cloud 13)",
+        # SME-friendly smaller software contracts
+        "Military Training Mobile Application (G-Cloud 13)",
+        "Equipment Maintenance Tracking System (G-Cloud 13)",
+        "Personnel Security Clearance Management Tool (G-Cloud 13)",
+        "Incident Reporting and Analysis Software (G-Cloud 13)",
+        "Military Document Management System (G-Cloud 13)",
+        "Training Record Management Platform (G-Cloud 13)",
+        "Equipment Inventory Management App (G-Cloud 13)",
+        "Basic Cyber Security Monitoring Tool (G-Cloud 13)"
+    ),
+    "g_cloud_support": (
+        "24/7 SOC Services for Defence Networks (G-Cloud 13)",
+        "Cloud Migration Support for Legacy Defence Systems (G-Cloud 13)",
+        "DevSecOps Implementation for Military Applications (G-Cloud 13)",
+        "Managed Security Services for Classified Systems (G-Cloud 13)",
+        "Cloud Infrastructure Monitoring for MOD (G-Cloud 13)",
+        "Disaster Recovery as a Service for Defence (G-Cloud 13)",
+        # SME-friendly support services
+        "Cyber Security Consulting for Small Defence Units (G-Cloud 13)",
+        "Software Development Support for Military Apps (G-Cloud 13)",
+        "IT Support for Regional Military Facilities (G-Cloud 13)",
+        "Basic Cloud Setup for Defence Contractors (G-Cloud 13)",
+        "Security Assessment Services for SME Defence Suppliers (G-Cloud 13)"
+    ),
+    "dos_specialists": (
+        "Senior Cyber Security Architect (DOS6)",
+        "AI/ML Engineer for Defence Applications (DOS6)",
+        "Quantum Technology Researcher (DOS6)",
+        "DevSecOps Engineer for Military Systems (DOS6)",
+        "Data Scientist for Intelligence Analysis (DOS6)",
+        "Cloud Security Specialist for Defence (DOS6)",
+        # SME-friendly specialist roles
+        "Junior Software Developer for Military Apps (DOS6)",
+        "Cyber Security Analyst for Defence SMEs (DOS6)",
+        "Technical Writer for Defence Documentation (DOS6)",
+        "UX Designer for Military Interfaces (DOS6)",
+        "Data Analyst for Defence Procurement (DOS6)",
+        "IT Support Specialist for Defence Networks (DOS6)"
+    ),
+    "dos_outcomes": (
+        "AI Ethics Framework for Military AI Systems (DOS6)",
+        "Cyber Security Strategy for Next-Gen Defence Systems (DOS6)",
+        "Digital Transformation Roadmap for Defence Logistics (DOS6)",
+        "Quantum Computing Readiness Assessment (DOS6)",
+        "Zero Trust Architecture Design for MOD (DOS6)",
+        # SME-friendly smaller outcomes
+        "Mobile App Development for Military Training (DOS6)",
+        "Small-Scale Cyber Security Assessment (DOS6)",
+        "Defence Supplier Portal Development (DOS6)",
+        "Military Equipment Tracking System Design (DOS6)",
+        "Basic AI Implementation for Defence Logistics (DOS6)"
+    )
+})
+
+DIGITAL_MARKETPLACE_BUYERS = (
+    "Defence Digital", "Ministry of Defence", "Defence Equipment & Support",
+    "Defence Science and Technology Laboratory", "UK Hydrographic Office",
+    "Royal Navy", "British Army", "Royal Air Force", "Joint Forces Command"
+)
+
+# Flattened (category, title) pairs, built once at import
+DIGITAL_MARKETPLACE_ENTRIES = tuple(
+    (category, opp_title)
+    for category, opportunities_list in DIGITAL_MARKETPLACE_CATEGORIES.items()
+    for opp_title in opportunities_list
+)
+
+# (tech_tags, keywords) shared by every record in a category; G-Cloud lots vs DOS6
+DIGITAL_MARKETPLACE_TAGS = MappingProxyType({
+    category: (("Digital Services", "G-Cloud 13" if "g_cloud" in category else "DOS6"), (_category_label(category),))
+    for category in DIGITAL_MARKETPLACE_CATEGORIES
+})
+
+@dataclass(frozen=True, slots=True)
+class SourceSpec:
+    """Declarative catalogue for one generated source, expanded by UltraEnhancedCollector._generate"""
+    source: str
+    source_type: SourceType
+    title_prefix: str
+    categories: Mapping[str, Tuple[str, ...]]
+    contracting_bodies: Tuple[str, ...]
+    value_ranges: Mapping[str, Tuple[int, int]]
+    default_value_range: Tuple[int, int]
+    deadline_days: Tuple[int, int]
+    # May contain "{category}"; followed by a random id from url_ids, or the title slug when None
+    url_prefix: str
+    url_ids: Optional[Tuple[int, int]]
+    procurement_type: str
+    # Formatted with the lower-cased item title and the category's summary detail
+    summary_template: str
+    summary_details: Mapping[str, str] = field(default_factory=dict)
+    default_summary_detail: str = ""
+    procurement_types: Mapping[str, str] = field(default_factory=dict)
+    # Used for both country and location of every record
+    country: str = "UK"
+    # "{title}" and "{label}" expand to the category's title-case and plain-text names
+    tech_tags: Tuple[str, ...] = ()
+    keywords: Tuple[str, ...] = ()
+    # Derived once at import: (title, summary, url slug) for every catalogue item, and the
+    # expanded (tech_tags, keywords) pair shared by each category's records
+    entries: Mapping[str, Tuple[Tuple[str, str, str], ...]] = field(init=False, repr=False)
+    tags: Mapping[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        entries = {}
+        tags = {}
+        for category, items in self.categories.items():
+            names = {"title": _category_title(category), "label": _category_label(category)}
+            tags[category] = (
+                tuple(tag.format_map(names) for tag in self.tech_tags),
+                tuple(keyword.format_map(names) for keyword in self.keywords)
+            )
+            detail = self.summary_details.get(category, self.default_summary_detail)
+            rows = []
+            for item in items:
+                item_lower = item.lower()
+                rows.append((
+                    f"{self.title_prefix}{item}",
+                    self.summary_template.format(title=item_lower, detail=detail),
+                    item_lower.replace(' ', '-')
+                ))
+            entries[category] = tuple(rows)
+        # Frozen dataclass, so the read-only views are set through object.__setattr__
+        for name in ('categories', 'value_ranges', 'summary_details', 'procurement_types'):
+            object.__setattr__(self, name, MappingProxyType(getattr(self, name)))
+        object.__setattr__(self, 'entries', MappingProxyType(entries))
+        object.__setattr__(self, 'tags', MappingProxyType(tags))
+
+# Comprehensive DASA competition themes based on actual DASA focus areas
+SPEC_DASA = SourceSpec(
+    source="DASA",
+    source_type=SourceType.UK_OFFICIAL,
+    title_prefix="DASA: ",
+    categories={
+        "phase_1": (
+            "Autonomous Systems for Extreme Environments",
+            "AI for Multi-Domain Situational Awareness",
+            "Quantum Sensing for Navigation and Timing",
+            "Advanced Materials for Hypersonic Vehicles",
+            "Swarm Robotics for Intelligence Gathering",
+            "Synthetic Biology for Defence Manufacturing",
+            "Edge Computing for Tactical Operations",
+            "Human-Machine Teaming for Combat Operations",
+            "Directed Energy Weapons Technology",
+            "Advanced Camouflage and Concealment Systems"
+        ),
+        "phase_2": (
+            "Next-Generation Combat Aircraft Technologies",
+            "Underwater Autonomous Vehicle Swarms",
+            "Space-Based Intelligence Platform Development",
+            "AI-Enhanced Electronic Warfare Systems",
+            "Quantum Communication Networks",
+            "Advanced Battle Management Systems",
+            "Counter-Unmanned Aerial System Technologies",
+            "Future Combat Air System Digital Twin",
+            "Maritime Mine Countermeasures Innovation",
+            "Cyber-Physical Security for Critical Infrastructure"
+        ),
+        "themed_competitions": (
+            "Urban Warfare Technology Challenge",
+            "Arctic Operations Innovation Programme",
+            "Future Soldier Technology Initiative",
+            "Network Enabled Capability Enhancement",
+            "Contested Logistics Innovation Challenge",
+            "Multi-Domain Integration Technology Programme",
+            "Resilient Communications Innovation Call",
+            "Next-Generation Training Systems Challenge"
+        )
+    },
+    contracting_bodies=("Defence and Security Accelerator (DASA)",),
+    # Phase-specific details
+    value_ranges={
+        "phase_1": (50000, 300000),
+        "phase_2": (300000, 2000000)
+    },
+    default_value_range=(100000, 1500000),
+    deadline_days=(60, 180),
+    url_prefix="https://www.gov.uk/government/publications/dasa-{category}-",
+    url_ids=None,
+    procurement_type="DASA Themed Competition",
+    procurement_types={
+        "phase_1": "DASA Phase 1 Innovation Challenge",
+        "phase_2": "DASA Phase 2 Development Contract"
+    },
+    summary_template="{detail} {title}. Open to UK industry, academia, and international partners. Focus on rapid prototyping and transition to operational capability.",
+    summary_details={
+        "phase_1": "Feasibility study and proof of concept development for",
+        "phase_2": "Technology demonstration and prototype development for"
+    },
+    default_summary_detail="Innovation challenge addressing",
+    tech_tags=("Innovation", "R&D", "{title}"),
+    keywords=("innovation", "dasa", "research")
+)
+
+# Comprehensive NHS dual-use categories
+SPEC_NHS = SourceSpec(
+    source="NHS Supply Chain",
+    source_type=SourceType.UK_DUAL_USE,
+    title_prefix="NHS: ",
+    categories={
+        "medical_devices": (
+            "Advanced Patient Monitoring Systems for Critical Care",
+            "Portable Diagnostic Equipment for Emergency Response",
+            "Surgical Robotics System Enhancement Programme",
+            "Medical Imaging AI Enhancement Platform",
+            "Point-of-Care Testing Device Procurement",
+            "Advanced Life Support Equipment Upgrade",
+            "Medical Device Cybersecurity Enhancement Programme",
+            # SME-friendly smaller medical contracts
+            "Mobile Medical Apps for Emergency Responders",
+            "Basic Patient Monitoring Software",
+            "Medical Equipment Maintenance Tracking System",
+            "Simple Diagnostic Tool Development",
+            "Medical Data Analytics Platform",
+            "Healthcare IoT Sensor Development",
+            "Medical Training Simulation Software",
+            "Patient Record Management System"
+        ),
+        "emergency_response": (
+            "Mass Casualty Event Response Equipment",
+            "Emergency Medical Services Communication Systems",
+            "Hazmat Detection and Decontamination Systems",
+            "Emergency Department Workflow Management Platform",
+            "Ambulance Technology Upgrade Programme",
+            "Emergency Response Coordination Software",
+            "Crisis Communication Platform for Healthcare",
+            # SME emergency response opportunities
+            "Emergency Response Mobile Application",
+            "Basic First Aid Training Software",
+            "Emergency Equipment Tracking System",
+            "Simple Crisis Communication Tool",
+            "Emergency Vehicle GPS Tracking",
+            "Basic Emergency Planning Software"
+        ),
+        "digital_health": (
+            "AI-Powered Medical Decision Support System",
+            "Secure Healthcare Data Exchange Platform",
+            "Telemedicine Infrastructure Expansion Programme",
+            "Electronic Health Record System Enhancement",
+            "Healthcare IoT Security Implementation",
+            "Medical Research Data Analytics Platform"
+        ),
+        "biotechnology": (
+            "Advanced Laboratory Equipment Procurement",
+            "Biological Sample Analysis Automation System",
+            "Genomic Sequencing Platform Enhancement",
+            "Biocontainment Laboratory Equipment Upgrade",
+            "Pharmaceutical Manufacturing Technology",
+            "Medical Research Computing Infrastructure"
+        )
+    },
+    contracting_bodies=(
+        "NHS Supply Chain", "NHS Digital", "NHS England", "NHS Improvement",
+        "Public Health England", "Medicines and Healthcare products Regulatory Agency",
+        "National Institute for Health Research", "NHS Business Services Authority"
+    ),
+    # Category-specific value ranges with more SME-friendly options
+    value_ranges={
+        "medical_devices": (20000, 3000000),    # Wide range including small apps
+        "emergency_response": (30000, 8000000), # Mix of small and large
+        "digital_health": (15000, 2000000),     # Mostly SME-friendly
+        "biotechnology": (50000, 5000000)       # Research + development mix
+    },
+    default_value_range=(1000000, 20000000),
+    deadline_days=(45, 120),
+    url_prefix="https://www.supplychain.nhs.uk/news-and-events/procurement-opportunities/",
+    url_ids=(1000, 9999),
+    procurement_type="Medical Equipment Procurement",
+    summary_template="Procurement of {title} for NHS use with potential applications in {detail}. Requirements include ruggedized design, security compliance, and interoperability standards.",
+    # Enhanced summaries with dual-use emphasis
+    summary_details={
+        "medical_devices": "field hospitals, combat medical operations, and emergency response scenarios",
+        "emergency_response": "disaster response, homeland security, and military emergency operations",
+        "digital_health": "military medical systems, field diagnostics, and remote patient care",
+        "biotechnology": "biological threat detection, medical countermeasures, and research applications"
+    },
+    default_summary_detail="emergency and security applications",
+    tech_tags=("Medical Technology", "Dual-Use", "{title}"),
+    keywords=("medical", "dual-use", "{label}")
+)
+
+# Comprehensive Home Office categories
+SPEC_HOME_OFFICE = SourceSpec(
+    source="Home Office",
+    source_type=SourceType.UK_SECURITY,
+    title_prefix="Home Office: ",
+    categories={
+        "border_security": (
+            "Next-Generation Border Control Biometric Systems",
+            "Advanced Passenger Information Analysis Platform",
+            "Automated Border Crossing Technology Upgrade",
+            "Immigration Document Verification AI System",
+            "Cross-Border Criminal Intelligence Platform",
+            "Port Security Integrated Surveillance Network",
+            "Advanced Baggage Screening Technology",
+            "Maritime Border Surveillance Enhancement"
+        ),
+        "counter_terrorism": (
+            "National Counter-Terrorism Surveillance Network",
+            "Advanced Threat Assessment AI Platform",
+            "Multi-Modal Biometric Identification System",
+            "Social Media Intelligence Analysis Tool",
+            "Explosive Detection Technology Enhancement",
+            "Counter-Terrorism Communication Interception Platform",
+            "Predictive Analytics for Threat Prevention",
+            "Real-Time Intelligence Fusion Centre Technology"
+        ),
+        "cyber_crime": (
+            "Digital Forensics Laboratory Equipment Upgrade",
+            "Cryptocurrency Investigation Platform",
+            "Dark Web Monitoring and Analysis System",
+            "Child Exploitation Investigation Technology",
+            "Cyber Crime Evidence Management Platform",
+            "Advanced Malware Analysis Laboratory",
+            "International Cyber Crime Coordination System"
+        ),
+        "emergency_services": (
+            "National Emergency Communication Network Upgrade",
+            "Emergency Services Command and Control Platform",
+            "Crisis Management Information System",
+            "Emergency Response Resource Optimization Platform",
+            "Public Warning System Enhancement",
+            "Emergency Services Interoperability Platform",
+            "Disaster Response Coordination Technology"
+        ),
+        "law_enforcement": (
+            "National Police Database Integration Platform",
+            "Advanced Crime Analytics and Prediction System",
+            "Police Body-Worn Camera Technology Upgrade",
+            "Evidence Management System Enhancement",
+            "Firearms Licensing System Modernization",
+            "Police Vehicle Technology Integration Platform"
+        )
+    },
+    contracting_bodies=(
+        "Home Office", "Border Force", "Immigration Enforcement",
+        "National Crime Agency", "UK Visas and Immigration",
+        "Emergency Services Mobile Communications Programme",
+        "Office for Security and Counter-Terrorism"
+    ),
+    # Category-specific value ranges
+    value_ranges={
+        "border_security": (10000000, 75000000),
+        "counter_terrorism": (15000000, 100000000),
+        "cyber_crime": (5000000, 30000000),
+        "emergency_services": (20000000, 150000000),
+        "law_enforcement": (8000000, 45000000)
+    },
+    default_value_range=(5000000, 50000000),
+    deadline_days=(60, 180),
+    url_prefix="https://www.gov.uk/government/organisations/home-office/about/procurement/contract-",
+    url_ids=(10000, 99999),
+    procurement_type="Security Technology Procurement",
+    # Enhanced summaries with security emphasis
+    summary_template="Procurement and implementation of {title} featuring advanced security protocols, real-time processing capabilities, and integration with existing government systems. Requires security clearance and compliance with government security standards.",
+    tech_tags=("Security Technology", "{title}", "Government"),
+    keywords=("security", "surveillance", "{label}")
+)
+
+# Comprehensive space technology categories
+SPEC_SPACE = SourceSpec(
+    source="UK Space Agency",
+    source_type=SourceType.UK_SPACE,
+    title_prefix="UK Space Agency: ",
+    categories={
+        "earth_observation": (
+            "Next-Generation SAR Satellite Constellation",
+            "Hyperspectral Imaging Satellite Development",
+            "Real-Time Earth Observation Data Processing Platform",
+            "Maritime Domain Awareness Satellite Programme",
+            "Agricultural and Environmental Monitoring Constellation",
+            "Climate Change Monitoring Satellite System",
+            "Disaster Response Earth Observation Platform"
+        ),
+        "communications": (
+            "Quantum-Secure Satellite Communication Network",
+            "Military Satellite Communication Constellation",
+            "Emergency Services Satellite Communication Platform",
+            "Inter-Satellite Communication Technology Development",
+            "Ground Station Network Enhancement Programme",
+            "Satellite Internet for Remote Areas Project"
+        ),
+        "navigation": (
+            "Alternative Position Navigation and Timing System",
+            "GPS Resilience Enhancement Programme",
+            "Quantum Navigation Technology Development",
+            "Indoor Navigation System Development",
+            "Critical Infrastructure Timing Protection System"
+        ),
+        "space_situational_awareness": (
+            "Space Debris Tracking Network Enhancement",
+            "Space Weather Monitoring Satellite System",
+            "Space Domain Awareness Data Fusion Platform",
+            "Active Debris Removal Technology Development",
+            "Space Traffic Management System"
+        ),
+        "manufacturing": (
+            "In-Orbit Manufacturing Technology Demonstrator",
+            "Satellite Servicing and Refueling Platform",
+            "3D Printing in Space Technology Development",
+            "Orbital Assembly and Construction System",
+            "Space-Based Solar Power Technology Programme"
+        ),
+        "exploration": (
+            "Lunar Resource Utilization Technology Programme",
+            "Mars Sample Return Mission Technology",
+            "Deep Space Communication Technology",
+            "Space Habitat Technology Development",
+            "Asteroid Mining Technology Demonstrator"
+        )
+    },
+    contracting_bodies=(
+        "UK Space Agency", "European Space Agency (UK)",
+        "Satellite Applications Catapult", "RAL Space",
+        "University of Surrey Space Centre", "Open University Space Research"
+    ),
+    # Category-specific value ranges
+    value_ranges={
+        "earth_observation": (25000000, 200000000),
+        "communications": (50000000, 300000000),
+        "navigation": (30000000, 150000000),
+        "space_situational_awareness": (15000000, 100000000),
+        "manufacturing": (20000000, 80000000),
+        "exploration": (40000000, 250000000)
+    },
+    default_value_range=(20000000, 100000000),
+    deadline_days=(120, 365),
+    url_prefix="https://www.gov.uk/government/organisations/uk-space-agency/about/procurement/programme-",
+    url_ids=(1000, 9999),
+    procurement_type="Space Technology Programme",
+    summary_template="Development and deployment of {title} with applications for {detail}. Programme includes ground segment development, mission operations, and technology transfer opportunities.",
+    # Enhanced summaries with space defence emphasis
+    summary_details={
+        "earth_observation": "intelligence gathering, surveillance, and reconnaissance operations",
+        "communications": "secure military communications and command and control",
+        "navigation": "resilient positioning for military operations and critical infrastructure",
+        "space_situational_awareness": "space domain protection and threat assessment",
+        "manufacturing": "on-orbit assembly of defence assets and space infrastructure",
+        "exploration": "extended range operations and space resource security"
+    },
+    default_summary_detail="space-based defence capabilities",
+    tech_tags=("Space Technology", "{title}", "Defence Space"),
+    keywords=("space", "satellite", "{label}")
+)
+
+# Comprehensive Netherlands defence categories
+SPEC_NETHERLANDS = SourceSpec(
+    source="Netherlands Defence",
+    source_type=SourceType.INTERNATIONAL_ALLIES,
+    title_prefix="Netherlands MOD: ",
+    categories={
+        "naval_systems": (
+            "Next-Generation Frigate Combat Management System",
+            "Submarine Sonar Processing Enhancement Programme",
+            "Naval Mine Countermeasures Autonomous Systems",
+            "Maritime Domain Awareness Integration Platform",
+            "Naval Electronic Warfare Suite Upgrade",
+            "Ship-Based Air Defence System Enhancement",
+            "Naval Communication System Modernization"
+        ),
+        "land_systems": (
+            "Infantry Fighting Vehicle Modernization Programme",
+            "Advanced Battle Management System Development",
+            "Soldier Modernization Technology Programme",
+            "Military Vehicle Autonomous Navigation System",
+            "Field Artillery Fire Control System Upgrade",
+            "Engineering Vehicle Technology Enhancement"
+        ),
+        "air_systems": (
+            "F-35 Lightning II Netherlands Specific Modifications",
+            "Air Defence Radar System Enhancement",
+            "Military Aircraft Communication System Upgrade",
+            "Unmanned Aerial System Integration Programme",
+            "Air Traffic Management System for Military Airspace",
+            "Aircraft Maintenance Predictive Analytics Platform"
+        ),
+        "cyber_security": (
+            "National Cyber Defence Operations Centre",
+            "Military Network Security Enhancement Programme",
+            "Cyber Threat Intelligence Sharing Platform",
+            "Critical Infrastructure Protection System",
+            "Secure Military Communications Network",
+            "Cyber Range Training Environment Development"
+        ),
+        "joint_operations": (
+            "Multi-Domain Operations Command System",
+            "Joint Intelligence Analysis Platform",
+            "NATO Interoperability Enhancement Programme",
+            "Coalition Operations Communication System",
+            "Joint Logistics Management Platform",
+            "International Mission Support System"
+        )
+    },
+    contracting_bodies=(
+        "Netherlands Ministry of Defence",
+        "Royal Netherlands Navy",
+        "Royal Netherlands Army",
+        "Royal Netherlands Air Force",
+        "Defence Materiel Organisation (DMO)",
+        "Netherlands Defence Academy"
+    ),
+    # Category-specific value ranges (Netherlands defence budget context)
+    value_ranges={
+        "naval_systems": (20000000, 150000000),
+        "land_systems": (15000000, 100000000),
+        "air_systems": (25000000, 200000000),
+        "cyber_security": (10000000, 75000000),
+        "joint_operations": (30000000, 120000000)
+    },
+    default_value_range=(10000000, 100000000),
+    deadline_days=(90, 240),
+    url_prefix="https://www.defensie.nl/onderwerpen/inkoop/aanbestedingen/",
+    url_ids=(1000, 9999),
+    procurement_type="Defence Procurement",
+    # Enhanced summaries with NATO interoperability emphasis
+    summary_template="Procurement and development of {title} for the Netherlands Armed Forces. Requirements include NATO interoperability, cyber resilience, and integration with allied systems. International partnership opportunities available for qualified suppliers.",
+    country="Netherlands",
+    tech_tags=("NATO Alliance", "{title}", "International"),
+    keywords=("netherlands", "nato", "{label}")
+)
+
+# Comprehensive university research categories
+UNIVERSITY_RESEARCH = MappingProxyType({
+    "Imperial College London": MappingProxyType({
+        "areas": ("AI for Defence", "Quantum Technologies", "Advanced Materials", "Space Technology"),
+        "programmes": (
+            "AI Ethics in Autonomous Weapons Systems Research",
+            "Quantum Communication Network Development",
+            "Advanced Composite Materials for Aerospace",
+            "Space Debris Mitigation Technology Research"
+        )
+    }),
+    "University of Cambridge": MappingProxyType({
+        "areas": ("Computer Science", "Engineering", "Physics", "Mathematics"),
+        "programmes": (
+            "Machine Learning for Intelligence Analysis",
+            "Autonomous Systems for Hazardous Environments",
+            "Quantum Computing for Cryptography",
+            "Adaptive Structures for Aerospace Applications"
+        )
+    }),
+    "Cranfield University": MappingProxyType({
+        "areas": ("Aerospace", "Defence Technology", "Systems Engineering"),
+        "programmes": (
+            "Future Combat Air System Technology Development",
+            "Unmanned Aircraft Systems Integration Research",
+            "Defence Systems Engineering Innovation Programme",
+            "Aerospace Materials and Manufacturing Research"
+        )
+    }),
+    "University College London": MappingProxyType({
+        "areas": ("Cyber Security", "AI", "Engineering", "Medical Physics"),
+        "programmes": (
+            "Cyber Security for Critical Infrastructure",
+            "AI for Medical Applications in Defence",
+            "Human-Computer Interaction in Military Systems",
+            "Medical Physics for Combat Medicine"
+        )
+    }),
+    "University of Edinburgh": MappingProxyType({
+        "areas": ("Informatics", "Engineering", "Physics", "Data Science"),
+        "programmes": (
+            "Natural Language Processing for Intelligence",
+            "Robotics for Search and Rescue Operations",
+            "Sensor Networks for Environmental Monitoring",
+            "Data Science for National Security"
+        )
+    }),
+    "University of Surrey": MappingProxyType({
+        "areas": ("Space Technology", "Electronics", "Communications"),
+        "programmes": (
+            "Small Satellite Technology Development",
+            "Space Weather Monitoring Systems",
+            "Satellite Communication Security Research",
+            "Ground Segment Technology Innovation"
+        )
+    }),
+    "University of Bath": MappingProxyType({
+        "areas": ("Materials Science", "Engineering", "Computer Science"),
+        "programmes": (
+            "Smart Materials for Defence Applications",
+            "Additive Manufacturing for Aerospace",
+            "Biomimetic Systems for Military Use",
+            "Sustainable Materials for Defence Industry"
+        )
+    }),
+    "King's College London": MappingProxyType({
+        "areas": ("Defence Studies", "Security", "Policy Research"),
+        "programmes": (
+            "Defence Policy and Strategy Research",
+            "International Security Studies Programme",
+            "Conflict Resolution Technology Research",
+            "Military Ethics and AI Research"
+        )
+    })
+})
+
+def _university_entries(university: str, details: Mapping) -> Tuple[str, Tuple[str, ...], Tuple[Tuple[str, str], ...]]:
+    """URL prefix, shared tech_tags and (title, summary) rows for one university, evaluated once at import"""
+    programmes = details["programmes"]
+    host = university.lower().replace(' ', '').replace('university', 'ac.uk').replace('of', '').replace('college', '')
+    # Enhanced research programme summaries
+    rows = tuple(
+        (
+            f"{university}: {programme}",
+            f"Multi-year research partnership programme for {programme.lower()} at {university}. Collaboration includes industry partners, government agencies, and international research institutions. Programme offers IP licensing opportunities and technology transfer pathways."
+        )
+        for programme in programmes
+    )
+    return f"https://www.{host}/research/defence/", ("Academic Research", "Innovation", *details["areas"]), rows
+
+UNIVERSITY_ENTRIES = MappingProxyType({
+    university: _university_entries(university, details)
+    for university, details in UNIVERSITY_RESEARCH.items()
+})
+
+# Keywords shared by every university partnership record
+UNIVERSITY_KEYWORDS = ("research", "university", "partnership")
 
 class UltraEnhancedCollector:
     """Ultra enhanced collector for 100% coverage"""
     
     # Comprehensive search terms for maximum coverage
-    COMPREHENSIVE_SEARCH_TERMS = [
+    COMPREHENSIVE_SEARCH_TERMS = (
         # Core Military Terms
         "defence", "defense", "military", "armed forces", "mod", "ministry of defence",
         "royal navy", "british army", "royal air force", "raf", "royal marines",
@@ -115,10 +1058,10 @@ class UltraEnhancedCollector:
         "combat medical", "trauma care", "field hospital", "medical equipment",
         "logistics systems", "supply chain", "maintenance systems",
         "training systems", "simulation", "virtual reality", "augmented reality"
-    ]
+    )
     
     # Defence-specific CPV codes for procurement searches
-    DEFENCE_CPV_CODES = [
+    DEFENCE_CPV_CODES = (
         "35000000",  # Defence equipment
         "35100000",  # Military equipment
         "35200000",  # Military vehicles
@@ -132,35 +1075,96 @@ class UltraEnhancedCollector:
         "80000000",  # Education and training services
         "92000000",  # Recreation, cultural and sporting services
         "98000000",  # Other community, social and personal services
-    ]
+    )
     
     def __init__(self):
-        self.session = None
+        self.fts_client = None
+        self.response_cache = None
+        self.parse_pool = None
         self.opportunities = []
-        self.seen_hashes = set()
+        self.seen_hashes = ScalableBloomFilter()
+        self.rate_limiter = DomainRateLimiter()
+    
+    async def __aenter__(self):
+        try:
+            # Every Find a Tender query hits one host, so multiplex them over one HTTP/2 connection
+            self.fts_client = httpx.AsyncClient(
+                http2=True,
+                headers=DEFAULT_HEADERS,
+                timeout=httpx.Timeout(30, connect=10),
+                limits=httpx.Limits(max_connections=32),
+                # _fetch_and_parse_fts only keeps 200s, so a redirected query must be followed
+                follow_redirects=True
+            )
+            # Opening the cache prunes expired rows, so it runs off the loop like every other cache call
+            self.response_cache = await asyncio.to_thread(ResponseCache)
+        except BaseException:
+            await self._close()
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._close()
+    
+    async def _close(self):
+        """Release whatever __aenter__ and the Find a Tender search opened"""
+        if self.fts_client is not None:
+            await self.fts_client.aclose()
+            self.fts_client = None
+        if self.response_cache is not None:
+            await asyncio.to_thread(self.response_cache.close)
+            self.response_cache = None
+        if self.parse_pool is not None:
+            # Joining the workers blocks, so it happens off the loop
+            await asyncio.to_thread(self.parse_pool.shutdown)
+            self.parse_pool = None
     
     async def collect_ultra_enhanced_all(self) -> List[OpportunityData]:
         """Ultra enhanced collection from all sources with 100% coverage"""
         logger.info("🚀 Starting ULTRA ENHANCED Collection (100% Coverage)...")
         
-        all_opportunities = []
-        
-        # Ultra enhanced UK sources
-        all_opportunities.extend(await self.ultra_enhanced_find_a_tender())
-        all_opportunities.extend(await self.ultra_enhanced_contracts_finder())
-        all_opportunities.extend(await self.ultra_enhanced_digital_marketplace())
-        all_opportunities.extend(await self.ultra_enhanced_dasa())
-        all_opportunities.extend(await self.ultra_enhanced_nhs_supply_chain())
-        all_opportunities.extend(await self.ultra_enhanced_home_office())
-        all_opportunities.extend(await self.ultra_enhanced_space_agency())
-        all_opportunities.extend(await self.ultra_enhanced_universities())
-        
-        # Ultra enhanced international
-        all_opportunities.extend(await self.ultra_enhanced_netherlands_defence())
+        # Find a Tender spends most of its time waiting on the network; gathering lets the
+        # catalogue generators run on the loop (and Contracts Finder / Digital Marketplace in
+        # their worker threads) meanwhile. seen_hashes is only touched from the event loop
+        # thread, so it needs no lock
+        results = await asyncio.gather(
+            # Ultra enhanced UK sources
+            self.ultra_enhanced_find_a_tender(),
+            self.ultra_enhanced_contracts_finder(),
+            self.ultra_enhanced_digital_marketplace(),
+            self.ultra_enhanced_dasa(),
+            self.ultra_enhanced_nhs_supply_chain(),
+            self.ultra_enhanced_home_office(),
+            self.ultra_enhanced_space_agency(),
+            self.ultra_enhanced_universities(),
+            # Ultra enhanced international
+            self.ultra_enhanced_netherlands_defence()
+        )
+        all_opportunities = [opportunity for source_opportunities in results for opportunity in source_opportunities]
         
         logger.info(f"✅ Ultra Enhanced Collection Complete: {len(all_opportunities)} opportunities")
         return all_opportunities
     
+    async def stream_ultra_enhanced_all(self) -> AsyncIterator[OpportunityData]:
+        """Yield opportunities source by source so callers can persist them without holding the full set"""
+        # Ultra enhanced UK sources; the scraped ones are deduplicated as a batch, the
+        # catalogue-driven ones stream record by record
+        for opportunity in await self.ultra_enhanced_find_a_tender():
+            yield opportunity
+        for opportunity in await self.ultra_enhanced_contracts_finder():
+            yield opportunity
+        for opportunity in await self.ultra_enhanced_digital_marketplace():
+            yield opportunity
+        for spec in (SPEC_DASA, SPEC_NHS, SPEC_HOME_OFFICE, SPEC_SPACE):
+            async for opportunity in self._generate(spec):
+                yield opportunity
+        async for opportunity in self._generate_universities():
+            yield opportunity
+        
+        # Ultra enhanced international
+        for opportunity in await self.ultra_enhanced_netherlands_defence():
+            yield opportunity
+    
     async def ultra_enhanced_find_a_tender(self) -> List[OpportunityData]:
         """Ultra enhanced Find a Tender with comprehensive search and CPV codes"""
         opportunities = []
@@ -171,1155 +1175,510 @@ class UltraEnhancedCollector:
         # Add CPV code searches
         cpv_searches = self.DEFENCE_CPV_CODES[:8]
         
-        try:
-            async with aiohttp.ClientSession() as session:
-                # Search by keywords
-                for term in search_terms:
-                    try:
-                        search_url = f"https://www.find-tender.service.gov.uk/Search/Results?Keywords={quote(term)}&Sort=1"
-                        
-                        headers = {
-                            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
-                        }
-                        
-                        async with session.get(search_url, headers=headers) as response:
-                            if response.status == 200:
-                                html = await response.text()
-                                opportunities.extend(await self._parse_fts_results(html, search_url, term))
-                        
-                        await asyncio.sleep(1)  # Respectful delay
-                        
-                    except Exception as e:
-                        logger.warning(f"Error searching FTS for '{term}': {e}")
-                        continue
-                
-                # Search by CPV codes
-                for cpv in cpv_searches:
-                    try:
-                        cpv_url = f"https://www.find-tender.service.gov.uk/Search/Results?CPV={cpv}&Sort=1"
-                        
-                        async with session.get(cpv_url, headers=headers) as response:
-                            if response.status == 200:
-                                html = await response.text()
-                                opportunities.extend(await self._parse_fts_results(html, cpv_url, f"CPV-{cpv}"))
-                        
-                        await asyncio.sleep(1)
-                        
-                    except Exception as e:
-                        logger.warning(f"Error searching FTS for CPV '{cpv}': {e}")
-                        continue
-        
-        except Exception as e:
-            logger.error(f"Error in ultra enhanced FTS: {e}")
-        
-        logger.info(f"Ultra Enhanced Find a Tender collected {len(opportunities)} opportunities")
-        return opportunities
-    
-    async def _parse_fts_results(self, html: str, base_url: str, search_term: str) -> List[OpportunityData]:
-        """Parse Find a Tender results with enhanced extraction"""
-        opportunities = []
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Look for various possible result containers
-        result_selectors = [
-            'div.search-result',
-            'article.opportunity',
-            'div.notice',
-            'div.tender-result',
-            '.search-results .result'
+        # Keyword and CPV searches are fetched concurrently; the semaphore and per-domain
+        # limiter keep the request rate polite
+        queries = [
+            (f"https://www.find-tender.service.gov.uk/Search/Results?Keywords={quote(term)}&Sort=1", term)
+            for term in search_terms
+        ] + [
+            (f"https://www.find-tender.service.gov.uk/Search/Results?CPV={cpv}&Sort=1", f"CPV-{cpv}")
+            for cpv in cpv_searches
         ]
         
-        results = []
-        for selector in result_selectors:
-            found = soup.select(selector)
-            if found:
-                results = found
-                break
+        if self.parse_pool is None:
+            # Spawned (not forked) workers so each seeds its own random fallbacks; never more
+            # workers than pages to parse
+            self.parse_pool = ProcessPoolExecutor(
+                max_workers=min(os.cpu_count() or 1, len(queries)),
+                mp_context=multiprocessing.get_context('spawn')
+            )
         
-        # Fallback to any div with relevant classes
-        if not results:
-            results = soup.find_all('div', class_=re.compile(r'(result|opportunity|notice|tender)'))
+        semaphore = asyncio.Semaphore(FTS_MAX_CONCURRENCY)
+        results = await asyncio.gather(
+            *[self._fetch_and_parse_fts(url, term, semaphore) for url, term in queries],
+            return_exceptions=True
+        )
         
-        for result in results[:25]:  # Increased limit per search
-            try:
-                # Extract title
-                title_elem = result.find('a', href=True) or result.find(['h2', 'h3', 'h4'])
-                if not title_elem:
-                    continue
-                
-                title = title_elem.get_text(strip=True)
-                if len(title) < 10 or title in [r.title for r in opportunities]:
-                    continue
-                
-                # Extract link
-                link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                if link and not link.startswith('http'):
-                    link = urljoin(base_url, link)
-                
-                # Enhanced summary extraction
-                summary_selectors = [
-                    'p.description', 'div.summary', 'p.content',
-                    '.description', '.summary', '.excerpt'
-                ]
-                summary = ""
-                for selector in summary_selectors:
-                    elem = result.select_one(selector)
-                    if elem:
-                        summary = elem.get_text(strip=True)
-                        break
-                
-                if not summary:
-                    # Fallback to any paragraph
-                    p_elem = result.find('p')
-                    summary = p_elem.get_text(strip=True) if p_elem else f"Find a Tender opportunity: {title}"
-                
-                # Enhanced authority extraction
-                authority_selectors = [
-                    'span.authority', 'div.organisation', 'span.buyer',
-                    '.authority', '.organisation', '.contracting-authority'
-                ]
-                authority = ""
-                for selector in authority_selectors:
-                    elem = result.select_one(selector)
-                    if elem:
-                        authority = elem.get_text(strip=True)
-                        break
-                
-                if not authority:
-                    authority = "UK Government Agency"
-                
-                # Enhanced deadline extraction
-                deadline_selectors = [
-                    'time', 'span.deadline', 'div.closing-date',
-                    '.deadline', '.closing-date', '.date'
-                ]
-                deadline = None
-                for selector in deadline_selectors:
-                    elem = result.select_one(selector)
-                    if elem:
-                        deadline = self._parse_deadline(elem.get_text(strip=True))
-                        if deadline:
-                            break
-                
-                if not deadline:
-                    deadline = datetime.now() + timedelta(days=random.randint(30, 90))
-                
-                # Enhanced value extraction
-                value_selectors = [
-                    'span.value', 'div.amount', 'span.budget',
-                    '.value', '.amount', '.budget', '.contract-value'
-                ]
-                value_estimate = None
-                for selector in value_selectors:
-                    elem = result.select_one(selector)
-                    if elem:
-                        value_estimate = self._extract_value(elem.get_text(strip=True))
-                        if value_estimate:
-                            break
-                
-                if not value_estimate:
-                    value_estimate = float(random.randint(500000, 15000000))
-                
-                # Extract CPV codes if present
-                cpv_codes = []
-                cpv_elem = result.find(text=re.compile(r'CPV:?\s*(\d{8})'))
-                if cpv_elem:
-                    cpv_match = re.search(r'(\d{8})', cpv_elem)
-                    if cpv_match:
-                        cpv_codes.append(cpv_match.group(1))
-                
-                opportunity = OpportunityData(
-                    title=title[:200],
-                    summary=summary[:500],
-                    contracting_body=authority,
-                    source="Find a Tender Service",
-                    source_type=SourceType.UK_OFFICIAL,
-                    deadline=deadline,
-                    url=link or base_url,
-                    value_estimate=value_estimate,
-                    procurement_type="Public Sector Tender",
-                    cpv_codes=cpv_codes,
-                    keywords_matched=[search_term]
-                )
-                
-                # Avoid duplicates
-                if opportunity.content_hash not in self.seen_hashes:
-                    opportunities.append(opportunity)
-                    self.seen_hashes.add(opportunity.content_hash)
-                
-            except Exception as e:
-                logger.warning(f"Error parsing FTS result: {e}")
+        for (url, term), result in zip(queries, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Error searching FTS for '{term}': {result}")
                 continue
+            opportunities.extend(result)
         
+        logger.info(f"Ultra Enhanced Find a Tender collected {len(opportunities)} opportunities")
         return opportunities
     
-    async def ultra_enhanced_contracts_finder(self) -> List[OpportunityData]:
-        """Ultra enhanced Contracts Finder with real contract patterns"""
-        opportunities = []
+    async def _fetch_and_parse_fts(self, url: str, search_term: str, semaphore: asyncio.Semaphore) -> List[OpportunityData]:
+        """Fetch one Find a Tender results page (or its cached copy) and parse it"""
+        html = await asyncio.to_thread(self.response_cache.get, url)
+        if html is None:
+            async with semaphore:
+                await self.rate_limiter.wait(urlparse(url).netloc)
+                response = await self.fts_client.get(url)
+                if response.status_code != 200:
+                    return []
+                # Raw bytes go straight to lxml, which detects the encoding itself
+                html = response.content
+            await asyncio.to_thread(self.response_cache.set, url, html)
         
-        # Enhanced realistic contract patterns based on actual CF structure
-        contract_categories = {
-            "ai_technology": [
-                "AI-Enhanced Battlefield Intelligence Analysis Platform",
-                "Machine Learning for Predictive Equipment Maintenance",
-                "Computer Vision System for Automated Threat Recognition",
-                "Natural Language Processing for Intelligence Document Analysis",
-                "Deep Learning Platform for Cyber Threat Prediction",
-                "AI-Powered Logistics Optimization for Military Supply Chains",
-                "Autonomous Decision Support System for Command Operations"
-            ],
-            "cyber_security": [
-                "Next-Generation Firewall for Defence Networks",
-                "Zero Trust Architecture Implementation for MOD Systems",
-                "Quantum-Resistant Cryptography Migration Programme",
-                "Advanced Persistent Threat Detection Platform",
-                "Secure Multi-Domain Operations Communications Hub",
-                "Cyber Range Training Environment Development",
-                "Industrial Control Systems Security Enhancement"
-            ],
-            "space_defence": [
-                "Space Situational Awareness Sensor Network",
-                "Satellite Communication Resilience Enhancement",
-                "Space-Based Earth Observation Intelligence Platform",
-                "Anti-Jamming GPS Technology Development",
-                "In-Orbit Servicing Robotic System Development",
-                "Space Debris Tracking and Mitigation System"
-            ],
-            "maritime_systems": [
-                "Next-Generation Sonar Processing System",
-                "Maritime Autonomous Surface Vehicle Development",
-                "Underwater Communications Network Infrastructure",
-                "Port Security Integrated Surveillance Platform",
-                "Naval Combat Management System Upgrade",
-                "Maritime Domain Awareness AI Platform"
-            ],
-            "medical_trauma": [
-                "Combat Casualty Care Mobile Application Suite",
-                "Advanced Trauma Simulation Training System",
-                "Remote Patient Monitoring for Deployed Forces",
-                "Blood Products Preservation Technology Enhancement",
-                "Telemedicine Platform for Forward Operating Bases",
-                "Medical Equipment Predictive Maintenance System"
-            ]
-        }
+        # Pages that cannot match any result selector skip the parse and the trip to the pool
+        if not any(marker in html for marker in FTS_RESULT_MARKERS):
+            return []
         
-        authorities = [
-            "Defence Equipment & Support (DE&S)",
-            "Ministry of Defence",
-            "Royal Navy",
-            "British Army",
-            "Royal Air Force",
-            "Defence Science and Technology Laboratory",
-            "Defence Digital",
-            "Joint Forces Command",
-            "Strategic Command",
-            "UK Hydrographic Office"
-        ]
-        
-        for category, contracts in contract_categories.items():
-            for contract_title in contracts:
-                try:
-                    # Generate realistic contract details
-                    authority = random.choice(authorities)
-                    deadline = datetime.now() + timedelta(days=random.randint(45, 150))
-                    
-                    # Category-specific value ranges with SME focus
-                    value_ranges = {
-                        "ai_technology": (50000, 2500000),      # SME-friendly AI contracts
-                        "cyber_security": (75000, 3500000),    # SME cyber security
-                        "space_defence": (100000, 15000000),   # Some large, some SME
-                        "maritime_systems": (200000, 25000000), # Mix of sizes
-                        "medical_trauma": (25000, 1500000)     # Mostly SME-sized medical
-                    }
-                    
-                    min_val, max_val = value_ranges.get(category, (1000000, 20000000))
-                    value_estimate = float(random.randint(min_val, max_val))
-                    
-                    # Enhanced summaries
-                    summary_templates = {
-                        "ai_technology": f"Development and implementation of {contract_title.lower()} with advanced machine learning algorithms, real-time processing capabilities, and integration with existing defence systems.",
-                        "cyber_security": f"Procurement and deployment of {contract_title.lower()} featuring advanced threat detection, automated response capabilities, and compliance with defence security standards.",
-                        "space_defence": f"Design and delivery of {contract_title.lower()} incorporating cutting-edge space technology, ground segment integration, and operational resilience.",
-                        "maritime_systems": f"Development of {contract_title.lower()} with enhanced naval capabilities, interoperability with allied systems, and advanced sensor integration.",
-                        "medical_trauma": f"Implementation of {contract_title.lower()} designed for military medical applications, field deployment, and integration with combat medical protocols."
-                    }
-                    
-                    summary = summary_templates.get(category, f"Procurement of {contract_title.lower()} for defence applications.")
-                    
-                    opportunity = OpportunityData(
-                        title=contract_title,
-                        summary=summary,
-                        contracting_body=authority,
-                        source="Contracts Finder",
-                        source_type=SourceType.UK_OFFICIAL,
-                        deadline=deadline,
-                        url=f"https://www.contractsfinder.service.gov.uk/notice/{random.randint(1000000, 9999999)}",
-                        value_estimate=value_estimate,
-                        procurement_type="Defence Contract",
-                        tech_tags=[category.replace("_", " ").title()],
-                        keywords_matched=[category.replace("_", " ")]
-                    )
-                    
-                    if opportunity.content_hash not in self.seen_hashes:
-                        opportunities.append(opportunity)
-                        self.seen_hashes.add(opportunity.content_hash)
-                
-                except Exception as e:
-                    logger.warning(f"Error generating CF contract: {e}")
-                    continue
+        # lxml parsing is CPU-bound, so it runs in the worker pool while other pages download
+        loop = asyncio.get_running_loop()
+        parsed = await loop.run_in_executor(self.parse_pool, _parse_fts_results_sync, html, url, search_term)
+        return self._keep_unseen(parsed)
+    
+    async def ultra_enhanced_contracts_finder(self) -> List[OpportunityData]:
+        """Ultra enhanced Contracts Finder with real contract patterns"""
+        # Pure CPU work, so build the records off the event loop
+        generated = await asyncio.to_thread(self._generate_contracts_finder)
+        opportunities = self._keep_unique(generated)
         
         logger.info(f"Ultra Enhanced Contracts Finder collected {len(opportunities)} opportunities")
         return opportunities
     
-    async def ultra_enhanced_digital_marketplace(self) -> List[OpportunityData]:
-        """Ultra enhanced Digital Marketplace covering all lots and categories"""
+    def _keep_unseen(self, generated: List[OpportunityData]) -> List[OpportunityData]:
+        """Drop opportunities whose content hash was already collected, recording the rest"""
         opportunities = []
+        for opportunity in generated:
+            if self.seen_hashes.add(opportunity.content_hash):
+                opportunities.append(opportunity)
+        return opportunities
+    
+    @staticmethod
+    def _keep_unique(generated: List[OpportunityData]) -> List[OpportunityData]:
+        """Dedup a generated batch on (title, contracting body).
         
-        # Comprehensive G-Cloud and DOS opportunities
-        digital_categories = {
-            "g_cloud_software": [
-                "AI-Powered Threat Intelligence Platform (G-Cloud 13)",
-                "Quantum-Safe Encryption Software Suite (G-Cloud 13)",
-                "Military Asset Management Cloud Platform (G-Cloud 13)",
-                "Secure Video Conferencing for Defence Operations (G-Cloud 13)",
-                "Automated Vulnerability Assessment Tool (G-Cloud 13)",
-                "Battlefield Data Analytics Platform (G-Cloud 13)",
-                "Cyber Security Incident Response Platform (G-Cloud 13)",
-                "Supply Chain Risk Management Software (G-Cloud 13)",
-                # SME-friendly smaller software contracts
-                "Military Training Mobile Application (G-Cloud 13)",
-                "Equipment Maintenance Tracking System (G-Cloud 13)",
-                "Personnel Security Clearance Management Tool (G-Cloud 13)",
-                "Incident Reporting and Analysis Software (G-Cloud 13)",
-                "Military Document Management System (G-Cloud 13)",
-                "Training Record Management Platform (G-Cloud 13)",
-                "Equipment Inventory Management App (G-Cloud 13)",
-                "Basic Cyber Security Monitoring Tool (G-Cloud 13)"
-            ],
-            "g_cloud_support": [
-                "24/7 SOC Services for Defence Networks (G-Cloud 13)",
-                "Cloud Migration Support for Legacy Defence Systems (G-Cloud 13)",
-                "DevSecOps Implementation for Military Applications (G-Cloud 13)",
-                "Managed Security Services for Classified Systems (G-Cloud 13)",
-                "Cloud Infrastructure Monitoring for MOD (G-Cloud 13)",
-                "Disaster Recovery as a Service for Defence (G-Cloud 13)",
-                # SME-friendly support services
-                "Cyber Security Consulting for Small Defence Units (G-Cloud 13)",
-                "Software Development Support for Military Apps (G-Cloud 13)",
-                "IT Support for Regional Military Facilities (G-Cloud 13)",
-                "Basic Cloud Setup for Defence Contractors (G-Cloud 13)",
-                "Security Assessment Services for SME Defence Suppliers (G-Cloud 13)"
-            ],
-            "dos_specialists": [
-                "Senior Cyber Security Architect (DOS6)",
-                "AI/ML Engineer for Defence Applications (DOS6)",
-                "Quantum Technology Researcher (DOS6)",
-                "DevSecOps Engineer for Military Systems (DOS6)",
-                "Data Scientist for Intelligence Analysis (DOS6)",
-                "Cloud Security Specialist for Defence (DOS6)",
-                # SME-friendly specialist roles
-                "Junior Software Developer for Military Apps (DOS6)",
-                "Cyber Security Analyst for Defence SMEs (DOS6)",
-                "Technical Writer for Defence Documentation (DOS6)",
-                "UX Designer for Military Interfaces (DOS6)",
-                "Data Analyst for Defence Procurement (DOS6)",
-                "IT Support Specialist for Defence Networks (DOS6)"
-            ],
-            "dos_outcomes": [
-                "AI Ethics Framework for Military AI Systems (DOS6)",
-                "Cyber Security Strategy for Next-Gen Defence Systems (DOS6)",
-                "Digital Transformation Roadmap for Defence Logistics (DOS6)",
-                "Quantum Computing Readiness Assessment (DOS6)",
-                "Zero Trust Architecture Design for MOD (DOS6)",
-                # SME-friendly smaller outcomes
-                "Mobile App Development for Military Training (DOS6)",
-                "Small-Scale Cyber Security Assessment (DOS6)",
-                "Defence Supplier Portal Development (DOS6)",
-                "Military Equipment Tracking System Design (DOS6)",
-                "Basic AI Implementation for Defence Logistics (DOS6)"
-            ]
-        }
+        Generated catalogue entries cannot share title, body and deadline with another
+        source, so these batches skip the shared content-hash filter.
+        """
+        seen = set()
+        opportunities = []
+        for opportunity in generated:
+            key = (opportunity.title, opportunity.contracting_body)
+            if key not in seen:
+                seen.add(key)
+                opportunities.append(opportunity)
+        return opportunities
+    
+    def _generate_contracts_finder(self) -> List[OpportunityData]:
+        """Build the Contracts Finder records, drawing the random fields in bulk"""
+        entries = CONTRACTS_FINDER_ENTRIES
+        n = len(entries)
+        chosen_authorities = random.choices(CONTRACTS_FINDER_AUTHORITIES, k=n)
+        deadline_offsets = random.choices(range(45, 151), k=n)
+        notice_ids = random.choices(range(1000000, 10000000), k=n)
+        # One clock read for the whole batch
+        now = datetime.now()
+        scraped_at = datetime.utcnow()
         
-        buyers = [
-            "Defence Digital", "Ministry of Defence", "Defence Equipment & Support",
-            "Defence Science and Technology Laboratory", "UK Hydrographic Office",
-            "Royal Navy", "British Army", "Royal Air Force", "Joint Forces Command"
+        return [
+            OpportunityData(
+                title=contract_title,
+                summary=CONTRACTS_FINDER_SUMMARY_TEMPLATES.get(category, "Procurement of {} for defence applications.").format(contract_title.lower()),
+                contracting_body=authority,
+                source="Contracts Finder",
+                source_type=SourceType.UK_OFFICIAL,
+                deadline=now + timedelta(days=offset),
+                url=f"https://www.contractsfinder.service.gov.uk/notice/{notice_id}",
+                value_estimate=float(random.randint(*CONTRACTS_FINDER_VALUE_RANGES.get(category, (1000000, 20000000)))),
+                procurement_type="Defence Contract",
+                tech_tags=CONTRACTS_FINDER_TAGS[category][0],
+                keywords_matched=CONTRACTS_FINDER_TAGS[category][1],
+                date_scraped=scraped_at
+            )
+            for (category, contract_title), authority, offset, notice_id
+            in zip(entries, chosen_authorities, deadline_offsets, notice_ids)
         ]
-        
-        for category, opportunities_list in digital_categories.items():
-            for opp_title in opportunities_list:
-                try:
-                    buyer = random.choice(buyers)
-                    deadline = datetime.now() + timedelta(days=random.randint(30, 90))
-                    
-                    # Category-specific details with SME focus
-                    if "g_cloud" in category:
-                        framework = "G-Cloud 13"
-                        # More realistic SME-friendly values for G-Cloud
-                        if any(term in opp_title.lower() for term in ['mobile app', 'tracking', 'management tool', 'basic']):
-                            value_range = (15000, 150000)  # Small software projects
-                        else:
-                            value_range = (50000, 800000)  # Larger but still SME-friendly
-                        proc_type = "Framework Agreement"
-                    else:
-                        framework = "DOS6"
-                        # SME-friendly specialist/outcome values
-                        if any(term in opp_title.lower() for term in ['junior', 'small-scale', 'basic', 'mobile app']):
-                            value_range = (10000, 100000)  # Small projects
-                        else:
-                            value_range = (25000, 350000)  # Medium SME projects
-                        proc_type = "Specialist Services"
-                    
-                    value_estimate = float(random.randint(*value_range))
-                    
-                    # Enhanced summaries
-                    summary = f"Procurement through {framework} for {opp_title.lower()}. Requirements include security clearance, integration with existing defence systems, and compliance with MOD technical standards."
-                    
-                    opportunity = OpportunityData(
-                        title=opp_title,
-                        summary=summary,
-                        contracting_body=buyer,
-                        source="Digital Marketplace",
-                        source_type=SourceType.UK_FRAMEWORKS,
-                        deadline=deadline,
-                        url=f"https://www.digitalmarketplace.service.gov.uk/digital-outcomes-and-specialists/opportunities/{random.randint(1000, 9999)}",
-                        value_estimate=value_estimate,
-                        procurement_type=proc_type,
-                        tech_tags=["Digital Services", framework],
-                        keywords_matched=[category.replace("_", " ")]
-                    )
-                    
-                    if opportunity.content_hash not in self.seen_hashes:
-                        opportunities.append(opportunity)
-                        self.seen_hashes.add(opportunity.content_hash)
-                
-                except Exception as e:
-                    logger.warning(f"Error generating Digital Marketplace opportunity: {e}")
-                    continue
+    
+    async def ultra_enhanced_digital_marketplace(self) -> List[OpportunityData]:
+        """Ultra enhanced Digital Marketplace covering all lots and categories"""
+        # Pure CPU work, so build the records off the event loop
+        generated = await asyncio.to_thread(self._generate_digital_marketplace)
+        opportunities = self._keep_unique(generated)
         
         logger.info(f"Ultra Enhanced Digital Marketplace collected {len(opportunities)} opportunities")
         return opportunities
     
-    async def ultra_enhanced_dasa(self) -> List[OpportunityData]:
-        """Ultra enhanced DASA with comprehensive current and pipeline competitions"""
-        opportunities = []
+    def _generate_digital_marketplace(self) -> List[OpportunityData]:
+        """Build the Digital Marketplace records, drawing the random fields in bulk"""
+        entries = DIGITAL_MARKETPLACE_ENTRIES
+        n = len(entries)
+        chosen_buyers = random.choices(DIGITAL_MARKETPLACE_BUYERS, k=n)
+        deadline_offsets = random.choices(range(30, 91), k=n)
+        listing_ids = random.choices(range(1000, 10000), k=n)
+        # One clock read for the whole batch
+        now = datetime.now()
+        scraped_at = datetime.utcnow()
         
-        # Comprehensive DASA competition themes based on actual DASA focus areas
-        dasa_competitions = {
-            "phase_1": [
-                "Autonomous Systems for Extreme Environments",
-                "AI for Multi-Domain Situational Awareness",
-                "Quantum Sensing for Navigation and Timing",
-                "Advanced Materials for Hypersonic Vehicles",
-                "Swarm Robotics for Intelligence Gathering",
-                "Synthetic Biology for Defence Manufacturing",
-                "Edge Computing for Tactical Operations",
-                "Human-Machine Teaming for Combat Operations",
-                "Directed Energy Weapons Technology",
-                "Advanced Camouflage and Concealment Systems"
-            ],
-            "phase_2": [
-                "Next-Generation Combat Aircraft Technologies",
-                "Underwater Autonomous Vehicle Swarms",
-                "Space-Based Intelligence Platform Development",
-                "AI-Enhanced Electronic Warfare Systems",
-                "Quantum Communication Networks",
-                "Advanced Battle Management Systems",
-                "Counter-Unmanned Aerial System Technologies",
-                "Future Combat Air System Digital Twin",
-                "Maritime Mine Countermeasures Innovation",
-                "Cyber-Physical Security for Critical Infrastructure"
-            ],
-            "themed_competitions": [
-                "Urban Warfare Technology Challenge",
-                "Arctic Operations Innovation Programme",
-                "Future Soldier Technology Initiative",
-                "Network Enabled Capability Enhancement",
-                "Contested Logistics Innovation Challenge",
-                "Multi-Domain Integration Technology Programme",
-                "Resilient Communications Innovation Call",
-                "Next-Generation Training Systems Challenge"
-            ]
-        }
-        
-        for phase, competitions in dasa_competitions.items():
-            for comp_title in competitions:
-                try:
-                    deadline = datetime.now() + timedelta(days=random.randint(60, 180))
-                    
-                    # Phase-specific details
-                    if phase == "phase_1":
-                        value_range = (50000, 300000)
-                        proc_type = "DASA Phase 1 Innovation Challenge"
-                        summary_prefix = "Feasibility study and proof of concept development for"
-                    elif phase == "phase_2":
-                        value_range = (300000, 2000000)
-                        proc_type = "DASA Phase 2 Development Contract"
-                        summary_prefix = "Technology demonstration and prototype development for"
-                    else:
-                        value_range = (100000, 1500000)
-                        proc_type = "DASA Themed Competition"
-                        summary_prefix = "Innovation challenge addressing"
-                    
-                    value_estimate = float(random.randint(*value_range))
-                    
-                    summary = f"{summary_prefix} {comp_title.lower()}. Open to UK industry, academia, and international partners. Focus on rapid prototyping and transition to operational capability."
-                    
-                    opportunity = OpportunityData(
-                        title=f"DASA: {comp_title}",
-                        summary=summary,
-                        contracting_body="Defence and Security Accelerator (DASA)",
-                        source="DASA",
-                        source_type=SourceType.UK_OFFICIAL,
-                        deadline=deadline,
-                        url=f"https://www.gov.uk/government/publications/dasa-{phase.replace('_', '-')}-{comp_title.lower().replace(' ', '-')}",
-                        value_estimate=value_estimate,
-                        procurement_type=proc_type,
-                        tech_tags=["Innovation", "R&D", phase.replace("_", " ").title()],
-                        keywords_matched=["innovation", "dasa", "research"]
-                    )
-                    
-                    if opportunity.content_hash not in self.seen_hashes:
-                        opportunities.append(opportunity)
-                        self.seen_hashes.add(opportunity.content_hash)
-                
-                except Exception as e:
-                    logger.warning(f"Error generating DASA opportunity: {e}")
-                    continue
+        return [
+            self._make_digital_marketplace_item(category, opp_title, buyer, offset, listing_id, now, scraped_at)
+            for (category, opp_title), buyer, offset, listing_id
+            in zip(entries, chosen_buyers, deadline_offsets, listing_ids)
+        ]
+    
+    @staticmethod
+    def _make_digital_marketplace_item(category: str, opp_title: str, buyer: str, offset: int,
+                                       listing_id: int, now: datetime, scraped_at: datetime) -> OpportunityData:
+        """Build one Digital Marketplace record from its pre-drawn random fields"""
+        # Category-specific details with SME focus
+        title_lower = opp_title.lower()
+        if "g_cloud" in category:
+            framework = "G-Cloud 13"
+            # More realistic SME-friendly values for G-Cloud
+            if any(term in title_lower for term in ['mobile app', 'tracking', 'management tool', 'basic']):
+                value_range = (15000, 150000)  # Small software projects
+            else:
+                value_range = (50000, 800000)  # Larger but still SME-friendly
+            proc_type = "Framework Agreement"
+        else:
+            framework = "DOS6"
+            # SME-friendly specialist/outcome values
+            if any(term in title_lower for term in ['junior', 'small-scale', 'basic', 'mobile app']):
+                value_range = (10000, 100000)  # Small projects
+            else:
+                value_range = (25000, 350000)  # Medium SME projects
+            proc_type = "Specialist Services"
         
-        logger.info(f"Ultra Enhanced DASA collected {len(opportunities)} opportunities")
-        return opportunities
+        tech_tags, keywords_matched = DIGITAL_MARKETPLACE_TAGS[category]
+        return OpportunityData(
+            title=opp_title,
+            summary=f"Procurement through {framework} for {title_lower}. Requirements include security clearance, integration with existing defence systems, and compliance with MOD technical standards.",
+            contracting_body=buyer,
+            source="Digital Marketplace",
+            source_type=SourceType.UK_FRAMEWORKS,
+            deadline=now + timedelta(days=offset),
+            url=f"https://www.digitalmarketplace.service.gov.uk/digital-outcomes-and-specialists/opportunities/{listing_id}",
+            value_estimate=float(random.randint(*value_range)),
+            procurement_type=proc_type,
+            tech_tags=tech_tags,
+            keywords_matched=keywords_matched,
+            date_scraped=scraped_at
+        )
+    
+    async def ultra_enhanced_dasa(self) -> List[OpportunityData]:
+        """Ultra enhanced DASA with comprehensive current and pipeline competitions"""
+        return [opportunity async for opportunity in self._generate(SPEC_DASA)]
     
     async def ultra_enhanced_nhs_supply_chain(self) -> List[OpportunityData]:
         """Ultra enhanced NHS Supply Chain with comprehensive dual-use opportunities"""
-        opportunities = []
-        
-        # Comprehensive NHS dual-use categories
-        nhs_categories = {
-            "medical_devices": [
-                "Advanced Patient Monitoring Systems for Critical Care",
-                "Portable Diagnostic Equipment for Emergency Response",
-                "Surgical Robotics System Enhancement Programme",
-                "Medical Imaging AI Enhancement Platform",
-                "Point-of-Care Testing Device Procurement",
-                "Advanced Life Support Equipment Upgrade",
-                "Medical Device Cybersecurity Enhancement Programme",
-                # SME-friendly smaller medical contracts
-                "Mobile Medical Apps for Emergency Responders",
-                "Basic Patient Monitoring Software",
-                "Medical Equipment Maintenance Tracking System",
-                "Simple Diagnostic Tool Development",
-                "Medical Data Analytics Platform",
-                "Healthcare IoT Sensor Development",
-                "Medical Training Simulation Software",
-                "Patient Record Management System"
-            ],
-            "emergency_response": [
-                "Mass Casualty Event Response Equipment",
-                "Emergency Medical Services Communication Systems",
-                "Hazmat Detection and Decontamination Systems",
-                "Emergency Department Workflow Management Platform",
-                "Ambulance Technology Upgrade Programme",
-                "Emergency Response Coordination Software",
-                "Crisis Communication Platform for Healthcare",
-                # SME emergency response opportunities
-                "Emergency Response Mobile Application",
-                "Basic First Aid Training Software",
-                "Emergency Equipment Tracking System",
-                "Simple Crisis Communication Tool",
-                "Emergency Vehicle GPS Tracking",
-                "Basic Emergency Planning Software"
-            ],
-            "digital_health": [
-                "AI-Powered Medical Decision Support System",
-                "Secure Healthcare Data Exchange Platform",
-                "Telemedicine Infrastructure Expansion Programme",
-                "Electronic Health Record System Enhancement",
-                "Healthcare IoT Security Implementation",
-                "Medical Research Data Analytics Platform"
-            ],
-            "biotechnology": [
-                "Advanced Laboratory Equipment Procurement",
-                "Biological Sample Analysis Automation System",
-                "Genomic Sequencing Platform Enhancement",
-                "Biocontainment Laboratory Equipment Upgrade",
-                "Pharmaceutical Manufacturing Technology",
-                "Medical Research Computing Infrastructure"
-            ]
-        }
-        
-        nhs_organizations = [
-            "NHS Supply Chain", "NHS Digital", "NHS England", "NHS Improvement",
-            "Public Health England", "Medicines and Healthcare products Regulatory Agency",
-            "National Institute for Health Research", "NHS Business Services Authority"
-        ]
-        
-        for category, devices in nhs_categories.items():
-            for device_title in devices:
-                try:
-                    organization = random.choice(nhs_organizations)
-                    deadline = datetime.now() + timedelta(days=random.randint(45, 120))
-                    
-                    # Category-specific value ranges with more SME-friendly options
-                    value_ranges = {
-                        "medical_devices": (20000, 3000000),    # Wide range including small apps
-                        "emergency_response": (30000, 8000000), # Mix of small and large
-                        "digital_health": (15000, 2000000),     # Mostly SME-friendly
-                        "biotechnology": (50000, 5000000)       # Research + development mix
-                    }
-                    
-                    min_val, max_val = value_ranges.get(category, (1000000, 20000000))
-                    value_estimate = float(random.randint(min_val, max_val))
-                    
-                    # Enhanced summaries with dual-use emphasis
-                    dual_use_applications = {
-                        "medical_devices": "field hospitals, combat medical operations, and emergency response scenarios",
-                        "emergency_response": "disaster response, homeland security, and military emergency operations",
-                        "digital_health": "military medical systems, field diagnostics, and remote patient care",
-                        "biotechnology": "biological threat detection, medical countermeasures, and research applications"
-                    }
-                    
-                    dual_use = dual_use_applications.get(category, "emergency and security applications")
-                    summary = f"Procurement of {device_title.lower()} for NHS use with potential applications in {dual_use}. Requirements include ruggedized design, security compliance, and interoperability standards."
-                    
-                    opportunity = OpportunityData(
-                        title=f"NHS: {device_title}",
-                        summary=summary,
-                        contracting_body=organization,
-                        source="NHS Supply Chain",
-                        source_type=SourceType.UK_DUAL_USE,
-                        deadline=deadline,
-                        url=f"https://www.supplychain.nhs.uk/news-and-events/procurement-opportunities/{random.randint(1000, 9999)}",
-                        value_estimate=value_estimate,
-                        procurement_type="Medical Equipment Procurement",
-                        tech_tags=["Medical Technology", "Dual-Use", category.replace("_", " ").title()],
-                        keywords_matched=["medical", "dual-use", category.replace("_", " ")]
-                    )
-                    
-                    if opportunity.content_hash not in self.seen_hashes:
-                        opportunities.append(opportunity)
-                        self.seen_hashes.add(opportunity.content_hash)
-                
-                except Exception as e:
-                    logger.warning(f"Error generating NHS opportunity: {e}")
-                    continue
-        
-        logger.info(f"Ultra Enhanced NHS Supply Chain collected {len(opportunities)} opportunities")
-        return opportunities
+        return [opportunity async for opportunity in self._generate(SPEC_NHS)]
     
     async def ultra_enhanced_home_office(self) -> List[OpportunityData]:
         """Ultra enhanced Home Office with comprehensive security and surveillance"""
-        opportunities = []
-        
-        # Comprehensive Home Office categories
-        home_office_categories = {
-            "border_security": [
-                "Next-Generation Border Control Biometric Systems",
-                "Advanced Passenger Information Analysis Platform",
-                "Automated Border Crossing Technology Upgrade",
-                "Immigration Document Verification AI System",
-                "Cross-Border Criminal Intelligence Platform",
-                "Port Security Integrated Surveillance Network",
-                "Advanced Baggage Screening Technology",
-                "Maritime Border Surveillance Enhancement"
-            ],
-            "counter_terrorism": [
-                "National Counter-Terrorism Surveillance Network",
-                "Advanced Threat Assessment AI Platform",
-                "Multi-Modal Biometric Identification System",
-                "Social Media Intelligence Analysis Tool",
-                "Explosive Detection Technology Enhancement",
-                "Counter-Terrorism Communication Interception Platform",
-                "Predictive Analytics for Threat Prevention",
-                "Real-Time Intelligence Fusion Centre Technology"
-            ],
-            "cyber_crime": [
-                "Digital Forensics Laboratory Equipment Upgrade",
-                "Cryptocurrency Investigation Platform",
-                "Dark Web Monitoring and Analysis System",
-                "Child Exploitation Investigation Technology",
-                "Cyber Crime Evidence Management Platform",
-                "Advanced Malware Analysis Laboratory",
-                "International Cyber Crime Coordination System"
-            ],
-            "emergency_services": [
-                "National Emergency Communication Network Upgrade",
-                "Emergency Services Command and Control Platform",
-                "Crisis Management Information System",
-                "Emergency Response Resource Optimization Platform",
-                "Public Warning System Enhancement",
-                "Emergency Services Interoperability Platform",
-                "Disaster Response Coordination Technology"
-            ],
-            "law_enforcement": [
-                "National Police Database Integration Platform",
-                "Advanced Crime Analytics and Prediction System",
-                "Police Body-Worn Camera Technology Upgrade",
-                "Evidence Management System Enhancement",
-                "Firearms Licensing System Modernization",
-                "Police Vehicle Technology Integration Platform"
-            ]
-        }
-        
-        home_office_agencies = [
-            "Home Office", "Border Force", "Immigration Enforcement",
-            "National Crime Agency", "UK Visas and Immigration",
-            "Emergency Services Mobile Communications Programme",
-            "Office for Security and Counter-Terrorism"
-        ]
-        
-        for category, systems in home_office_categories.items():
-            for system_title in systems:
-                try:
-                    agency = random.choice(home_office_agencies)
-                    deadline = datetime.now() + timedelta(days=random.randint(60, 180))
-                    
-                    # Category-specific value ranges
-                    value_ranges = {
-                        "border_security": (10000000, 75000000),
-                        "counter_terrorism": (15000000, 100000000),
-                        "cyber_crime": (5000000, 30000000),
-                        "emergency_services": (20000000, 150000000),
-                        "law_enforcement": (8000000, 45000000)
-                    }
-                    
-                    min_val, max_val = value_ranges.get(category, (5000000, 50000000))
-                    value_estimate = float(random.randint(min_val, max_val))
-                    
-                    # Enhanced summaries with security emphasis
-                    summary = f"Procurement and implementation of {system_title.lower()} featuring advanced security protocols, real-time processing capabilities, and integration with existing government systems. Requires security clearance and compliance with government security standards."
-                    
-                    opportunity = OpportunityData(
-                        title=f"Home Office: {system_title}",
-                        summary=summary,
-                        contracting_body=agency,
-                        source="Home Office",
-                        source_type=SourceType.UK_SECURITY,
-                        deadline=deadline,
-                        url=f"https://www.gov.uk/government/organisations/home-office/about/procurement/contract-{random.randint(10000, 99999)}",
-                        value_estimate=value_estimate,
-                        procurement_type="Security Technology Procurement",
-                        tech_tags=["Security Technology", category.replace("_", " ").title(), "Government"],
-                        keywords_matched=["security", "surveillance", category.replace("_", " ")]
-                    )
-                    
-                    if opportunity.content_hash not in self.seen_hashes:
-                        opportunities.append(opportunity)
-                        self.seen_hashes.add(opportunity.content_hash)
-                
-                except Exception as e:
-                    logger.warning(f"Error generating Home Office opportunity: {e}")
-                    continue
-        
-        logger.info(f"Ultra Enhanced Home Office collected {len(opportunities)} opportunities")
-        return opportunities
+        return [opportunity async for opportunity in self._generate(SPEC_HOME_OFFICE)]
     
     async def ultra_enhanced_space_agency(self) -> List[OpportunityData]:
         """Ultra enhanced UK Space Agency with comprehensive space defence programmes"""
-        opportunities = []
-        
-        # Comprehensive space technology categories
-        space_categories = {
-            "earth_observation": [
-                "Next-Generation SAR Satellite Constellation",
-                "Hyperspectral Imaging Satellite Development",
-                "Real-Time Earth Observation Data Processing Platform",
-                "Maritime Domain Awareness Satellite Programme",
-                "Agricultural and Environmental Monitoring Constellation",
-                "Climate Change Monitoring Satellite System",
-                "Disaster Response Earth Observation Platform"
-            ],
-            "communications": [
-                "Quantum-Secure Satellite Communication Network",
-                "Military Satellite Communication Constellation",
-                "Emergency Services Satellite Communication Platform",
-                "Inter-Satellite Communication Technology Development",
-                "Ground Station Network Enhancement Programme",
-                "Satellite Internet for Remote Areas Project"
-            ],
-            "navigation": [
-                "Alternative Position Navigation and Timing System",
-                "GPS Resilience Enhancement Programme",
-                "Quantum Navigation Technology Development",
-                "Indoor Navigation System Development",
-                "Critical Infrastructure Timing Protection System"
-            ],
-            "space_situational_awareness": [
-                "Space Debris Tracking Network Enhancement",
-                "Space Weather Monitoring Satellite System",
-                "Space Domain Awareness Data Fusion Platform",
-                "Active Debris Removal Technology Development",
-                "Space Traffic Management System"
-            ],
-            "manufacturing": [
-                "In-Orbit Manufacturing Technology Demonstrator",
-                "Satellite Servicing and Refueling Platform",
-                "3D Printing in Space Technology Development",
-                "Orbital Assembly and Construction System",
-                "Space-Based Solar Power Technology Programme"
-            ],
-            "exploration": [
-                "Lunar Resource Utilization Technology Programme",
-                "Mars Sample Return Mission Technology",
-                "Deep Space Communication Technology",
-                "Space Habitat Technology Development",
-                "Asteroid Mining Technology Demonstrator"
-            ]
-        }
-        
-        space_organizations = [
-            "UK Space Agency", "European Space Agency (UK)",
-            "Satellite Applications Catapult", "RAL Space",
-            "University of Surrey Space Centre", "Open University Space Research"
-        ]
+        return [opportunity async for opportunity in self._generate(SPEC_SPACE)]
+    
+    async def _generate(self, spec: SourceSpec) -> AsyncIterator[OpportunityData]:
+        """Stream a SourceSpec catalogue as opportunities; one loop serves every table-driven source"""
+        count = 0
+        # One clock read for every deadline in this source
+        now = datetime.now()
+        min_days, max_days = spec.deadline_days
         
-        for category, technologies in space_categories.items():
-            for tech_title in technologies:
-                try:
-                    organization = random.choice(space_organizations)
-                    deadline = datetime.now() + timedelta(days=random.randint(120, 365))
-                    
-                    # Category-specific value ranges
-                    value_ranges = {
-                        "earth_observation": (25000000, 200000000),
-                        "communications": (50000000, 300000000),
-                        "navigation": (30000000, 150000000),
-                        "space_situational_awareness": (15000000, 100000000),
-                        "manufacturing": (20000000, 80000000),
-                        "exploration": (40000000, 250000000)
-                    }
-                    
-                    min_val, max_val = value_ranges.get(category, (20000000, 100000000))
-                    value_estimate = float(random.randint(min_val, max_val))
+        # Inputs are precomputed or drawn above, so construction does not fail per item; one guard
+        # keeps whatever was built before an unexpected error
+        try:
+            for category, entries in spec.entries.items():
+                min_val, max_val = spec.value_ranges.get(category, spec.default_value_range)
+                procurement_type = spec.procurement_types.get(category, spec.procurement_type)
+                url_prefix = spec.url_prefix.format(category=category.replace('_', '-'))
+                
+                # Shared by every record in this category
+                tech_tags, keywords_matched = spec.tags[category]
+                
+                # Random fields drawn in bulk for the whole category
+                contracting_bodies = random.choices(spec.contracting_bodies, k=len(entries))
+                deadline_offsets = random.choices(range(min_days, max_days + 1), k=len(entries))
+                values = random.choices(range(min_val, max_val + 1), k=len(entries))
+                if spec.url_ids is None:
+                    url_ids = [None] * len(entries)
+                else:
+                    url_ids = random.choices(range(spec.url_ids[0], spec.url_ids[1] + 1), k=len(entries))
+                
+                for (title, summary, slug), contracting_body, offset, value, url_id in zip(
+                    entries, contracting_bodies, deadline_offsets, values, url_ids
+                ):
+                    deadline = now + timedelta(days=offset)
                     
-                    # Enhanced summaries with space defence emphasis
-                    defence_applications = {
-                        "earth_observation": "intelligence gathering, surveillance, and reconnaissance operations",
-                        "communications": "secure military communications and command and control",
-                        "navigation": "resilient positioning for military operations and critical infrastructure",
-                        "space_situational_awareness": "space domain protection and threat assessment",
-                        "manufacturing": "on-orbit assembly of defence assets and space infrastructure",
-                        "exploration": "extended range operations and space resource security"
-                    }
+                    value_estimate = float(value)
                     
-                    defence_app = defence_applications.get(category, "space-based defence capabilities")
-                    summary = f"Development and deployment of {tech_title.lower()} with applications for {defence_app}. Programme includes ground segment development, mission operations, and technology transfer opportunities."
+                    url_suffix = slug if url_id is None else url_id
                     
                     opportunity = OpportunityData(
-                        title=f"UK Space Agency: {tech_title}",
+                        title=title,
                         summary=summary,
-                        contracting_body=organization,
-                        source="UK Space Agency",
-                        source_type=SourceType.UK_SPACE,
+                        contracting_body=contracting_body,
+                        source=spec.source,
+                        source_type=spec.source_type,
                         deadline=deadline,
-                        url=f"https://www.gov.uk/government/organisations/uk-space-agency/about/procurement/programme-{random.randint(1000, 9999)}",
+                        url=f"{url_prefix}{url_suffix}",
                         value_estimate=value_estimate,
-                        procurement_type="Space Technology Programme",
-                        tech_tags=["Space Technology", category.replace("_", " ").title(), "Defence Space"],
-                        keywords_matched=["space", "satellite", category.replace("_", " ")]
+                        country=spec.country,
+                        location=spec.country,
+                        procurement_type=procurement_type,
+                        tech_tags=tech_tags,
+                        keywords_matched=keywords_matched
                     )
                     
-                    if opportunity.content_hash not in self.seen_hashes:
-                        opportunities.append(opportunity)
-                        self.seen_hashes.add(opportunity.content_hash)
-                
-                except Exception as e:
-                    logger.warning(f"Error generating Space Agency opportunity: {e}")
-                    continue
+                    # Titles carry the source prefix and are unique within the catalogue, so each
+                    # record is new by construction and skips the shared hash filter
+                    yield opportunity
+                    count += 1
+        except Exception as e:
+            logger.exception(f"Error generating {spec.source} opportunities: {e}")
         
-        logger.info(f"Ultra Enhanced UK Space Agency collected {len(opportunities)} opportunities")
-        return opportunities
+        logger.info(f"Ultra Enhanced {spec.source} collected {count} opportunities")
     
     async def ultra_enhanced_universities(self) -> List[OpportunityData]:
         """Ultra enhanced university partnerships with comprehensive research programmes"""
-        opportunities = []
-        
-        # Comprehensive university research categories
-        university_research = {
-            "Imperial College London": {
-                "areas": ["AI for Defence", "Quantum Technologies", "Advanced Materials", "Space Technology"],
-                "programmes": [
-                    "AI Ethics in Autonomous Weapons Systems Research",
-                    "Quantum Communication Network Development",
-                    "Advanced Composite Materials for Aerospace",
-                    "Space Debris Mitigation Technology Research"
-                ]
-            },
-            "University of Cambridge": {
-                "areas": ["Computer Science", "Engineering", "Physics", "Mathematics"],
-                "programmes": [
-                    "Machine Learning for Intelligence Analysis",
-                    "Autonomous Systems for Hazardous Environments",
-                    "Quantum Computing for Cryptography",
-                    "Adaptive Structures for Aerospace Applications"
-                ]
-            },
-            "Cranfield University": {
-                "areas": ["Aerospace", "Defence Technology", "Systems Engineering"],
-                "programmes": [
-                    "Future Combat Air System Technology Development",
-                    "Unmanned Aircraft Systems Integration Research",
-                    "Defence Systems Engineering Innovation Programme",
-                    "Aerospace Materials and Manufacturing Research"
-                ]
-            },
-            "University College London": {
-                "areas": ["Cyber Security", "AI", "Engineering", "Medical Physics"],
-                "programmes": [
-                    "Cyber Security for Critical Infrastructure",
-                    "AI for Medical Applications in Defence",
-                    "Human-Computer Interaction in Military Systems",
-                    "Medical Physics for Combat Medicine"
-                ]
-            },
-            "University of Edinburgh": {
-                "areas": ["Informatics", "Engineering", "Physics", "Data Science"],
-                "programmes": [
-                    "Natural Language Processing for Intelligence",
-                    "Robotics for Search and Rescue Operations",
-                    "Sensor Networks for Environmental Monitoring",
-                    "Data Science for National Security"
-                ]
-            },
-            "University of Surrey": {
-                "areas": ["Space Technology", "Electronics", "Communications"],
-                "programmes": [
-                    "Small Satellite Technology Development",
-                    "Space Weather Monitoring Systems",
-                    "Satellite Communication Security Research",
-                    "Ground Segment Technology Innovation"
-                ]
-            },
-            "University of Bath": {
-                "areas": ["Materials Science", "Engineering", "Computer Science"],
-                "programmes": [
-                    "Smart Materials for Defence Applications",
-                    "Additive Manufacturing for Aerospace",
-                    "Biomimetic Systems for Military Use",
-                    "Sustainable Materials for Defence Industry"
-                ]
-            },
-            "King's College London": {
-                "areas": ["Defence Studies", "Security", "Policy Research"],
-                "programmes": [
-                    "Defence Policy and Strategy Research",
-                    "International Security Studies Programme",
-                    "Conflict Resolution Technology Research",
-                    "Military Ethics and AI Research"
-                ]
-            }
-        }
+        return [opportunity async for opportunity in self._generate_universities()]
+    
+    async def _generate_universities(self) -> AsyncIterator[OpportunityData]:
+        """Stream the university partnership catalogue as opportunities"""
+        count = 0
+        # One clock read for every deadline in this source
+        now = datetime.now()
         
-        for university, details in university_research.items():
-            for programme in details["programmes"]:
-                try:
-                    deadline = datetime.now() + timedelta(days=random.randint(90, 300))
-                    
-                    # University-specific value ranges
-                    if "Imperial" in university or "Cambridge" in university:
-                        value_range = (5000000, 50000000)
-                    elif "Cranfield" in university:
-                        value_range = (8000000, 60000000)
-                    else:
-                        value_range = (2000000, 25000000)
-                    
-                    value_estimate = float(random.randint(*value_range))
+        # Inputs are precomputed or drawn above, so construction does not fail per item; one guard
+        # keeps whatever was built before an unexpected error
+        try:
+            for university, (url_prefix, tech_tags, rows) in UNIVERSITY_ENTRIES.items():
+                # University-specific value ranges
+                if "Imperial" in university or "Cambridge" in university:
+                    value_range = (5000000, 50000000)
+                elif "Cranfield" in university:
+                    value_range = (8000000, 60000000)
+                else:
+                    value_range = (2000000, 25000000)
+                
+                # Random fields drawn in bulk for the whole university
+                deadline_offsets = random.choices(range(90, 301), k=len(rows))
+                values = random.choices(range(value_range[0], value_range[1] + 1), k=len(rows))
+                page_ids = random.choices(range(1000, 10000), k=len(rows))
+                
+                for (title, summary), offset, value, page_id in zip(rows, deadline_offsets, values, page_ids):
+                    deadline = now + timedelta(days=offset)
                     
-                    # Enhanced research programme summaries
-                    summary = f"Multi-year research partnership programme for {programme.lower()} at {university}. Collaboration includes industry partners, government agencies, and international research institutions. Programme offers IP licensing opportunities and technology transfer pathways."
+                    value_estimate = float(value)
                     
                     opportunity = OpportunityData(
-                        title=f"{university}: {programme}",
+                        title=title,
                         summary=summary,
                         contracting_body=university,
                         source="University Partnerships",
                         source_type=SourceType.UK_ACADEMIC,
                         deadline=deadline,
-                        url=f"https://www.{university.lower().replace(' ', '').replace('university', 'ac.uk').replace('of', '').replace('college', '')}/research/defence/{random.randint(1000, 9999)}",
+                        url=f"{url_prefix}{page_id}",
                         value_estimate=value_estimate,
                         procurement_type="Research Partnership",
-                        tech_tags=["Academic Research", "Innovation"] + details["areas"],
-                        keywords_matched=["research", "university", "partnership"]
+                        tech_tags=tech_tags,
+                        keywords_matched=UNIVERSITY_KEYWORDS
                     )
                     
-                    if opportunity.content_hash not in self.seen_hashes:
-                        opportunities.append(opportunity)
-                        self.seen_hashes.add(opportunity.content_hash)
-                
-                except Exception as e:
-                    logger.warning(f"Error generating university opportunity: {e}")
-                    continue
+                    # Titles carry the source prefix and are unique within the catalogue, so each
+                    # record is new by construction and skips the shared hash filter
+                    yield opportunity
+                    count += 1
+        except Exception as e:
+            logger.exception(f"Error generating university opportunities: {e}")
         
-        logger.info(f"Ultra Enhanced Universities collected {len(opportunities)} opportunities")
-        return opportunities
+        logger.info(f"Ultra Enhanced Universities collected {count} opportunities")
     
     async def ultra_enhanced_netherlands_defence(self) -> List[OpportunityData]:
         """Ultra enhanced Netherlands Defence with comprehensive NATO programmes"""
-        opportunities = []
-        
-        # Comprehensive Netherlands defence categories
-        netherlands_categories = {
-            "naval_systems": [
-                "Next-Generation Frigate Combat Management System",
-                "Submarine Sonar Processing Enhancement Programme",
-                "Naval Mine Countermeasures Autonomous Systems",
-                "Maritime Domain Awareness Integration Platform",
-                "Naval Electronic Warfare Suite Upgrade",
-                "Ship-Based Air Defence System Enhancement",
-                "Naval Communication System Modernization"
-            ],
-            "land_systems": [
-                "Infantry Fighting Vehicle Modernization Programme",
-                "Advanced Battle Management System Development",
-                "Soldier Modernization Technology Programme",
-                "Military Vehicle Autonomous Navigation System",
-                "Field Artillery Fire Control System Upgrade",
-                "Engineering Vehicle Technology Enhancement"
-            ],
-            "air_systems": [
-                "F-35 Lightning II Netherlands Specific Modifications",
-                "Air Defence Radar System Enhancement",
-                "Military Aircraft Communication System Upgrade",
-                "Unmanned Aerial System Integration Programme",
-                "Air Traffic Management System for Military Airspace",
-                "Aircraft Maintenance Predictive Analytics Platform"
-            ],
-            "cyber_security": [
-                "National Cyber Defence Operations Centre",
-                "Military Network Security Enhancement Programme",
-                "Cyber Threat Intelligence Sharing Platform",
-                "Critical Infrastructure Protection System",
-                "Secure Military Communications Network",
-                "Cyber Range Training Environment Development"
-            ],
-            "joint_operations": [
-                "Multi-Domain Operations Command System",
-                "Joint Intelligence Analysis Platform",
-                "NATO Interoperability Enhancement Programme",
-                "Coalition Operations Communication System",
-                "Joint Logistics Management Platform",
-                "International Mission Support System"
-            ]
-        }
-        
-        netherlands_agencies = [
-            "Netherlands Ministry of Defence",
-            "Royal Netherlands Navy",
-            "Royal Netherlands Army",
-            "Royal Netherlands Air Force",
-            "Defence Materiel Organisation (DMO)",
-            "Netherlands Defence Academy"
-        ]
-        
-        for category, systems in netherlands_categories.items():
-            for system_title in systems:
-                try:
-                    agency = random.choice(netherlands_agencies)
-                    deadline = datetime.now() + timedelta(days=random.randint(90, 240))
-                    
-                    # Category-specific value ranges (Netherlands defence budget context)
-                    value_ranges = {
-                        "naval_systems": (20000000, 150000000),
-                        "land_systems": (15000000, 100000000),
-                        "air_systems": (25000000, 200000000),
-                        "cyber_security": (10000000, 75000000),
-                        "joint_operations": (30000000, 120000000)
-                    }
-                    
-                    min_val, max_val = value_ranges.get(category, (10000000, 100000000))
-                    value_estimate = float(random.randint(min_val, max_val))
-                    
-                    # Enhanced summaries with NATO interoperability emphasis
-                    summary = f"Procurement and development of {system_title.lower()} for the Netherlands Armed Forces. Requirements include NATO interoperability, cyber resilience, and integration with allied systems. International partnership opportunities available for qualified suppliers."
-                    
-                    opportunity = OpportunityData(
-                        title=f"Netherlands MOD: {system_title}",
-                        summary=summary,
-                        contracting_body=agency,
-                        source="Netherlands Defence",
-                        source_type=SourceType.INTERNATIONAL_ALLIES,
-                        deadline=deadline,
-                        url=f"https://www.defensie.nl/onderwerpen/inkoop/aanbestedingen/{random.randint(1000, 9999)}",
-                        value_estimate=value_estimate,
-                        country="Netherlands",
-                        location="Netherlands",
-                        procurement_type="Defence Procurement",
-                        tech_tags=["NATO Alliance", category.replace("_", " ").title(), "International"],
-                        keywords_matched=["netherlands", "nato", category.replace("_", " ")]
-                    )
-                    
-                    if opportunity.content_hash not in self.seen_hashes:
-                        opportunities.append(opportunity)
-                        self.seen_hashes.add(opportunity.content_hash)
-                
-                except Exception as e:
-                    logger.warning(f"Error generating Netherlands opportunity: {e}")
-                    continue
-        
-        logger.info(f"Ultra Enhanced Netherlands Defence collected {len(opportunities)} opportunities")
-        return opportunities
+        return [opportunity async for opportunity in self._generate(SPEC_NETHERLANDS)]
     
-    def _parse_deadline(self, deadline_text: str) -> Optional[datetime]:
+    @staticmethod
+    def _parse_deadline(deadline_text: str) -> Optional[datetime]:
         """Enhanced deadline parsing"""
         if not deadline_text:
             return None
         
+        # Remove common prefixes
+        deadline_text = DEADLINE_PREFIX_RE.sub('', deadline_text.strip())
+        
         try:
-            # Clean up the text
-            deadline_text = deadline_text.strip()
-            
-            # Remove common prefixes
-            prefixes = ["Deadline:", "Closing:", "Due:", "By:", "Expires:", "Until:"]
-            for prefix in prefixes:
-                if deadline_text.startswith(prefix):
-                    deadline_text = deadline_text[len(prefix):].strip()
+            match = ISO_DATE_RE.fullmatch(deadline_text)
+            if match:
+                return datetime(int(match[1]), int(match[2]), int(match[3]))
             
-            # Try to parse
-            return datetime.strptime(deadline_text, '%Y-%m-%d')
-        except:
-            try:
-                # Try alternative formats
-                from dateutil import parser as date_parser
-                return date_parser.parse(deadline_text)
-            except:
-                return None
+            match = DMY_DATE_RE.search(deadline_text)
+            if match:
+                day, month, year = match.groups()
+                month = int(month) if month.isdigit() else MONTHS.get(month[:3].lower())
+                if month:
+                    year = int(year)
+                    return datetime(year + 2000 if year < 100 else year, month, int(day))
+        except ValueError:
+            pass
+        
+        try:
+            # Try alternative formats; parse() reuses dateutil's module-level parser and parserinfo
+            return date_parser.parse(deadline_text)
+        except Exception:
+            return None
     
-    def _extract_value(self, value_text: str) -> Optional[float]:
+    @staticmethod
+    def _extract_value(value_text: str) -> Optional[float]:
         """Enhanced value extraction"""
         if not value_text:
             return None
         
-        try:
-            # Remove currency symbols and common text
-            clean_text = re.sub(r'[£$€,\s]', '', value_text.lower())
-            
-            # Extract numbers with decimal support
-            numbers = re.findall(r'\d+\.?\d*', clean_text)
-            if numbers:
-                value = float(numbers[0])
-                
-                # Handle magnitude indicators
-                if any(indicator in clean_text for indicator in ['bn', 'billion']):
-                    value *= 1000000000
-                elif any(indicator in clean_text for indicator in ['m', 'million', 'mil']):
-                    value *= 1000000
-                elif any(indicator in clean_text for indicator in ['k', 'thousand']):
-                    value *= 1000
-                
-                return value
-        except:
+        match = VALUE_RE.search(value_text)
+        if not match:
             return None
         
-        return None
+        value = float(match[1].replace(',', ''))
+        # Handle magnitude indicators; ranges put the magnitude on the upper bound only
+        magnitude = match[2]
+        if not magnitude:
+            later = VALUE_MAGNITUDE_RE.search(value_text, match.end())
+            magnitude = later[1] if later else None
+        if magnitude:
+            value *= VALUE_MULTIPLIERS[magnitude.lower()]
+        return value
+
+def _parse_fts_results_sync(html: bytes, base_url: str, search_term: str) -> List[OpportunityData]:
+    """Process-pool entry point: parse Find a Tender results with enhanced extraction.
+    
+    Runs without the collector, so cross-source dedup on content hash is left to the caller.
+    """
+    opportunities = []
+    seen_titles = set()
+    soup = BeautifulSoup(html, 'lxml')
+    
+    # Look for various possible result containers
+    results = []
+    for selector in FTS_RESULT_SELECTORS:
+        found = soup.select(selector)
+        if found:
+            results = found
+            break
+    
+    # Fallback to any div with relevant classes
+    if not results:
+        results = soup.select(FTS_FALLBACK_SELECTOR)
+        if not results:
+            return opportunities
+    
+    for result in results[:25]:  # Increased limit per search
+        try:
+            # Extract title
+            title_elem = result.find('a', href=True) or result.find(['h2', 'h3', 'h4'])
+            if not title_elem:
+                continue
+            
+            title = title_elem.get_text(strip=True)
+            if len(title) < 10 or title in seen_titles:
+                continue
+            
+            # Extract link
+            link = title_elem.get('href', '') if title_elem.name == 'a' else ''
+            if link and not link.startswith('http'):
+                link = urljoin(base_url, link)
+            
+            # Enhanced summary extraction
+            summary = ""
+            for selector in FTS_SUMMARY_SELECTORS:
+                elem = result.select_one(selector)
+                if elem:
+                    summary = elem.get_text(strip=True)
+                    break
+            
+            if not summary:
+                # Fallback to any paragraph
+                p_elem = result.find('p')
+                summary = p_elem.get_text(strip=True) if p_elem else f"Find a Tender opportunity: {title}"
+            
+            # Enhanced authority extraction
+            authority = ""
+            for selector in FTS_AUTHORITY_SELECTORS:
+                elem = result.select_one(selector)
+                if elem:
+                    authority = elem.get_text(strip=True)
+                    break
+            
+            if not authority:
+                authority = "UK Government Agency"
+            
+            # Enhanced deadline extraction
+            deadline = None
+            for selector in FTS_DEADLINE_SELECTORS:
+                elem = result.select_one(selector)
+                if elem:
+                    # <time datetime="..."> carries an ISO date, so prefer it over the display text
+                    deadline = UltraEnhancedCollector._parse_deadline(elem.get('datetime') or elem.get_text(strip=True))
+                    if deadline:
+                        break
+            
+            if not deadline:
+                deadline = datetime.now() + timedelta(days=random.randint(30, 90))
+            
+            # Enhanced value extraction
+            value_estimate = None
+            for selector in FTS_VALUE_SELECTORS:
+                elem = result.select_one(selector)
+                if elem:
+                    value_estimate = UltraEnhancedCollector._extract_value(elem.get_text(strip=True))
+                    if value_estimate:
+                        break
+            
+            if not value_estimate:
+                value_estimate = float(random.randint(500000, 15000000))
+            
+            # Extract CPV codes if present
+            cpv_codes = []
+            cpv_elem = result.find(text=CPV_TEXT_RE)
+            if cpv_elem:
+                cpv_match = CPV_CODE_RE.search(cpv_elem)
+                if cpv_match:
+                    cpv_codes.append(cpv_match.group(1))
+            
+            opportunity = OpportunityData(
+                title=title[:200],
+                summary=summary[:500],
+                contracting_body=authority,
+                source="Find a Tender Service",
+                source_type=SourceType.UK_OFFICIAL,
+                deadline=deadline,
+                url=link or base_url,
+                value_estimate=value_estimate,
+                procurement_type="Public Sector Tender",
+                cpv_codes=cpv_codes,
+                keywords_matched=[search_term]
+            )
+            
+            opportunities.append(opportunity)
+            seen_titles.add(title)
+            
+        except Exception as e:
+            logger.debug("FTS row parse failed: %s", e)
+            continue
+    
+    return opportunities
 
 # Main collection function
 async def collect_ultra_enhanced_all_sources() -> List[OpportunityData]:
     """Main function for ultra enhanced collection with 100% coverage"""
-    collector = UltraEnhancedCollector()
-    return await collector.collect_ultra_enhanced_all()
+    async with UltraEnhancedCollector() as collector:
+        return await collector.collect_ultra_enhanced_all()
+
+async def stream_ultra_enhanced_all_sources() -> AsyncIterator[OpportunityData]:
+    """Streaming counterpart of collect_ultra_enhanced_all_sources for consumers that persist as they go"""
+    async with UltraEnhancedCollector() as collector:
+        async for opportunity in collector.stream_ultra_enhanced_all():
+            yield opportunity
 
 if __name__ == "__main__":
+    # Library imports leave logging to the application; configure it only when run directly
+    logging.basicConfig(level=logging.INFO)
+    
     async def main():
         opportunities = await collect_ultra_enhanced_all_sources()
         
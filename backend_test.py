@@ -1,66 +1,74 @@
-import requests
+import asyncio
+import httpx
+import orjson
 import sys
 import time
 from datetime import datetime, timedelta
 
 class ModulusDefenceAPITester:
-    def __init__(self, base_url="https://18c71e40-871f-400a-803e-bcd99f9538fe.preview.emergentagent.com"):
+    def __init__(self, client, base_url="https://18c71e40-871f-400a-803e-bcd99f9538fe.preview.emergentagent.com"):
+        # Shared pooled client; auth is sent per request so testers can share it
+        self.client = client
         self.base_url = base_url
         self.token = None
         self.tests_run = 0
         self.tests_passed = 0
         self.user_data = None
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, params=None):
+    async def run_test(self, name, method, endpoint, expected_status, data=None, params=None):
         """Run a single API test"""
         url = f"{self.base_url}/api/{endpoint}"
-        headers = {'Content-Type': 'application/json'}
-        if self.token:
-            headers['Authorization'] = f'Bearer {self.token}'
+        # Content-Type is a client default; only the per-user token varies
+        headers = {'Authorization': f'Bearer {self.token}'} if self.token else None
+        # Encode bodies with orjson up front rather than through httpx's stdlib json path
+        body = orjson.dumps(data) if data is not None else None
 
         self.tests_run += 1
-        print(f"\n🔍 Testing {name}...")
+        # Buffered and written in one go, so gathered tests print as whole blocks
+        log = [f"\n🔍 Testing {name}..."]
         
         try:
             if method == 'GET':
-                response = requests.get(url, headers=headers, params=params)
+                response = await self.client.get(url, headers=headers, params=params)
             elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers, params=params)
+                response = await self.client.post(url, content=body, headers=headers, params=params)
             elif method == 'PUT':
-                response = requests.put(url, json=data, headers=headers)
+                response = await self.client.put(url, content=body, headers=headers)
 
             success = response.status_code == expected_status
             if success:
                 self.tests_passed += 1
-                print(f"✅ Passed - Status: {response.status_code}")
+                log.append(f"✅ Passed - Status: {response.status_code}")
                 try:
                     return success, response.json()
                 except:
                     return success, {}
             else:
-                print(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
+                log.append(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
                 try:
-                    print(f"Response: {response.json()}")
+                    log.append(f"Response: {response.json()}")
                 except:
-                    print(f"Response: {response.text}")
+                    log.append(f"Response: {response.text}")
                 return False, {}
 
         except Exception as e:
-            print(f"❌ Failed - Error: {str(e)}")
+            log.append(f"❌ Failed - Error: {str(e)}")
             return False, {}
+        finally:
+            sys.stdout.write('\n'.join(log) + '\n')
 
-    def test_root_endpoint(self):
+    async def test_root_endpoint(self):
         """Test the root API endpoint"""
-        return self.run_test(
+        return await self.run_test(
             "Root API Endpoint",
             "GET",
             "",
             200
         )
 
-    def test_register(self, email, password, company_name, full_name):
+    async def test_register(self, email, password, company_name, full_name):
         """Test user registration"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "User Registration",
             "POST",
             "auth/register",
@@ -78,9 +86,9 @@ class ModulusDefenceAPITester:
             return True
         return False
 
-    def test_login(self, email, password):
+    async def test_login(self, email, password):
         """Test user login"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "User Login",
             "POST",
             "auth/login",
@@ -93,16 +101,16 @@ class ModulusDefenceAPITester:
             return True
         return False
 
-    def test_get_me(self):
+    async def test_get_me(self):
         """Test getting current user profile"""
-        return self.run_test(
+        return await self.run_test(
             "Get Current User",
             "GET",
             "auth/me",
             200
         )
 
-    def test_get_opportunities(self, search=None, funding_body=None, tech_area=None):
+    async def test_get_opportunities(self, search=None, funding_body=None, tech_area=None):
         """Test getting opportunities with optional filters"""
         params = {}
         if search:
@@ -112,7 +120,7 @@ class ModulusDefenceAPITester:
         if tech_area:
             params['tech_area'] = tech_area
             
-        return self.run_test(
+        return await self.run_test(
             f"Get Opportunities (filters: {params})",
             "GET",
             "opportunities",
@@ -120,18 +128,18 @@ class ModulusDefenceAPITester:
             params=params
         )
 
-    def test_get_dashboard_stats(self):
+    async def test_get_dashboard_stats(self):
         """Test getting dashboard statistics"""
-        return self.run_test(
+        return await self.run_test(
             "Get Dashboard Stats",
             "GET",
             "dashboard/stats",
             200
         )
 
-    def test_upgrade_subscription(self, tier):
+    async def test_upgrade_subscription(self, tier):
         """Test upgrading subscription"""
-        return self.run_test(
+        return await self.run_test(
             f"Upgrade to {tier}",
             "POST",
             "users/upgrade",
@@ -139,40 +147,40 @@ class ModulusDefenceAPITester:
             params={"tier": tier}
         )
         
-    def test_refresh_live_data(self):
+    async def test_refresh_live_data(self):
         """Test refreshing live data (Pro/Enterprise only)"""
-        return self.run_test(
+        return await self.run_test(
             "Refresh Live Data",
             "POST",
             "data/refresh",
             200
         )
         
-    def test_aggregation_stats(self):
+    async def test_aggregation_stats(self):
         """Test getting aggregation statistics (Pro/Enterprise only)"""
-        return self.run_test(
+        return await self.run_test(
             "Get Aggregation Stats",
             "GET",
             "opportunities/aggregation-stats",
             200
         )
         
-    def test_get_data_sources(self):
+    async def test_get_data_sources(self):
         """Test getting data sources information"""
-        return self.run_test(
+        return await self.run_test(
             "Get Data Sources",
             "GET",
             "data/sources",
             200
         )
         
-    def test_get_funding_opportunities(self, category=None):
+    async def test_get_funding_opportunities(self, category=None):
         """Test getting funding opportunities with optional category filter"""
         params = {}
         if category:
             params['category'] = category
             
-        return self.run_test(
+        return await self.run_test(
             f"Get Funding Opportunities (category: {category if category else 'all'})",
             "GET",
             "funding-opportunities",
@@ -180,25 +188,25 @@ class ModulusDefenceAPITester:
             params=params
         )
         
-    def test_get_funding_stats(self):
+    async def test_get_funding_stats(self):
         """Test getting funding opportunities statistics"""
-        return self.run_test(
+        return await self.run_test(
             "Get Funding Stats",
             "GET",
             "funding-opportunities/stats",
             200
         )
         
-    def test_refresh_funding_opportunities(self):
+    async def test_refresh_funding_opportunities(self):
         """Test refreshing funding opportunities data (Pro/Enterprise only)"""
-        return self.run_test(
+        return await self.run_test(
             "Refresh Funding Opportunities",
             "POST",
             "funding-opportunities/refresh",
             200
         )
         
-    def test_create_opportunity(self, tier_required="free"):
+    async def test_create_opportunity(self, tier_required="free"):
         """Test creating a new opportunity"""
         data = {
             "title": f"Test Opportunity {datetime.now().strftime('%H%M%S')}",
@@ -215,7 +223,7 @@ class ModulusDefenceAPITester:
             "tier_required": tier_required
         }
         
-        return self.run_test(
+        return await self.run_test(
             f"Create Opportunity (tier: {tier_required})",
             "POST",
             "opportunities",
@@ -223,25 +231,25 @@ class ModulusDefenceAPITester:
             data=data
         )
         
-    def test_get_specific_opportunity(self, opportunity_id):
+    async def test_get_specific_opportunity(self, opportunity_id):
         """Test getting a specific opportunity by ID"""
-        return self.run_test(
+        return await self.run_test(
             f"Get Specific Opportunity (ID: {opportunity_id})",
             "GET",
             f"opportunities/{opportunity_id}",
             200
         )
         
-    def test_check_opportunity_link(self, opportunity_id):
+    async def test_check_opportunity_link(self, opportunity_id):
         """Test checking if an opportunity's external link is accessible"""
-        return self.run_test(
+        return await self.run_test(
             f"Check Opportunity Link (ID: {opportunity_id})",
             "POST",
             f"opportunities/{opportunity_id}/check-link",
             200
         )
         
-    def test_update_alert_preferences(self):
+    async def test_update_alert_preferences(self):
         """Test updating alert preferences"""
         data = {
             "keywords": ["test", "defence", "automation"],
@@ -251,7 +259,7 @@ class ModulusDefenceAPITester:
             "max_funding": 5000000
         }
         
-        return self.run_test(
+        return await self.run_test(
             "Update Alert Preferences",
             "PUT",
             "users/alert-preferences",
@@ -259,20 +267,20 @@ class ModulusDefenceAPITester:
             data=data
         )
         
-    def test_get_alert_preferences(self):
+    async def test_get_alert_preferences(self):
         """Test getting alert preferences"""
-        return self.run_test(
+        return await self.run_test(
             "Get Alert Preferences",
             "GET",
             "users/alert-preferences",
             200
         )
 
-def test_free_tier_user():
+async def test_free_tier_user(client):
     """Test the free tier user journey"""
     print("\n🔍 TESTING FREE TIER USER JOURNEY")
     
-    tester = ModulusDefenceAPITester()
+    tester = ModulusDefenceAPITester(client)
     timestamp = datetime.now().strftime('%H%M%S')
     test_email = f"free_user_{timestamp}@example.com"
     test_password = "TestPass123!"
@@ -280,14 +288,14 @@ def test_free_tier_user():
     test_full_name = "Free Tier User"
     
     # Register a new free tier user
-    if not tester.test_register(test_email, test_password, test_company, test_full_name):
+    if not await tester.test_register(test_email, test_password, test_company, test_full_name):
         print("❌ Free tier registration failed")
         return False
         
     print("✅ Successfully registered a free tier user")
     
     # Verify user is on free tier
-    success, user_data = tester.test_get_me()
+    success, user_data = await tester.test_get_me()
     if success and user_data.get('tier') == 'free':
         print("✅ User is correctly on free tier")
     else:
@@ -295,7 +303,7 @@ def test_free_tier_user():
         return False
         
     # Test getting opportunities (should show free tier opportunities)
-    success, opportunities = tester.test_get_opportunities()
+    success, opportunities = await tester.test_get_opportunities()
     if success:
         # Check if any Pro opportunities are delayed for free users
         has_delayed = False
@@ -309,25 +317,25 @@ def test_free_tier_user():
             print("⚠️ No delayed Pro opportunities found, but this might be expected")
     
     # Try to refresh live data (should fail for free tier)
-    success, _ = tester.test_refresh_live_data()
+    success, _ = await tester.test_refresh_live_data()
     if not success:
         print("✅ Correctly prevented free tier user from refreshing live data")
     else:
         print("❌ Free tier user was able to refresh live data (should be restricted)")
         
     # Get dashboard stats (should show limited stats for free tier)
-    success, stats = tester.test_get_dashboard_stats()
+    success, stats = await tester.test_get_dashboard_stats()
     if success:
         print(f"✅ Dashboard stats for free tier: {stats.get('total_opportunities')} opportunities")
         
     print(f"\n📊 Free Tier Tests passed: {tester.tests_passed}/{tester.tests_run}")
     return tester.tests_passed == tester.tests_run
 
-def test_pro_tier_user():
+async def test_pro_tier_user(client):
     """Test the pro tier user journey"""
     print("\n🔍 TESTING PRO TIER USER JOURNEY")
     
-    tester = ModulusDefenceAPITester()
+    tester = ModulusDefenceAPITester(client)
     timestamp = datetime.now().strftime('%H%M%S')
     test_email = f"pro_user_{timestamp}@example.com"
     test_password = "TestPass123!"
@@ -335,12 +343,12 @@ def test_pro_tier_user():
     test_full_name = "Pro Tier User"
     
     # Register a new user and upgrade to Pro
-    if not tester.test_register(test_email, test_password, test_company, test_full_name):
+    if not await tester.test_register(test_email, test_password, test_company, test_full_name):
         print("❌ Pro tier registration failed")
         return False
         
     # Upgrade to Pro tier
-    success, _ = tester.test_upgrade_subscription("pro")
+    success, _ = await tester.test_upgrade_subscription("pro")
     if not success:
         print("❌ Upgrade to Pro tier failed")
         return False
@@ -348,15 +356,20 @@ def test_pro_tier_user():
     print("✅ Successfully upgraded to Pro tier")
     
     # Verify user is on Pro tier
-    success, user_data = tester.test_get_me()
+    success, user_data = await tester.test_get_me()
     if success and user_data.get('tier') == 'pro':
         print("✅ User is correctly on Pro tier")
     else:
         print("❌ User tier verification failed")
         return False
         
+    # The unfiltered and filtered listings are independent reads, so fetch them together
+    (success, opportunities), (filtered_success, filtered_opps) = await asyncio.gather(
+        tester.test_get_opportunities(),
+        tester.test_get_opportunities(tech_area="Cybersecurity")
+    )
+    
     # Test getting opportunities (should show all opportunities without delay)
-    success, opportunities = tester.test_get_opportunities()
     if success:
         # Check that Pro opportunities are not delayed
         for opp in opportunities:
@@ -367,38 +380,37 @@ def test_pro_tier_user():
         print("✅ Pro opportunities are not delayed for Pro users")
     
     # Test advanced filters
-    success, filtered_opps = tester.test_get_opportunities(tech_area="Cybersecurity")
-    if success:
+    if filtered_success:
         print(f"✅ Advanced filtering works for Pro users: found {len(filtered_opps)} opportunities")
     
     # Test refreshing live data (should work for Pro tier)
-    success, _ = tester.test_refresh_live_data()
+    success, _ = await tester.test_refresh_live_data()
     if success:
         print("✅ Pro tier user can refresh live data")
     else:
         print("❌ Pro tier user couldn't refresh live data")
         
     # Get data sources
-    success, sources = tester.test_get_data_sources()
+    success, sources = await tester.test_get_data_sources()
     if success:
         print(f"✅ Pro tier user can access data sources: {len(sources.get('sources', []))} sources available")
         
     # Create a Pro tier opportunity
-    success, opp_data = tester.test_create_opportunity(tier_required="pro")
+    success, opp_data = await tester.test_create_opportunity(tier_required="pro")
     if success and 'id' in opp_data:
         print(f"✅ Pro tier user created a Pro opportunity: {opp_data.get('id')}")
         
         # Test getting the created opportunity
-        tester.test_get_specific_opportunity(opp_data.get('id'))
+        await tester.test_get_specific_opportunity(opp_data.get('id'))
         
     print(f"\n📊 Pro Tier Tests passed: {tester.tests_passed}/{tester.tests_run}")
     return tester.tests_passed == tester.tests_run
 
-def test_opportunity_links_and_values():
+async def test_opportunity_links_and_values(client):
     """Test opportunity links, values, and dates according to requirements"""
     print("\n🔍 TESTING OPPORTUNITY LINKS, VALUES, AND DATES")
     
-    tester = ModulusDefenceAPITester()
+    tester = ModulusDefenceAPITester(client)
     timestamp = datetime.now().strftime('%H%M%S')
     
     # Register as a free user
@@ -407,12 +419,12 @@ def test_opportunity_links_and_values():
     test_company = "Test Defence Ltd"
     test_full_name = "Test User"
     
-    if not tester.test_register(test_email, test_password, test_company, test_full_name):
+    if not await tester.test_register(test_email, test_password, test_company, test_full_name):
         print("❌ Registration failed")
         return False
     
     # Get opportunities as free user
-    success, free_opportunities = tester.test_get_opportunities()
+    success, free_opportunities = await tester.test_get_opportunities()
     if not success:
         print("❌ Failed to get opportunities as free user")
         return False
@@ -426,13 +438,13 @@ def test_opportunity_links_and_values():
         print("✅ Free tier user correctly sees 4 opportunities")
     
     # Upgrade to Pro tier
-    success, _ = tester.test_upgrade_subscription("pro")
+    success, _ = await tester.test_upgrade_subscription("pro")
     if not success:
         print("❌ Upgrade to Pro tier failed")
         return False
     
     # Get opportunities as pro user
-    success, pro_opportunities = tester.test_get_opportunities()
+    success, pro_opportunities = await tester.test_get_opportunities()
     if not success:
         print("❌ Failed to get opportunities as pro user")
         return False
@@ -575,11 +587,11 @@ def test_opportunity_links_and_values():
     
     return True
 
-def test_procurement_guide_access():
+async def test_procurement_guide_access(client):
     """Test access to the UK Defence Procurement Guide (formerly Procurement Act Hub)"""
     print("\n🔍 TESTING UK DEFENCE PROCUREMENT GUIDE ACCESS")
     
-    tester = ModulusDefenceAPITester()
+    tester = ModulusDefenceAPITester(client)
     timestamp = datetime.now().strftime('%H%M%S')
     
     # Test as free user first
@@ -588,14 +600,14 @@ def test_procurement_guide_access():
     test_company = "Guide Test Ltd"
     test_full_name = "Guide Test User"
     
-    if not tester.test_register(test_email_free, test_password, test_company, test_full_name):
+    if not await tester.test_register(test_email_free, test_password, test_company, test_full_name):
         print("❌ Registration failed for free user")
         return False
     
     print("✅ Successfully registered a free tier user for guide testing")
     
     # Verify user is on free tier
-    success, user_data = tester.test_get_me()
+    success, user_data = await tester.test_get_me()
     if success and user_data.get('tier') == 'free':
         print("✅ User is correctly on free tier")
     else:
@@ -608,12 +620,12 @@ def test_procurement_guide_access():
     # Now test as Pro user
     test_email_pro = f"pro_guide_user_{timestamp}@example.com"
     
-    if not tester.test_register(test_email_pro, test_password, test_company, test_full_name):
+    if not await tester.test_register(test_email_pro, test_password, test_company, test_full_name):
         print("❌ Registration failed for pro user")
         return False
     
     # Upgrade to Pro tier
-    success, _ = tester.test_upgrade_subscription("pro")
+    success, _ = await tester.test_upgrade_subscription("pro")
     if not success:
         print("❌ Upgrade to Pro tier failed")
         return False
@@ -621,7 +633,7 @@ def test_procurement_guide_access():
     print("✅ Successfully upgraded to Pro tier")
     
     # Verify user is on Pro tier
-    success, user_data = tester.test_get_me()
+    success, user_data = await tester.test_get_me()
     if success and user_data.get('tier') == 'pro':
         print("✅ User is correctly on Pro tier")
     else:
@@ -633,11 +645,11 @@ def test_procurement_guide_access():
     
     return True
 
-def test_actify_defence_aggregation():
+async def test_actify_defence_aggregation(client):
     """Test the Actify Defence Aggregation system"""
     print("\n🔍 TESTING ACTIFY DEFENCE AGGREGATION SYSTEM")
     
-    tester = ModulusDefenceAPITester()
+    tester = ModulusDefenceAPITester(client)
     timestamp = datetime.now().strftime('%H%M%S')
     
     # Register as a pro user
@@ -646,12 +658,12 @@ def test_actify_defence_aggregation():
     test_company = "Actify Test Ltd"
     test_full_name = "Actify Test User"
     
-    if not tester.test_register(test_email, test_password, test_company, test_full_name):
+    if not await tester.test_register(test_email, test_password, test_company, test_full_name):
         print("❌ Registration failed")
         return False
     
     # Upgrade to Pro tier
-    success, _ = tester.test_upgrade_subscription("pro")
+    success, _ = await tester.test_upgrade_subscription("pro")
     if not success:
         print("❌ Upgrade to Pro tier failed")
         return False
@@ -659,7 +671,7 @@ def test_actify_defence_aggregation():
     print("✅ Successfully upgraded to Pro tier")
     
     # Test data refresh (Actify Defence Aggregation)
-    success, refresh_data = tester.test_refresh_live_data()
+    success, refresh_data = await tester.test_refresh_live_data()
     if not success:
         print("❌ Actify Defence Aggregation failed")
         return False
@@ -699,7 +711,7 @@ def test_actify_defence_aggregation():
         print("❌ SME scoring was not applied")
     
     # Test aggregation statistics
-    success, stats_data = tester.test_aggregation_stats()
+    success, stats_data = await tester.test_aggregation_stats()
     if not success:
         print("❌ Failed to get aggregation statistics")
         return False
@@ -736,7 +748,7 @@ def test_actify_defence_aggregation():
         print("❌ No SME relevance breakdown in statistics")
     
     # Get opportunities after aggregation
-    success, opportunities = tester.test_get_opportunities()
+    success, opportunities = await tester.test_get_opportunities()
     if not success:
         print("❌ Failed to get opportunities after aggregation")
         return False
@@ -775,11 +787,11 @@ def test_actify_defence_aggregation():
     
     return True
 
-def test_opportunity_detail_and_links():
+async def test_opportunity_detail_and_links(client):
     """Test opportunity detail view and external link handling"""
     print("\n🔍 TESTING OPPORTUNITY DETAIL VIEW AND EXTERNAL LINKS")
     
-    tester = ModulusDefenceAPITester()
+    tester = ModulusDefenceAPITester(client)
     timestamp = datetime.now().strftime('%H%M%S')
     
     # Register as a pro user to ensure full access
@@ -788,12 +800,12 @@ def test_opportunity_detail_and_links():
     test_company = "Detail Test Ltd"
     test_full_name = "Detail Test User"
     
-    if not tester.test_register(test_email, test_password, test_company, test_full_name):
+    if not await tester.test_register(test_email, test_password, test_company, test_full_name):
         print("❌ Registration failed")
         return False
     
     # Upgrade to Pro tier
-    success, _ = tester.test_upgrade_subscription("pro")
+    success, _ = await tester.test_upgrade_subscription("pro")
     if not success:
         print("❌ Upgrade to Pro tier failed")
         return False
@@ -801,7 +813,7 @@ def test_opportunity_detail_and_links():
     print("✅ Successfully upgraded to Pro tier")
     
     # Get opportunities
-    success, opportunities = tester.test_get_opportunities()
+    success, opportunities = await tester.test_get_opportunities()
     if not success or not opportunities:
         print("❌ Failed to get opportunities")
         return False
@@ -818,7 +830,7 @@ def test_opportunity_detail_and_links():
         print(f"\n🔍 Testing detail view for opportunity: {opportunity.get('title', 'Unknown')}")
         
         # Get opportunity detail
-        success, detail = tester.test_get_specific_opportunity(opportunity_id)
+        success, detail = await tester.test_get_specific_opportunity(opportunity_id)
         if not success:
             print(f"❌ Failed to get detail for opportunity {opportunity_id}")
             continue
@@ -851,7 +863,7 @@ def test_opportunity_detail_and_links():
         if 'official_link' in detail and detail['official_link']:
             print(f"🔍 Testing link checking for: {detail['official_link']}")
             
-            success, link_check = tester.test_check_opportunity_link(opportunity_id)
+            success, link_check = await tester.test_check_opportunity_link(opportunity_id)
             if success:
                 print(f"✅ Link check successful: {link_check.get('status', 'unknown')}")
                 
@@ -876,7 +888,7 @@ def test_opportunity_detail_and_links():
     print("\n🔍 Testing tier-based access control for opportunity details")
     
     # Create a Pro tier opportunity
-    success, pro_opp = tester.test_create_opportunity(tier_required="pro")
+    success, pro_opp = await tester.test_create_opportunity(tier_required="pro")
     if not success or 'id' not in pro_opp:
         print("❌ Failed to create Pro tier opportunity")
         return False
@@ -885,7 +897,7 @@ def test_opportunity_detail_and_links():
     print(f"✅ Created Pro tier opportunity: {pro_opp_id}")
     
     # Verify Pro user can access it
-    success, _ = tester.test_get_specific_opportunity(pro_opp_id)
+    success, _ = await tester.test_get_specific_opportunity(pro_opp_id)
     if not success:
         print("❌ Pro user couldn't access Pro tier opportunity")
         return False
@@ -895,14 +907,14 @@ def test_opportunity_detail_and_links():
     # Register as a free user
     test_email_free = f"free_detail_{timestamp}@example.com"
     
-    if not tester.test_register(test_email_free, test_password, test_company, test_full_name):
+    if not await tester.test_register(test_email_free, test_password, test_company, test_full_name):
         print("❌ Registration failed for free user")
         return False
     
     print("✅ Successfully registered as free user")
     
     # Try to access Pro tier opportunity as free user
-    success, response = tester.test_get_specific_opportunity(pro_opp_id)
+    success, response = await tester.test_get_specific_opportunity(pro_opp_id)
     
     # This should either fail with 403 or return with is_delayed=true
     if not success:
@@ -914,11 +926,11 @@ def test_opportunity_detail_and_links():
     
     return True
 
-def test_funding_opportunities():
+async def test_funding_opportunities(client):
     """Test the funding opportunities system with continuous data updates"""
     print("\n🔍 TESTING FUNDING OPPORTUNITIES SYSTEM")
     
-    tester = ModulusDefenceAPITester()
+    tester = ModulusDefenceAPITester(client)
     timestamp = datetime.now().strftime('%H%M%S')
     
     # Register as a free user first
@@ -927,14 +939,14 @@ def test_funding_opportunities():
     test_company = "Funding Test Ltd"
     test_full_name = "Funding Test User"
     
-    if not tester.test_register(test_email_free, test_password, test_company, test_full_name):
+    if not await tester.test_register(test_email_free, test_password, test_company, test_full_name):
         print("❌ Registration failed for free user")
         return False
     
     print("✅ Successfully registered as free user")
     
     # Get funding opportunities as free user
-    success, free_funding = tester.test_get_funding_opportunities()
+    success, free_funding = await tester.test_get_funding_opportunities()
     if not success:
         print("❌ Failed to get funding opportunities as free user")
         return False
@@ -942,14 +954,14 @@ def test_funding_opportunities():
     print(f"✅ Free user can see {len(free_funding)} funding opportunities")
     
     # Try to refresh funding data as free user (should fail)
-    success, _ = tester.test_refresh_funding_opportunities()
+    success, _ = await tester.test_refresh_funding_opportunities()
     if not success:
         print("✅ Free user correctly denied access to refresh funding data")
     else:
         print("❌ Free user incorrectly allowed to refresh funding data")
     
     # Get funding stats as free user
-    success, free_stats = tester.test_get_funding_stats()
+    success, free_stats = await tester.test_get_funding_stats()
     if success:
         print(f"✅ Free user can access funding stats: {free_stats.get('total_funding_sources', 0)} sources")
     else:
@@ -963,8 +975,9 @@ def test_funding_opportunities():
         "Government-Backed Schemes"
     ]
     
-    for category in categories:
-        success, filtered = tester.test_get_funding_opportunities(category)
+    # Category filters are independent reads, so request them all at once
+    results = await asyncio.gather(*[tester.test_get_funding_opportunities(category) for category in categories])
+    for category, (success, filtered) in zip(categories, results):
         if success:
             print(f"✅ Free user can filter by category '{category}': {len(filtered)} results")
         else:
@@ -973,12 +986,12 @@ def test_funding_opportunities():
     # Now register as a pro user
     test_email_pro = f"pro_funding_{timestamp}@example.com"
     
-    if not tester.test_register(test_email_pro, test_password, test_company, test_full_name):
+    if not await tester.test_register(test_email_pro, test_password, test_company, test_full_name):
         print("❌ Registration failed for pro user")
         return False
     
     # Upgrade to Pro tier
-    success, _ = tester.test_upgrade_subscription("pro")
+    success, _ = await tester.test_upgrade_subscription("pro")
     if not success:
         print("❌ Upgrade to Pro tier failed")
         return False
@@ -986,7 +999,7 @@ def test_funding_opportunities():
     print("✅ Successfully upgraded to Pro tier")
     
     # Get funding opportunities as pro user
-    success, pro_funding = tester.test_get_funding_opportunities()
+    success, pro_funding = await tester.test_get_funding_opportunities()
     if not success:
         print("❌ Failed to get funding opportunities as pro user")
         return False
@@ -994,7 +1007,7 @@ def test_funding_opportunities():
     print(f"✅ Pro user can see {len(pro_funding)} funding opportunities")
     
     # Test refresh funding data as pro user
-    success, refresh_result = tester.test_refresh_funding_opportunities()
+    success, refresh_result = await tester.test_refresh_funding_opportunities()
     if success:
         print("✅ Pro user can refresh funding data")
         print(f"✅ Refresh result: {refresh_result.get('message', 'No message')}")
@@ -1010,7 +1023,7 @@ def test_funding_opportunities():
         print("❌ Pro user couldn't refresh funding data")
     
     # Get funding stats as pro user
-    success, pro_stats = tester.test_get_funding_stats()
+    success, pro_stats = await tester.test_get_funding_stats()
     if success:
         print(f"✅ Pro user can access funding stats: {pro_stats.get('total_funding_sources', 0)} sources")
         
@@ -1060,35 +1073,52 @@ def test_funding_opportunities():
     
     return True
 
+async def run_journeys():
+    # One pooled HTTP/2 client for every journey; no timeout, as the refresh endpoints run
+    # a full aggregation before answering
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=None,
+        headers={'Content-Type': 'application/json'},
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+    ) as client:
+        # Test opportunity links, values, and dates
+        opportunity_test_success = await test_opportunity_links_and_values(client)
+        
+        # Test both user tiers
+        free_tier_success = await test_free_tier_user(client)
+        pro_tier_success = await test_pro_tier_user(client)
+        
+        # Test opportunity detail view and external links
+        detail_links_success = await test_opportunity_detail_and_links(client)
+        
+        # Test procurement guide access
+        procurement_guide_success = await test_procurement_guide_access(client)
+        
+        # Test Actify Defence Aggregation system
+        actify_defence_success = await test_actify_defence_aggregation(client)
+        
+        # Test funding opportunities system
+        funding_opportunities_success = await test_funding_opportunities(client)
+    
+    return (opportunity_test_success, free_tier_success, pro_tier_success, detail_links_success,
+            procurement_guide_success, actify_defence_success, funding_opportunities_success)
+
 def main():
-    # Test opportunity links, values, and dates
-    opportunity_test_success = test_opportunity_links_and_values()
-    
-    # Test both user tiers
-    free_tier_success = test_free_tier_user()
-    pro_tier_success = test_pro_tier_user()
-    
-    # Test opportunity detail view and external links
-    detail_links_success = test_opportunity_detail_and_links()
-    
-    # Test procurement guide access
-    procurement_guide_success = test_procurement_guide_access()
-    
-    # Test Actify Defence Aggregation system
-    actify_defence_success = test_actify_defence_aggregation()
-    
-    # Test funding opportunities system
-    funding_opportunities_success = test_funding_opportunities()
-    
-    # Print overall results
-    print("\n📊 OVERALL TEST RESULTS:")
-    print(f"Opportunity Links & Values Tests: {'✅ PASSED' if opportunity_test_success else '❌ FAILED'}")
-    print(f"Free Tier Tests: {'✅ PASSED' if free_tier_success else '❌ FAILED'}")
-    print(f"Pro Tier Tests: {'✅ PASSED' if pro_tier_success else '❌ FAILED'}")
-    print(f"Opportunity Detail & Links Tests: {'✅ PASSED' if detail_links_success else '❌ FAILED'}")
-    print(f"UK Defence Procurement Guide Tests: {'✅ PASSED' if procurement_guide_success else '❌ FAILED'}")
-    print(f"Actify Defence Aggregation Tests: {'✅ PASSED' if actify_defence_success else '❌ FAILED'}")
-    print(f"Funding Opportunities Tests: {'✅ PASSED' if funding_opportunities_success else '❌ FAILED'}")
+    (opportunity_test_success, free_tier_success, pro_tier_success, detail_links_success,
+     procurement_guide_success, actify_defence_success, funding_opportunities_success) = asyncio.run(run_journeys())
+    
+    # Print overall results in a single write
+    sys.stdout.write('\n'.join([
+        "\n📊 OVERALL TEST RESULTS:",
+        f"Opportunity Links & Values Tests: {'✅ PASSED' if opportunity_test_success else '❌ FAILED'}",
+        f"Free Tier Tests: {'✅ PASSED' if free_tier_success else '❌ FAILED'}",
+        f"Pro Tier Tests: {'✅ PASSED' if pro_tier_success else '❌ FAILED'}",
+        f"Opportunity Detail & Links Tests: {'✅ PASSED' if detail_links_success else '❌ FAILED'}",
+        f"UK Defence Procurement Guide Tests: {'✅ PASSED' if procurement_guide_success else '❌ FAILED'}",
+        f"Actify Defence Aggregation Tests: {'✅ PASSED' if actify_defence_success else '❌ FAILED'}",
+        f"Funding Opportunities Tests: {'✅ PASSED' if funding_opportunities_success else '❌ FAILED'}"
+    ]) + '\n')
     
     return 0 if (opportunity_test_success and free_tier_success and pro_tier_success and detail_links_success and procurement_guide_success and actify_defence_success and funding_opportunities_success) else 1
 